@@ -1,4 +1,6 @@
 from .mcp_foundry_knowledge import SearchIndexDao, SearchBaseDao, SearchClientDao, SearchIndexerDao, SearchIndexSchema, SearchFieldSchema
+from .mcp_foundry_knowledge import AsyncSearchBaseDao, AsyncSearchIndexDao, AsyncSearchClientDao, AsyncSearchIndexerDao
+from .mcp_foundry_knowledge import SearchClientRegistry, get_search_client_registry
 from .mcp_foundry_knowledge import SuggesterSchema, CorsOptionsSchema, ScoringProfileSchema, FieldMappingModel, convert_pydantic_model_to_search_index
 from .mcp_foundry_knowledge import convert_to_field_mappings, OperationResult, SearchDocument
 
@@ -10,6 +12,12 @@ __all__ = (
     'SearchBaseDao',
     'SearchClientDao',
     'SearchIndexerDao',
+    'AsyncSearchBaseDao',
+    'AsyncSearchIndexDao',
+    'AsyncSearchClientDao',
+    'AsyncSearchIndexerDao',
+    'SearchClientRegistry',
+    'get_search_client_registry',
     'SearchIndexSchema',
     'SearchFieldSchema',
     'SuggesterSchema',
@@ -5,7 +5,7 @@ from argparse import ArgumentParser
 from typing import Literal
 from dotenv import load_dotenv
 
-from .mcp_server import mcp, auto_import_modules
+from .mcp_server import auto_import_modules, run_server
 
 
 # Configure logging
@@ -44,7 +44,7 @@ def main() -> None:
 
     # Run this on startup
     auto_import_modules("mcp_foundry", targets=["tools", "resources", "prompts"])
-    mcp.run(transport=specified_transport)
+    run_server(transport=specified_transport)
 
 
 if __name__ == "__main__":
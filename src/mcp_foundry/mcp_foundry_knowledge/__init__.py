@@ -3,6 +3,12 @@ from .data_access_objects import (
     SearchBaseDao,
     SearchClientDao,
     SearchIndexerDao,
+    AsyncSearchBaseDao,
+    AsyncSearchIndexDao,
+    AsyncSearchClientDao,
+    AsyncSearchIndexerDao,
+    SearchClientRegistry,
+    get_search_client_registry,
     SearchIndexSchema,
     SearchFieldSchema,
     SuggesterSchema,
@@ -18,6 +24,12 @@ __all__ = (
     'SearchBaseDao',
     'SearchClientDao',
     'SearchIndexerDao',
+    'AsyncSearchBaseDao',
+    'AsyncSearchIndexDao',
+    'AsyncSearchClientDao',
+    'AsyncSearchIndexerDao',
+    'SearchClientRegistry',
+    'get_search_client_registry',
     'SearchIndexSchema',
     'SearchFieldSchema',
     'SuggesterSchema',
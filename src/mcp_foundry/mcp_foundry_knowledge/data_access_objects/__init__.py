@@ -1,5 +1,7 @@
 
 from .dao import SearchIndexDao, SearchBaseDao, SearchClientDao, SearchIndexerDao
+from .aio import AsyncSearchBaseDao, AsyncSearchIndexDao, AsyncSearchClientDao, AsyncSearchIndexerDao
+from .registry import SearchClientRegistry, get_search_client_registry
 from .models import SearchIndexSchema, \
     convert_pydantic_model_to_search_index, SearchFieldSchema, SuggesterSchema, CorsOptionsSchema, ScoringProfileSchema, \
     FieldMappingModel, convert_to_field_mappings, OperationResult, SearchDocument
@@ -9,6 +11,12 @@ __all__ = (
     'SearchIndexDao',
     'SearchClientDao',
     'SearchIndexerDao',
+    'AsyncSearchBaseDao',
+    'AsyncSearchIndexDao',
+    'AsyncSearchClientDao',
+    'AsyncSearchIndexerDao',
+    'SearchClientRegistry',
+    'get_search_client_registry',
     'SearchIndexSchema',
     'SearchFieldSchema',
     'SuggesterSchema',
@@ -0,0 +1,576 @@
+import base64
+import hashlib
+import json
+import os
+from datetime import timedelta
+from typing import AsyncIterator, MutableMapping, Any, Optional, List
+
+from mcp.server.fastmcp.server import logger
+from azure.core.credentials import AzureKeyCredential
+from azure.identity.aio import DefaultAzureCredential
+from azure.search.documents.aio import SearchClient, AsyncSearchItemPaged
+from azure.search.documents.indexes.aio import SearchIndexClient, SearchIndexerClient
+from azure.search.documents.indexes._generated.models import FieldMapping, IndexingSchedule, IndexingParameters
+from azure.search.documents.indexes.models import SearchIndex, SearchIndexer, SearchIndexerDataSourceConnection
+
+from .dao import SearchBaseDao, SearchIndexerDao
+
+# Upper bound on the serialized results returned by one call to query_index_page
+QUERY_PAGE_MAX_BYTES = int(os.environ.get("AZURE_AI_SEARCH_QUERY_PAGE_MAX_BYTES", str(1024 * 1024)))
+# Documents requested per search call when scanning an index in key order
+SCAN_PAGE_SIZE = 1000
+
+
+def odata_string_literal(value: str) -> str:
+    """Quotes a string for use in an OData $filter expression."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+def document_size(document: dict) -> int:
+    """Approximate size of a document once serialized to JSON, in bytes."""
+    return len(json.dumps(document, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def _query_fingerprint(**query: Any) -> str:
+    canonical = json.dumps(query, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def _encode_cursor(fingerprint: str, page_token: Optional[str], offset: int) -> str:
+    payload = json.dumps({"q": fingerprint, "t": page_token, "o": offset}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str, fingerprint: str) -> tuple[Optional[str], int]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        page_token, offset, cursor_fingerprint = payload["t"], int(payload["o"]), payload["q"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid continuation token") from e
+    if cursor_fingerprint != fingerprint:
+        raise ValueError("The continuation token belongs to a different query")
+    return page_token, offset
+
+
+class AsyncSearchBaseDao(SearchBaseDao):
+    """
+    Base class for the asynchronous Azure AI Search data access objects.
+
+    Same configuration as SearchBaseDao, but service-principal authentication uses the
+    asynchronous DefaultAzureCredential expected by the `aio` clients.
+    """
+
+    def _fetch_credentials(self) -> AzureKeyCredential | DefaultAzureCredential:
+        """
+        Fetches the appropriate asynchronous credentials for Azure Search based on the configured authentication method.
+
+        Returns:
+            AzureKeyCredential | DefaultAzureCredential: A credential object for authenticating requests.
+
+        Raises:
+            Exception: If the authentication method is missing or invalid.
+        """
+        if self.authentication_method == 'service-principal':
+            self.check_environment_sanity()
+            return DefaultAzureCredential()
+        return super()._fetch_credentials()
+
+
+class AsyncSearchIndexDao(AsyncSearchBaseDao):
+    """
+    Asynchronous counterpart of SearchIndexDao, built on `azure.search.documents.indexes.aio`.
+    """
+
+    def __init__(self, client: Optional[SearchIndexClient] = None):
+        """
+        Initializes the AsyncSearchIndexDao with an asynchronous SearchIndexClient instance.
+        :param client: A shared client to use instead of creating one. The DAO does not close shared clients.
+        """
+        super().__init__()
+        self._owns_client = client is None
+        if client is None:
+            credentials = self._fetch_credentials()
+            client = SearchIndexClient(self.service_endpoint, credentials, api_version=self.api_version)
+        self.client = client
+
+    async def close(self):
+        """Shuts down the Data Access Object instance and associated resources
+
+        :rtype: None
+        """
+        if self._owns_client:
+            await self.client.close()
+
+    async def retrieve_index_names(self) -> list[str]:
+        """
+        Retrieves a list of all search index names from the Azure Search service.
+
+        Returns:
+            list[str]: A list of index names.
+        """
+        return [index_name async for index_name in self.client.list_index_names()]
+
+    async def retrieve_index_schemas(self) -> list[MutableMapping[str, Any]]:
+        """
+        Retrieves the full schema definition for each search index.
+
+        Returns:
+            list[MutableMapping[str, Any]]: A list of serialized index schema definitions.
+        """
+        return [index.serialize(keep_readonly=True) async for index in self.client.list_indexes()]
+
+    async def retrieve_index_etags(self) -> dict[str, Optional[str]]:
+        """
+        Retrieves the ETag of every search index, without their full definitions.
+
+        Returns:
+            dict[str, Optional[str]]: The ETag of each index, by index name.
+        """
+        return {index.name: index.e_tag async for index in self.client.list_indexes(select=["name"])}
+
+    async def retrieve_index_schema(self, index_name: str) -> MutableMapping[str, Any]:
+        """
+        Retrieves the full schema definition for a search index.
+
+        Returns:
+            MutableMapping[str, Any]: A serialized index schema definition.
+        """
+        index = await self.client.get_index(index_name)
+        return index.serialize(keep_readonly=True)
+
+    async def modify_index(self, index_name: str, updated_index_definition: SearchIndex) -> MutableMapping[str, Any]:
+        """
+        Updates an existing index in the Azure AI Search service.
+
+        Args:
+            index_name (str): The name of the index to be updated
+            updated_index_definition (SearchIndex): The full definition of the index.
+
+        Returns:
+            MutableMapping[str, Any]: The serialized response of the updated index.
+        """
+        logger.debug(f"Updating Index {index_name} with new definition", updated_index_definition)
+
+        updated_index_definition.name = index_name
+        operation_results = await self.client.create_or_update_index(updated_index_definition)
+        return operation_results.serialize(keep_readonly=True)
+
+    async def create_index(self, index_definition: SearchIndex) -> MutableMapping[str, Any]:
+        """
+        Creates a new index in the Azure AI Search service.
+
+        Args:
+            index_definition (SearchIndex): The full definition of the index to be created.
+
+        Returns:
+            MutableMapping[str, Any]: The serialized response of the created index.
+        """
+        logger.debug("Creating Index ", index_definition)
+        operation_results = await self.client.create_index(index_definition)
+        return operation_results.serialize(keep_readonly=True)
+
+    async def delete_index(self, index_name: str):
+        """
+        Deletes an existing index from the Azure AI Search service.
+
+        Args:
+            index_name (str): The name of the index to be deleted.
+
+        Returns:
+            None
+        """
+        logger.debug(f"Deleting Index {index_name}")
+        await self.client.delete_index(index_name)
+
+
+class AsyncSearchClientDao(AsyncSearchBaseDao):
+    """
+    Asynchronous counterpart of SearchClientDao, built on `azure.search.documents.aio`.
+    """
+
+    def __init__(self, index_name: str, client: Optional[SearchClient] = None):
+        """
+        Initializes the AsyncSearchClientDao with an asynchronous SearchClient instance.
+        :param index_name: The name of the index to connect to
+        :param client: A shared client to use instead of creating one. The DAO does not close shared clients.
+        """
+        super().__init__()
+        self.index_name = index_name
+        self._owns_client = client is None
+        if client is None:
+            credentials = self._fetch_credentials()
+            client = SearchClient(self.service_endpoint, index_name, credentials, api_version=self.api_version)
+        self.client = client
+
+    async def close(self):
+        """Shuts down the Data Access Object instance and associated resources
+
+        :rtype: None
+        """
+        if self._owns_client:
+            await self.client.close()
+
+    async def get_document_count(self) -> int:
+        """
+        Return the total number of documents in the index
+
+        Returns:
+           int: The total number of documents in the index.
+        """
+        search_results: AsyncSearchItemPaged[dict] = await self.client.search(search_text=None, include_total_count=True)
+        return await search_results.get_count()
+
+    async def add_document(self, document: dict) -> MutableMapping[str, Any]:
+        """
+        Uploads a single document to the Azure AI Search index.
+
+        Args:
+            document (dict): The document to be added to the index.
+
+        Returns:
+            MutableMapping[str, Any]: The serialized result of the add operation for the single document.
+        """
+        operation_results = await self.add_documents([document])
+        return operation_results[0]
+
+    async def add_documents(self, documents: list[dict]) -> list[MutableMapping[str, Any]]:
+        """
+        Uploads a batch of documents to the Azure AI Search index.
+
+        Args:
+            documents (list[dict]): A list of documents to upload.
+
+        Returns:
+            list[MutableMapping[str, Any]]: A list of serialized results for each document upload operation.
+        """
+        logger.debug(f"Adding documents to index {self.index_name}", documents)
+        operation_results = await self.client.upload_documents(documents)
+        return [operation_result.serialize(keep_readonly=True) for operation_result in operation_results]
+
+    async def delete_document(self, key_field_name: str, key_value: str) -> list[MutableMapping[str, Any]]:
+        """
+        Deletes a single document from the Azure AI Search index.
+
+        Args:
+            key_field_name (str): The name of the key field in the index
+            key_value (str): The value of the key field
+
+        Returns:
+            list[MutableMapping[str, Any]]: A list of serialized results for each document deletion operation.
+        """
+        return await self.delete_documents(key_field_name=key_field_name, document_keys=[key_value])
+
+    async def delete_documents(self, key_field_name: str, document_keys: list[str]) -> list[MutableMapping[str, Any]]:
+        """
+        Deletes a batch of documents from the Azure AI Search index.
+
+        Args:
+            key_field_name (str): The name of the key field in the index
+            document_keys (list[str]): A list of document keys to delete.
+
+        Returns:
+            list[MutableMapping[str, Any]]: A list of serialized results for each document deletion operation.
+        """
+        documents_to_delete = [{key_field_name: document_key} for document_key in document_keys]
+
+        logger.debug(f"Removing document from index {self.index_name}", documents_to_delete)
+        operation_results = await self.client.delete_documents(documents_to_delete)
+        return [operation_result.serialize(keep_readonly=True) for operation_result in operation_results]
+
+    async def query_index(self,
+                          search_text: Optional[str] = None,
+                          *,
+                          query_filter: Optional[str] = None,
+                          order_by: Optional[List[str]] = None,
+                          select: Optional[List[str]] = None,
+                          skip: Optional[int] = None,
+                          top: Optional[int] = None,
+                          include_total_count: Optional[bool] = None,
+                          ) -> list[dict]:
+        """Search the Azure search index for documents.
+
+        Takes the same parameters as :meth:`SearchClientDao.query_index`.
+
+        :rtype: list[dict]
+        """
+        search_results: AsyncSearchItemPaged[dict] = await self.client.search(
+            search_text=search_text,
+            include_total_count=include_total_count,
+            filter=query_filter,
+            order_by=order_by,
+            select=select,
+            skip=skip,
+            top=top
+        )
+        return [search_result_item async for search_result_item in search_results]
+
+
+    async def query_index_page(self,
+                               search_text: Optional[str] = None,
+                               *,
+                               query_filter: Optional[str] = None,
+                               order_by: Optional[List[str]] = None,
+                               select: Optional[List[str]] = None,
+                               skip: Optional[int] = None,
+                               top: Optional[int] = None,
+                               include_total_count: Optional[bool] = None,
+                               continuation_token: Optional[str] = None,
+                               max_bytes: int = QUERY_PAGE_MAX_BYTES,
+                               ) -> dict[str, Any]:
+        """Search the Azure search index for documents, one server page at a time.
+
+        Takes the same query parameters as :meth:`SearchClientDao.query_index`. Only one server page is
+        fetched per call, and its results are cut short once they exceed `max_bytes`, so broad queries use
+        bounded memory. Pass the returned continuation token, with the same query parameters, to get the
+        next results.
+
+        :param str continuation_token: The token returned by the previous call, or None for the first page.
+        :param int max_bytes: Approximate cap on the serialized size of the returned results. At least one
+            result is always returned, so every call makes progress.
+        :return: ``results``, ``continuation_token`` (None once the results are exhausted) and, when asked
+            for on the first page, ``total_count``.
+        :rtype: dict[str, Any]
+        :raises ValueError: If the continuation token is invalid or belongs to another query.
+        """
+        fingerprint = _query_fingerprint(
+            index_name=self.index_name, search_text=search_text, query_filter=query_filter, order_by=order_by,
+            select=select, skip=skip, top=top,
+        )
+        page_token, offset = None, 0
+        if continuation_token is not None:
+            page_token, offset = _decode_cursor(continuation_token, fingerprint)
+
+        search_results: AsyncSearchItemPaged[dict] = await self.client.search(
+            search_text=search_text,
+            include_total_count=include_total_count and continuation_token is None,
+            filter=query_filter,
+            order_by=order_by,
+            select=select,
+            skip=skip,
+            top=top
+        )
+        pages = search_results.by_page(continuation_token=page_token)
+
+        results: list[dict] = []
+        result_bytes = 0
+        position = 0
+        next_token: Optional[str] = None
+        try:
+            page = await pages.__anext__()
+        except StopAsyncIteration:
+            page = None
+
+        if page is not None:
+            async for search_result_item in page:
+                if position < offset:
+                    position += 1
+                    continue
+                size = document_size(search_result_item)
+                if results and result_bytes + size > max_bytes:
+                    # Resume within this server page on the next call
+                    next_token = _encode_cursor(fingerprint, page_token, position)
+                    break
+                results.append(search_result_item)
+                result_bytes += size
+                position += 1
+            else:
+                if pages.continuation_token is not None:
+                    next_token = _encode_cursor(fingerprint, pages.continuation_token, 0)
+
+        response: dict[str, Any] = {"results": results, "continuation_token": next_token}
+        if include_total_count and continuation_token is None:
+            # Read from the first page's response instead of issuing another request
+            response["total_count"] = await pages.get_count()
+        return response
+
+    async def scan_index(self,
+                         key_field_name: str,
+                         *,
+                         query_filter: Optional[str] = None,
+                         select: Optional[List[str]] = None,
+                         start_after: Optional[str] = None,
+                         end_at: Optional[str] = None,
+                         page_size: int = SCAN_PAGE_SIZE,
+                         ) -> AsyncIterator[list[dict]]:
+        """Walks the documents of the index in key order, one page at a time.
+
+        Each page is fetched with $orderby on the key and a $filter starting after the last key seen, as the
+        `skip` documentation of :meth:`SearchClientDao.query_index` recommends, so the scan is not limited to
+        100,000 documents and is not disturbed by documents deleted behind it. The key field must be sortable.
+
+        :param str key_field_name: The name of the key field of the index.
+        :param str query_filter: An OData $filter expression the documents must also match.
+        :param list[str] select: The fields to retrieve. The key field is always included.
+        :param str start_after: Only scan keys greater than this one.
+        :param str end_at: Only scan keys lower than or equal to this one.
+        :param int page_size: The number of documents requested per search call.
+        :return: An async iterator of pages of documents, in ascending key order.
+        :rtype: AsyncIterator[list[dict]]
+        """
+        if select and key_field_name not in select:
+            select = [key_field_name, *select]
+
+        last_key = start_after
+        while True:
+            clauses = [f"({query_filter})"] if query_filter else []
+            if last_key is not None:
+                clauses.append(f"{key_field_name} gt {odata_string_literal(last_key)}")
+            if end_at is not None:
+                clauses.append(f"{key_field_name} le {odata_string_literal(end_at)}")
+
+            search_results: AsyncSearchItemPaged[dict] = await self.client.search(
+                search_text=None,
+                filter=" and ".join(clauses) or None,
+                order_by=[f"{key_field_name} asc"],
+                select=select,
+                top=page_size,
+            )
+            page = [search_result_item async for search_result_item in search_results]
+            if not page:
+                return
+
+            yield page
+            if len(page) < page_size:
+                return
+            last_key = page[-1][key_field_name]
+
+
+class AsyncSearchIndexerDao(AsyncSearchBaseDao):
+    """
+    Asynchronous counterpart of SearchIndexerDao, built on `azure.search.documents.indexes.aio`.
+    """
+
+    def __init__(self, client: Optional[SearchIndexerClient] = None):
+        """
+        Initializes the AsyncSearchIndexerDao with an asynchronous SearchIndexerClient instance.
+        :param client: A shared client to use instead of creating one. The DAO does not close shared clients.
+        """
+        super().__init__()
+        self._owns_client = client is None
+        if client is None:
+            credentials = self._fetch_credentials()
+            client = SearchIndexerClient(self.service_endpoint, credentials, api_version=self.api_version)
+        self.client = client
+
+    async def close(self):
+        """Shuts down the Data Access Object instance and associated resources
+
+        :rtype: None
+        """
+        if self._owns_client:
+            await self.client.close()
+
+    async def list_indexers(self) -> list[str]:
+        """
+        Retrieves the names of all indexers registered in the Azure AI Search service.
+
+        Returns:
+            list[str]: A list of indexer names.
+        """
+        return list(await self.client.get_indexer_names())
+
+    async def get_indexer(self, name: str) -> MutableMapping[str, Any]:
+        """
+        Retrieves the full definition of a specific indexer.
+
+        Args:
+            name (str): The name of the indexer to retrieve.
+
+        Returns:
+            MutableMapping[str, Any]: A dictionary representing the serialized indexer definition.
+        """
+        indexer_details = await self.client.get_indexer(name)
+        return indexer_details.serialize(keep_readonly=True)
+
+    async def create_indexer(self, name: str,
+                             data_source_name: str,
+                             target_index_name: str,
+                             description: str,
+                             field_mappings: list[FieldMapping],
+                             output_field_mappings: list[FieldMapping],
+                             skill_set_name: str = None,
+                             ) -> MutableMapping[str, Any]:
+        """
+        Creates a new indexer in the Azure AI Search service.
+
+        Takes the same arguments as :meth:`SearchIndexerDao.create_indexer`.
+
+        Returns:
+            MutableMapping[str, Any]: A dictionary representing the created indexer.
+        """
+        schedule: IndexingSchedule = IndexingSchedule(interval=timedelta(minutes=5))
+
+        parameters = await self._prepare_indexer_parameters(data_source_name)
+
+        indexer_definition = SearchIndexer(
+            name=name,
+            data_source_name=data_source_name,
+            target_index_name=target_index_name,
+            description=description,
+            skillset_name=skill_set_name,
+            field_mappings=field_mappings,
+            output_field_mappings=output_field_mappings,
+            schedule=schedule,
+            parameters=parameters
+        )
+        indexer_result = await self.client.create_indexer(indexer_definition)
+        return indexer_result.serialize(keep_readonly=True)
+
+    async def _prepare_indexer_parameters(self, data_source_name) -> IndexingParameters | None:
+        data_source_detail: SearchIndexerDataSourceConnection = await self.client.get_data_source_connection(
+            name=data_source_name
+        )
+        return SearchIndexerDao.indexing_parameters_for(data_source_detail.type)
+
+    async def delete_indexer(self, name: str) -> None:
+        """
+        Deletes an indexer by name from the Azure AI Search service.
+
+        Args:
+            name (str): The name of the indexer to delete.
+        """
+        await self.client.delete_indexer(name)
+
+    async def list_data_sources(self) -> list[str]:
+        """
+        Lists the names of all data source connections configured in the AI Search service.
+
+        Returns:
+            list[str]: A list of data source connection names.
+        """
+        return list(await self.client.get_data_source_connection_names())
+
+    async def get_data_source(self, name: str) -> MutableMapping[str, Any]:
+        """
+        Retrieves the full definition of a specific data source connection.
+
+        Args:
+            name (str): The name of the data source connection to retrieve.
+
+        Returns:
+            MutableMapping[str, Any]: A dictionary representing the serialized data source definition.
+        """
+        data_source_detail: SearchIndexerDataSourceConnection = await self.client.get_data_source_connection(name=name)
+        return data_source_detail.serialize(keep_readonly=True)
+
+    async def list_skill_sets(self) -> list[str]:
+        """
+        Lists the names of all skillsets configured in the Azure AI Search service.
+
+        Returns:
+            list[str]: A list of skillset names.
+        """
+        return list(await self.client.get_skillset_names())
+
+    async def get_skill_set(self, skill_set_name: str) -> MutableMapping[str, Any]:
+        """
+        Retrieves the full definition of a specific skillset.
+
+        Args:
+            skill_set_name (str): The name of the skillset to retrieve.
+
+        Returns:
+            MutableMapping[str, Any]: A dictionary representing the serialized skillset definition.
+        """
+        skill_set_result = await self.client.get_skillset(skill_set_name)
+        return skill_set_result.serialize(keep_readonly=True)
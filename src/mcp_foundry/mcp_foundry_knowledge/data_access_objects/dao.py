@@ -93,20 +93,25 @@ class SearchIndexDao(SearchBaseDao):
     Inherits configuration and authentication from SearchBaseDao.
     """
 
-    def __init__(self):
+    def __init__(self, client: Optional[SearchIndexClient] = None):
         """
         Initializes the SearchIndexDao with a SearchIndexClient instance.
+        :param client: A shared client to use instead of creating one. The DAO does not close shared clients.
         """
         super().__init__()
-        credentials = self._fetch_credentials()
-        self.client = SearchIndexClient(self.service_endpoint, credentials, api_version=self.api_version)
+        self._owns_client = client is None
+        if client is None:
+            credentials = self._fetch_credentials()
+            client = SearchIndexClient(self.service_endpoint, credentials, api_version=self.api_version)
+        self.client = client
 
     def close(self):
         """Shuts down the Data Access Object instance and associated resources
 
         :rtype: None
         """
-        self.client.close()
+        if self._owns_client:
+            self.client.close()
 
     def retrieve_index_names(self) -> list[str]:
         """
@@ -196,22 +201,27 @@ class SearchIndexDao(SearchBaseDao):
 
 class SearchClientDao(SearchBaseDao):
 
-    def __init__(self, index_name: str):
+    def __init__(self, index_name: str, client: Optional[SearchClient] = None):
         """
         Initializes the SearchIndexDao with a SearchIndexClient instance.
         :param index_name: The name of the index to connect to
+        :param client: A shared client to use instead of creating one. The DAO does not close shared clients.
         """
         super().__init__()
-        credentials = self._fetch_credentials()
         self.index_name = index_name
-        self.client = SearchClient(self.service_endpoint, index_name, credentials, api_version=self.api_version)
+        self._owns_client = client is None
+        if client is None:
+            credentials = self._fetch_credentials()
+            client = SearchClient(self.service_endpoint, index_name, credentials, api_version=self.api_version)
+        self.client = client
 
     def close(self):
         """Shuts down the Data Access Object instance and associated resources
 
         :rtype: None
         """
-        self.client.close()
+        if self._owns_client:
+            self.client.close()
 
     def get_document_count(self) -> int:
         """
@@ -280,8 +290,6 @@ class SearchClientDao(SearchBaseDao):
 
         return results
 
-    # @TODO: expose this to the MCP clients only after thorough testing with a lot of models
-    # For now it is ok to delete just one document at a time
     def delete_documents(self, key_field_name: str, document_keys: list[str]) -> list[MutableMapping[str, Any]]:
         """
         Deletes a batch of documents from the Azure AI Search index.
@@ -372,21 +380,26 @@ class SearchIndexerDao(SearchBaseDao):
     as well as accessing data source connections and skillsets configured in the Azure AI Search service.
     """
 
-    def __init__(self):
+    def __init__(self, client: Optional[SearchIndexerClient] = None):
         """
         Initializes the SearchIndexerDao by creating a SearchIndexerClient using credentials
         and service configuration from the base class.
+        :param client: A shared client to use instead of creating one. The DAO does not close shared clients.
         """
         super().__init__()
-        credentials = self._fetch_credentials()
-        self.client = SearchIndexerClient(self.service_endpoint, credentials, api_version=self.api_version)
+        self._owns_client = client is None
+        if client is None:
+            credentials = self._fetch_credentials()
+            client = SearchIndexerClient(self.service_endpoint, credentials, api_version=self.api_version)
+        self.client = client
 
     def close(self):
         """Shuts down the Data Access Object instance and associated resources
 
         :rtype: None
         """
-        self.client.close()
+        if self._owns_client:
+            self.client.close()
 
     def list_indexers(self) -> list[str]:
         """
@@ -462,8 +475,19 @@ class SearchIndexerDao(SearchBaseDao):
     def _prepare_indexer_parameters(self, data_source_name) -> IndexingParameters | None:
 
         data_source_detail: SearchIndexerDataSourceConnection = self.client.get_data_source_connection(name=data_source_name)
-        data_source_type = data_source_detail.type
+        return self.indexing_parameters_for(data_source_detail.type)
+
+    @staticmethod
+    def indexing_parameters_for(data_source_type: str) -> IndexingParameters | None:
+        """
+        Returns the indexing parameters used for indexers reading from a data source of the given type.
 
+        Args:
+            data_source_type (str): The type of the data source connection.
+
+        Returns:
+            IndexingParameters | None: The parameters, or None when the defaults apply.
+        """
         # Possible values include: "azuresql", "cosmosdb", "azureblob", "azuretable", "mysql", "adlsgen2".
         if data_source_type == "azureblob":
             indexing_configuration = IndexingParametersConfiguration(data_to_extract='contentAndMetadata',
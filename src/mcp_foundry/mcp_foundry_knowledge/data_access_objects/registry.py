@@ -0,0 +1,147 @@
+import asyncio
+from collections import OrderedDict
+from typing import Optional
+
+import aiohttp
+from azure.core.pipeline.transport import AioHttpTransport
+from azure.search.documents.aio import SearchClient
+from azure.search.documents.indexes.aio import SearchIndexClient, SearchIndexerClient
+from mcp.server.fastmcp.server import logger
+
+from .aio import AsyncSearchBaseDao, AsyncSearchClientDao, AsyncSearchIndexDao, AsyncSearchIndexerDao
+
+
+class SearchClientRegistry(AsyncSearchBaseDao):
+    """
+    Process-wide registry of long-lived, asynchronous Azure AI Search clients.
+
+    Holds one SearchIndexClient, one SearchIndexerClient and an LRU of SearchClients keyed by index
+    name. Every client shares the same credential and the same aiohttp session, so connections to the
+    search service are pooled across tools and indexes, and Search I/O never blocks the event loop.
+    The environment is validated and the credential created once, when the first client is needed.
+
+    aiohttp sessions are bound to the event loop that created them: if the registry is used from
+    another loop, the clients are recreated there.
+    """
+
+    def __init__(self, max_search_clients: Optional[int] = None, max_connections: Optional[int] = None):
+        """
+        :param max_search_clients: Number of per-index SearchClients kept open. Defaults to
+            AZURE_AI_SEARCH_CLIENT_CACHE_SIZE, or 32.
+        :param max_connections: Size of the shared HTTP connection pool. Defaults to
+            AZURE_AI_SEARCH_MAX_CONNECTIONS, or 32.
+        """
+        super().__init__()
+        self.max_search_clients = max_search_clients or int(self._get_env_variable("AZURE_AI_SEARCH_CLIENT_CACHE_SIZE", "32"))
+        self.max_connections = max_connections or int(self._get_env_variable("AZURE_AI_SEARCH_MAX_CONNECTIONS", "32"))
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._credential = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._index_dao: Optional[AsyncSearchIndexDao] = None
+        self._indexer_dao: Optional[AsyncSearchIndexerDao] = None
+        self._client_daos: OrderedDict[str, AsyncSearchClientDao] = OrderedDict()
+        # Evicted clients are closed in the background; keep references until they are
+        self._closing: set[asyncio.Task] = set()
+
+    def _client_kwargs(self) -> dict:
+        """Credential and transport shared by every client; created on first use on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Clients and sessions of another (usually finished) loop can't be used or closed from this one
+            self._forget_clients()
+            self._loop = loop
+
+        if self._credential is None:
+            self._credential = self._fetch_credentials()
+        if self._session is None or self._session.closed:
+            # Same settings azure-core applies to the sessions it creates, plus a bounded connection pool
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                cookie_jar=aiohttp.DummyCookieJar(),
+                auto_decompress=False,
+                trust_env=True,
+            )
+        return {
+            "credential": self._credential,
+            "api_version": self.api_version,
+            # The session is owned by the registry: closing a client must not close it for the others
+            "transport": AioHttpTransport(session=self._session, session_owner=False),
+        }
+
+    def _forget_clients(self):
+        self._index_dao, self._indexer_dao = None, None
+        self._client_daos.clear()
+        self._session = None
+        self._credential = None
+
+    def index_dao(self) -> AsyncSearchIndexDao:
+        """Returns the shared AsyncSearchIndexDao."""
+        kwargs = self._client_kwargs()
+        if self._index_dao is None:
+            self._index_dao = AsyncSearchIndexDao(client=SearchIndexClient(self.service_endpoint, **kwargs))
+        return self._index_dao
+
+    def indexer_dao(self) -> AsyncSearchIndexerDao:
+        """Returns the shared AsyncSearchIndexerDao."""
+        kwargs = self._client_kwargs()
+        if self._indexer_dao is None:
+            self._indexer_dao = AsyncSearchIndexerDao(client=SearchIndexerClient(self.service_endpoint, **kwargs))
+        return self._indexer_dao
+
+    def client_dao(self, index_name: str) -> AsyncSearchClientDao:
+        """
+        Returns the shared AsyncSearchClientDao of an index.
+
+        The least recently used index client is closed once more than `max_search_clients` are open.
+        """
+        kwargs = self._client_kwargs()
+        dao = self._client_daos.get(index_name)
+        if dao is not None:
+            self._client_daos.move_to_end(index_name)
+            return dao
+
+        dao = AsyncSearchClientDao(index_name, client=SearchClient(self.service_endpoint, index_name, **kwargs))
+        self._client_daos[index_name] = dao
+        while len(self._client_daos) > self.max_search_clients:
+            _, evicted = self._client_daos.popitem(last=False)
+            task = asyncio.create_task(evicted.client.close())
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        return dao
+
+    async def close(self):
+        """Closes every client, the shared HTTP session and the credential."""
+        if self._loop is not None and self._loop is not asyncio.get_running_loop():
+            self._forget_clients()
+            return
+
+        clients = [dao.client for dao in (self._index_dao, self._indexer_dao) if dao is not None]
+        clients.extend(dao.client for dao in self._client_daos.values())
+        session, credential = self._session, self._credential
+        self._forget_clients()
+
+        for client in clients:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.error(f"Error closing search client: {e}")
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+        if session is not None:
+            await session.close()
+
+        close_credential = getattr(credential, "close", None)
+        if close_credential is not None:
+            await close_credential()
+
+
+_search_client_registry: Optional[SearchClientRegistry] = None
+
+
+def get_search_client_registry() -> SearchClientRegistry:
+    """Returns the process-wide registry of Azure AI Search clients."""
+    global _search_client_registry
+    if _search_client_registry is None:
+        _search_client_registry = SearchClientRegistry()
+    return _search_client_registry
@@ -0,0 +1,43 @@
+from typing import AsyncIterator, Optional
+
+from .data_access_objects import AsyncSearchClientDao
+from .ingestion import BulkDocumentIngestor, IngestionReport
+
+
+async def _matching_keys(dao: AsyncSearchClientDao, key_field_name: str, query_filter: str) -> AsyncIterator[dict]:
+    async for page in dao.scan_index(key_field_name, query_filter=query_filter, select=[key_field_name]):
+        for document in page:
+            yield {key_field_name: document[key_field_name]}
+
+
+async def bulk_delete_documents(dao: AsyncSearchClientDao, key_field_name: str,
+                                document_keys: Optional[list[str]] = None,
+                                query_filter: Optional[str] = None) -> IngestionReport:
+    """
+    Deletes documents by key, or every document matching an OData filter.
+
+    Filter matches are streamed with a key-ordered scan of the index, so the keys are never all held in
+    memory, and deleted in batches sent in parallel, with the same batching and retry rules as bulk uploads.
+
+    Args:
+        dao (AsyncSearchClientDao): The client of the index.
+        key_field_name (str): The name of the key field of the index. Must be sortable when deleting by filter.
+        document_keys (list[str]): The keys of the documents to delete.
+        query_filter (str): An OData $filter expression selecting the documents to delete.
+
+    Returns:
+        IngestionReport: Counts of deleted and failed documents, with the first failures by key.
+
+    Raises:
+        ValueError: If neither or both of document_keys and query_filter are given.
+    """
+    if (document_keys is None) == (query_filter is None):
+        raise ValueError("Exactly one of document_keys or query_filter must be given")
+
+    if document_keys is not None:
+        documents = ({key_field_name: document_key} for document_key in document_keys)
+    else:
+        documents = _matching_keys(dao, key_field_name, query_filter)
+
+    ingestor = BulkDocumentIngestor(dao, key_field_name, action="delete")
+    return await ingestor.ingest(documents)
@@ -0,0 +1,256 @@
+import asyncio
+import json
+import logging
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Literal, Optional
+
+from .data_access_objects import AsyncSearchClientDao
+
+logger = logging.getLogger("mcp_foundry_knowledge")
+
+# Characters of the keys considered when splitting the key space into ranges
+KEY_SPLIT_WIDTH = 8
+
+ExportFormat = Literal["jsonl", "parquet"]
+KeyRange = tuple[Optional[str], Optional[str]]
+
+
+def split_key_range(low: str, high: str, parts: int) -> list[KeyRange]:
+    """
+    Splits the keys between `low` and `high` into up to `parts` contiguous ranges.
+
+    Boundaries are interpolated between the two keys, character by character, so the ranges are only
+    balanced when keys are spread evenly. Together the ranges always cover every key exactly once.
+
+    Returns:
+        list[KeyRange]: `(start_after, end_at)` pairs; None means unbounded.
+    """
+    prefix_length = 0
+    while prefix_length < min(len(low), len(high)) and low[prefix_length] == high[prefix_length]:
+        prefix_length += 1
+    prefix = low[:prefix_length]
+    low_suffix = low[prefix_length:prefix_length + KEY_SPLIT_WIDTH]
+    high_suffix = high[prefix_length:prefix_length + KEY_SPLIT_WIDTH]
+
+    characters = [ord(character) for character in low_suffix + high_suffix]
+    if parts < 2 or not characters:
+        return [(None, None)]
+    first, base = min(characters), max(characters) - min(characters) + 1
+    width = max(len(low_suffix), len(high_suffix))
+
+    def to_number(suffix: str) -> int:
+        padded = [ord(character) - first for character in suffix] + [0] * (width - len(suffix))
+        number = 0
+        for digit in padded:
+            number = number * base + digit
+        return number
+
+    def to_key(number: int) -> str:
+        digits = []
+        for _ in range(width):
+            number, digit = divmod(number, base)
+            digits.append(chr(first + digit))
+        return prefix + "".join(reversed(digits))
+
+    low_number, high_number = to_number(low_suffix), to_number(high_suffix)
+    boundaries = sorted({
+        to_key(low_number + (high_number - low_number) * part // parts) for part in range(1, parts)
+    } - {high})
+
+    starts = [None, *boundaries]
+    ends = [*boundaries, None]
+    return list(zip(starts, ends))
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Exporting to Parquet requires pyarrow: pip install 'mcp-foundry[parquet]'") from e
+    return pyarrow, pyarrow.parquet
+
+
+def arrow_schema_for(index_schema: dict[str, Any], select: Optional[list[str]] = None):
+    """
+    Maps the retrievable fields of an index schema (or the selected ones) to an Arrow schema.
+
+    Complex fields, geography points and collections of complex fields are stored as JSON strings,
+    and dates as the ISO 8601 strings the service returns.
+    """
+    pyarrow, _ = _import_pyarrow()
+    primitive_types = {
+        "Edm.String": pyarrow.string(),
+        "Edm.Int32": pyarrow.int32(),
+        "Edm.Int64": pyarrow.int64(),
+        "Edm.Double": pyarrow.float64(),
+        "Edm.Single": pyarrow.float32(),
+        "Edm.Int16": pyarrow.int16(),
+        "Edm.SByte": pyarrow.int8(),
+        "Edm.Byte": pyarrow.uint8(),
+        "Edm.Boolean": pyarrow.bool_(),
+        "Edm.DateTimeOffset": pyarrow.string(),
+    }
+
+    def arrow_type(field_type: str):
+        if field_type.startswith("Collection(") and field_type[len("Collection("):-1] in primitive_types:
+            return pyarrow.list_(primitive_types[field_type[len("Collection("):-1]])
+        return primitive_types.get(field_type, pyarrow.string())
+
+    fields = {
+        search_field["name"]: search_field for search_field in index_schema.get("fields", [])
+        if search_field.get("retrievable", True) is not False
+    }
+    names = [name for name in select if name in fields] if select else list(fields)
+    return pyarrow.schema([(name, arrow_type(fields[name]["type"])) for name in names])
+
+
+class _JsonlWriter:
+    def __init__(self, path: Path):
+        self._file = path.open("w", encoding="utf-8")
+
+    def write(self, documents: list[dict]):
+        self._file.write("".join(json.dumps(document, ensure_ascii=False, default=str) + "\n" for document in documents))
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: Path, schema):
+        self._pyarrow, parquet = _import_pyarrow()
+        self._schema = schema
+        self._json_columns = [
+            column.name for column in schema
+            if self._pyarrow.types.is_string(column.type)
+        ]
+        self._writer = parquet.ParquetWriter(str(path), schema)
+
+    def write(self, documents: list[dict]):
+        rows = []
+        for document in documents:
+            row = dict(document)
+            for column in self._json_columns:
+                value = row.get(column)
+                if value is not None and not isinstance(value, str):
+                    row[column] = json.dumps(value, ensure_ascii=False, default=str)
+            rows.append(row)
+        self._writer.write_table(self._pyarrow.Table.from_pylist(rows, schema=self._schema))
+
+    def close(self):
+        self._writer.close()
+
+
+class IndexExporter:
+    """
+    Streams the documents of an index to a local JSONL or Parquet file.
+
+    The index is walked in key order with range filters (see `AsyncSearchClientDao.scan_index`), so
+    exports are not limited to the first 100,000 documents. Only one page per range is held in memory.
+    With `parallel_ranges` above 1 the key space is split into that many ranges, scanned concurrently
+    into part files that are then concatenated in key order.
+    """
+
+    def __init__(self, dao: AsyncSearchClientDao, key_field_name: str, index_schema: dict[str, Any]):
+        self.dao = dao
+        self.key_field_name = key_field_name
+        self.index_schema = index_schema
+
+    async def export(self, file_path: str, export_format: ExportFormat = "jsonl", query_filter: Optional[str] = None,
+                     select: Optional[list[str]] = None, parallel_ranges: int = 1) -> dict:
+        """
+        Exports the documents of the index, or the ones matching `query_filter`, to `file_path`.
+
+        The file is written under temporary names and renamed once complete, so a failed export never
+        leaves a truncated file behind.
+
+        Returns:
+            dict: The path of the file, the number of documents exported per range and in total, and the duration.
+
+        Raises:
+            ImportError: If Parquet is requested and pyarrow is not installed.
+        """
+        started_at = time.monotonic()
+        path = Path(file_path).expanduser().resolve()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if select and self.key_field_name not in select:
+            select = [self.key_field_name, *select]
+        schema = arrow_schema_for(self.index_schema, select) if export_format == "parquet" else None
+
+        ranges = await self._ranges(query_filter, parallel_ranges)
+        parts = [path.with_name(f".{path.name}.part{number}") for number in range(len(ranges))]
+        temporary_path = path.with_name(f".{path.name}.tmp")
+        try:
+            counts = await asyncio.gather(*(
+                self._export_range(part, export_format, schema, query_filter, select, key_range)
+                for part, key_range in zip(parts, ranges)
+            ))
+            if len(parts) == 1:
+                os.replace(parts[0], path)
+            else:
+                await asyncio.to_thread(self._concatenate, parts, temporary_path, export_format, schema)
+                os.replace(temporary_path, path)
+        finally:
+            for leftover in (*parts, temporary_path):
+                leftover.unlink(missing_ok=True)
+
+        logger.info(f"Exported {sum(counts)} documents of {self.dao.index_name} to {path}")
+        return {
+            "file_path": str(path),
+            "format": export_format,
+            "documents": sum(counts),
+            "ranges": [
+                {"start_after": start_after, "end_at": end_at, "documents": count}
+                for (start_after, end_at), count in zip(ranges, counts)
+            ],
+            "elapsed_seconds": round(time.monotonic() - started_at, 1),
+        }
+
+    async def _ranges(self, query_filter: Optional[str], parallel_ranges: int) -> list[KeyRange]:
+        if parallel_ranges < 2:
+            return [(None, None)]
+
+        lowest, highest = await asyncio.gather(*(
+            self.dao.query_index(query_filter=query_filter, order_by=[f"{self.key_field_name} {direction}"],
+                                 select=[self.key_field_name], top=1)
+            for direction in ("asc", "desc")
+        ))
+        if not lowest or not highest:
+            return [(None, None)]
+        return split_key_range(lowest[0][self.key_field_name], highest[0][self.key_field_name], parallel_ranges)
+
+    async def _export_range(self, part: Path, export_format: ExportFormat, schema, query_filter: Optional[str],
+                            select: Optional[list[str]], key_range: KeyRange) -> int:
+        writer = _ParquetWriter(part, schema) if export_format == "parquet" else _JsonlWriter(part)
+        start_after, end_at = key_range
+        count = 0
+        try:
+            async for page in self.dao.scan_index(self.key_field_name, query_filter=query_filter, select=select,
+                                                  start_after=start_after, end_at=end_at):
+                documents = [
+                    {name: value for name, value in document.items() if not name.startswith("@search.")}
+                    for document in page
+                ]
+                await asyncio.to_thread(writer.write, documents)
+                count += len(documents)
+        finally:
+            writer.close()
+        return count
+
+    @staticmethod
+    def _concatenate(parts: list[Path], destination: Path, export_format: ExportFormat, schema):
+        if export_format == "parquet":
+            _, parquet = _import_pyarrow()
+            with parquet.ParquetWriter(str(destination), schema) as writer:
+                for part in parts:
+                    for batch in parquet.ParquetFile(str(part)).iter_batches():
+                        writer.write_batch(batch)
+            return
+
+        with destination.open("wb") as output:
+            for part in parts:
+                with part.open("rb") as source:
+                    shutil.copyfileobj(source, output)
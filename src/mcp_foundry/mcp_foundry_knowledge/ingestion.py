@@ -0,0 +1,244 @@
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, Literal, Optional, Union
+
+from azure.core.exceptions import HttpResponseError, ServiceRequestError, ServiceResponseError
+
+from .data_access_objects import AsyncSearchClientDao
+from .data_access_objects.aio import document_size
+
+logger = logging.getLogger("mcp_foundry_knowledge")
+
+# Azure AI Search accepts at most 1000 documents and 16 MB per indexing request
+INGEST_BATCH_SIZE = int(os.environ.get("AZURE_AI_SEARCH_INGEST_BATCH_SIZE", "1000"))
+INGEST_BATCH_BYTES = int(os.environ.get("AZURE_AI_SEARCH_INGEST_BATCH_BYTES", str(8 * 1024 * 1024)))
+INGEST_CONCURRENCY = int(os.environ.get("AZURE_AI_SEARCH_INGEST_CONCURRENCY", "4"))
+INGEST_MAX_RETRIES = 3
+INGEST_RETRY_BASE_DELAY_SECONDS = 1.0
+# Per-document and per-request statuses the service documents as transient
+RETRYABLE_STATUS_CODES = frozenset({409, 422, 429, 503})
+# Failures listed in a report; the rest are only counted
+MAX_REPORTED_FAILURES = 100
+
+
+Documents = Union[Iterable[dict], AsyncIterable[dict]]
+
+
+async def _aiter(documents: Documents) -> AsyncIterator[dict]:
+    if isinstance(documents, AsyncIterable):
+        async for document in documents:
+            yield document
+    else:
+        for document in documents:
+            yield document
+
+
+async def iter_batches(documents: Documents, max_documents: int, max_bytes: int) -> AsyncIterator[list[dict]]:
+    """
+    Groups documents into batches of at most `max_documents` documents and about `max_bytes` of payload.
+
+    A document larger than `max_bytes` is sent in a batch of its own, for the service to accept or reject.
+    """
+    batch: list[dict] = []
+    batch_bytes = 0
+    async for document in _aiter(documents):
+        size = document_size(document)
+        if batch and (len(batch) >= max_documents or batch_bytes + size > max_bytes):
+            yield batch
+            batch, batch_bytes = [], 0
+        batch.append(document)
+        batch_bytes += size
+    if batch:
+        yield batch
+
+
+def read_documents(file_path: str, encoding: str = "utf-8") -> Iterator[dict]:
+    """
+    Reads documents from a local file: one JSON object per line (JSONL), or a single JSON array.
+
+    JSONL files are streamed line by line, so they are never loaded into memory at once.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the content is not JSON documents.
+    """
+    path = Path(file_path)
+    if not path.is_file():
+        raise FileNotFoundError(f"No such file: '{file_path}'")
+
+    if path.suffix.lower() == ".json":
+        documents = json.loads(path.read_text(encoding=encoding))
+        if not isinstance(documents, list):
+            raise ValueError(f"'{file_path}' must contain a JSON array of documents")
+        yield from documents
+        return
+
+    with path.open(encoding=encoding) as lines:
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_number} of '{file_path}': {e}") from e
+
+
+@dataclass
+class IngestionReport:
+    """Outcome of a bulk upload."""
+    index_name: str
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    retried: int = 0
+    batches: int = 0
+    failures: list[dict] = field(default_factory=list)
+    started_at: float = field(default_factory=time.monotonic)
+
+    def add_failure(self, key: Any, status_code: Optional[int], error_message: str):
+        self.failed += 1
+        if len(self.failures) < MAX_REPORTED_FAILURES:
+            self.failures.append({"key": key, "status_code": status_code, "error_message": error_message})
+
+    def to_dict(self) -> dict:
+        return {
+            "index_name": self.index_name,
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "retried": self.retried,
+            "batches": self.batches,
+            "failures": self.failures,
+            "failures_truncated": self.failed > len(self.failures),
+            "elapsed_seconds": round(time.monotonic() - self.started_at, 1),
+        }
+
+
+class BulkDocumentIngestor:
+    """
+    Uploads (or deletes) a stream of documents to an index in batches, several batches at a time.
+
+    Documents are buffered into batches bounded by count and payload size, and up to `concurrency`
+    batches are in flight at once. Reading the next batch waits for a free slot, so memory stays bounded
+    however many documents are streamed in. When the service answers a batch with a partial success
+    (207), only the documents that failed with a transient status are sent again, with exponential
+    backoff; the others are reported as failures.
+
+    With `action="delete"` the documents only need their key, and are deleted instead of uploaded.
+    """
+
+    def __init__(self, dao: AsyncSearchClientDao, key_field_name: str,
+                 batch_size: int = INGEST_BATCH_SIZE, batch_bytes: int = INGEST_BATCH_BYTES,
+                 concurrency: int = INGEST_CONCURRENCY, max_retries: int = INGEST_MAX_RETRIES,
+                 retry_base_delay: float = INGEST_RETRY_BASE_DELAY_SECONDS,
+                 action: Literal["upload", "delete"] = "upload"):
+        self.dao = dao
+        self.key_field_name = key_field_name
+        self.action = action
+        self.batch_size = batch_size
+        self.batch_bytes = batch_bytes
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+
+    async def ingest(self, documents: Documents) -> IngestionReport:
+        """
+        Uploads every document and waits for all batches to settle.
+
+        Documents can be streamed from a regular or an asynchronous iterable. If reading them raises, the
+        batches still in flight are cancelled before the error propagates.
+
+        Returns:
+            IngestionReport: Counts of uploaded, failed and retried documents, with the first failures.
+        """
+        report = IngestionReport(index_name=self.dao.index_name)
+        slots = asyncio.Semaphore(self.concurrency)
+        in_flight: set[asyncio.Task] = set()
+
+        try:
+            async for batch in iter_batches(self._with_keys(documents, report), self.batch_size, self.batch_bytes):
+                await slots.acquire()
+                report.batches += 1
+                task = asyncio.create_task(self._flush(batch, report))
+                task.add_done_callback(lambda _: slots.release())
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+
+            if in_flight:
+                await asyncio.gather(*in_flight)
+        finally:
+            # Only left when reading the documents failed or the ingestion was cancelled:
+            # stop the batches still running rather than leave them behind
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+        verb = "Deleted" if self.action == "delete" else "Ingested"
+        logger.info(f"{verb} {report.succeeded}/{report.total} documents of {report.index_name} "
+                    f"in {report.batches} batches ({report.failed} failed, {report.retried} retried)")
+        return report
+
+    async def _with_keys(self, documents: Documents, report: IngestionReport) -> AsyncIterator[dict]:
+        async for document in _aiter(documents):
+            report.total += 1
+            if not isinstance(document, dict) or document.get(self.key_field_name) in (None, ""):
+                report.add_failure(None, None, f"Document has no value for key field '{self.key_field_name}'")
+                continue
+            yield document
+
+    async def _flush(self, batch: list[dict], report: IngestionReport):
+        pending = batch
+        errors: dict[Any, tuple[Optional[int], str]] = {}
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                report.retried += len(pending)
+                await asyncio.sleep(self.retry_base_delay * 2 ** (attempt - 1))
+
+            try:
+                results = await self._send(pending)
+            except (HttpResponseError, ServiceRequestError, ServiceResponseError) as e:
+                status_code = getattr(e, "status_code", None)
+                errors = {document[self.key_field_name]: (status_code, str(e)) for document in pending}
+                # Connection errors have no status code and are always worth another attempt
+                if status_code is None or status_code in RETRYABLE_STATUS_CODES:
+                    continue
+                break
+            except Exception as e:
+                logger.error(f"Could not {self.action} a batch of {len(pending)} documents of {report.index_name}: {e}")
+                errors = {document[self.key_field_name]: (None, str(e)) for document in pending}
+                break
+
+            documents_by_key = {document[self.key_field_name]: document for document in pending}
+            retry, errors = [], {}
+            for result in results:
+                key = result.get("key")
+                if result.get("status"):
+                    report.succeeded += 1
+                    continue
+                status_code = result.get("statusCode")
+                error = (status_code, result.get("errorMessage") or "")
+                if status_code in RETRYABLE_STATUS_CODES and key in documents_by_key:
+                    retry.append(documents_by_key[key])
+                    errors[key] = error
+                else:
+                    report.add_failure(key, *error)
+
+            pending = retry
+            if not pending:
+                return
+
+        for key, error in errors.items():
+            report.add_failure(key, *error)
+
+    async def _send(self, documents: list[dict]) -> list[dict]:
+        if self.action == "delete":
+            keys = [document[self.key_field_name] for document in documents]
+            return await self.dao.delete_documents(key_field_name=self.key_field_name, document_keys=keys)
+        return await self.dao.add_documents(documents)
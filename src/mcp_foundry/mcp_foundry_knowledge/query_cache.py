@@ -0,0 +1,145 @@
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from .data_access_objects.aio import document_size
+
+QUERY_CACHE_TTL_SECONDS = float(os.environ.get("AZURE_AI_SEARCH_QUERY_CACHE_TTL_SECONDS", "60"))
+QUERY_CACHE_MAX_ENTRIES = int(os.environ.get("AZURE_AI_SEARCH_QUERY_CACHE_SIZE", "1024"))
+QUERY_CACHE_MAX_BYTES = int(os.environ.get("AZURE_AI_SEARCH_QUERY_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+QueryKey = tuple[str, str]
+
+
+def normalize_query(search_text: Optional[str] = None, select: Optional[list[str]] = None, **query: Any) -> dict[str, Any]:
+    """
+    Puts query parameters in a canonical form, so that equivalent queries are sent and cached identically.
+
+    The search text is stripped and "*" is the same as no text, and the selected fields are sorted.
+    The other parameters are returned as they are.
+    """
+    search_text = (search_text or "").strip()
+    return {
+        **query,
+        "search_text": search_text if search_text and search_text != "*" else None,
+        "select": sorted(select) if select else None,
+    }
+
+
+class QueryResultCache:
+    """
+    LRU cache of query results, keyed by index name and normalized query parameters.
+
+    Entries expire after `ttl_seconds`, and the least recently used ones are evicted once the cache holds
+    more than `max_entries` entries or more than `max_bytes` of serialized results. Writes made through
+    this server invalidate every entry of the index they touch. Each index has a generation number,
+    bumped on invalidation, so a query that was in flight during a write can't store its possibly stale
+    result afterwards.
+    """
+
+    def __init__(self, ttl_seconds: float = QUERY_CACHE_TTL_SECONDS, max_entries: int = QUERY_CACHE_MAX_ENTRIES,
+                 max_bytes: int = QUERY_CACHE_MAX_BYTES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[QueryKey, tuple[float, int, Any]] = OrderedDict()
+        self._keys_by_index: dict[str, set[QueryKey]] = {}
+        self._generations: dict[str, int] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(index_name: str, **query: Any) -> QueryKey:
+        """
+        Builds the cache key of a query from its parameters, normalized with `normalize_query`.
+
+        Unset parameters are ignored.
+        """
+        query = {name: value for name, value in query.items() if value is not None}
+        return index_name, json.dumps(query, sort_keys=True, separators=(",", ":"), default=str)
+
+    def generation(self, index_name: str) -> int:
+        """Returns the current generation of an index, to pass to `put` once its query completes."""
+        return self._generations.get(index_name, 0)
+
+    def get(self, key: QueryKey) -> Optional[Any]:
+        """Returns the cached result of a query, or None when it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] < time.monotonic():
+            self._remove(key)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+
+    def put(self, key: QueryKey, value: Any, generation: int):
+        """
+        Caches the result of a query, unless its index was written to since `generation` was read
+        or the result alone is larger than the memory cap.
+        """
+        index_name = key[0]
+        if generation != self.generation(index_name):
+            return
+
+        size = document_size(value)
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, size, value)
+        self._keys_by_index.setdefault(index_name, set()).add(key)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, index_name: str):
+        """Drops every cached result of an index, after a write to its documents or its definition."""
+        self._generations[index_name] = self.generation(index_name) + 1
+        self.invalidations += 1
+        for key in list(self._keys_by_index.get(index_name, ())):
+            self._remove(key)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, key: QueryKey):
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        keys = self._keys_by_index.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_index[key[0]]
+
+
+_query_result_cache: Optional[QueryResultCache] = None
+
+
+def get_query_result_cache() -> QueryResultCache:
+    """Returns the process-wide cache of query results."""
+    global _query_result_cache
+    if _query_result_cache is None:
+        _query_result_cache = QueryResultCache()
+    return _query_result_cache
@@ -0,0 +1,147 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Callable, Optional
+
+from azure.core.exceptions import ResourceNotFoundError
+
+from .data_access_objects import AsyncSearchIndexDao, get_search_client_registry
+
+logger = logging.getLogger("mcp_foundry_knowledge")
+
+SCHEMA_CACHE_TTL_SECONDS = float(os.environ.get("AZURE_AI_SEARCH_SCHEMA_CACHE_TTL_SECONDS", "300"))
+SCHEMA_REFRESH_CONCURRENCY = int(os.environ.get("AZURE_AI_SEARCH_SCHEMA_REFRESH_CONCURRENCY", "8"))
+
+ETAG_FIELD = "@odata.etag"
+
+
+class SchemaCache:
+    """
+    Local copy of the index schemas of the search service, keyed by index name and ETag.
+
+    Lookups are answered from memory. Once a schema (or the listing) is older than `ttl_seconds` it is
+    still returned, and refreshed in the background. A listing refresh reads only the name and ETag of
+    every index, then fetches the full definitions of the new and changed indexes concurrently (at most
+    `concurrency` at a time), so unchanged schemas are neither downloaded nor serialized again. Schemas
+    written through this server are stored as soon as the write returns.
+    """
+
+    def __init__(self, ttl_seconds: float = SCHEMA_CACHE_TTL_SECONDS, concurrency: int = SCHEMA_REFRESH_CONCURRENCY,
+                 index_dao: Optional[Callable[[], AsyncSearchIndexDao]] = None):
+        self.ttl_seconds = ttl_seconds
+        self.concurrency = concurrency
+        self._index_dao = index_dao or (lambda: get_search_client_registry().index_dao())
+        self._schemas: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._listed_at: Optional[float] = None
+        # Bumped by every write, so a refresh that started before it can't store an older schema
+        self._versions: dict[str, int] = {}
+        self._pending: dict[Optional[str], asyncio.Task] = {}
+
+    async def get_schema(self, index_name: str) -> dict[str, Any]:
+        """
+        Returns the schema of an index, fetching it only when it isn't cached yet.
+
+        Raises:
+            ResourceNotFoundError: If the index does not exist.
+        """
+        cached = self._schemas.get(index_name)
+        if cached is None:
+            return await self._refresh(index_name)
+
+        if time.monotonic() - cached[0] > self.ttl_seconds:
+            self._refresh_in_background(index_name)
+        return cached[1]
+
+    async def list_schemas(self) -> list[dict[str, Any]]:
+        """Returns the schema of every index, sorted by name, listing them only when they were never listed."""
+        if self._listed_at is None:
+            await self._refresh(None)
+        elif time.monotonic() - self._listed_at > self.ttl_seconds:
+            self._refresh_in_background(None)
+        return [self._schemas[name][1] for name in sorted(self._schemas)]
+
+    def put(self, schema: dict[str, Any]):
+        """Stores the schema returned by a write (create_index, modify_index)."""
+        self._versions[schema["name"]] = self._versions.get(schema["name"], 0) + 1
+        self._schemas[schema["name"]] = (time.monotonic(), schema)
+
+    def remove(self, index_name: str):
+        """Forgets a deleted index."""
+        self._versions[index_name] = self._versions.get(index_name, 0) + 1
+        self._schemas.pop(index_name, None)
+
+    def _refresh_in_background(self, index_name: Optional[str]):
+        self._task(index_name).add_done_callback(self._log_refresh_error)
+
+    @staticmethod
+    def _log_refresh_error(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Could not refresh index schemas: {task.exception()}")
+
+    async def _refresh(self, index_name: Optional[str]) -> Any:
+        """Refreshes one schema, or the whole listing when `index_name` is None."""
+        return await asyncio.shield(self._task(index_name))
+
+    def _task(self, index_name: Optional[str]) -> asyncio.Task:
+        # Concurrent refreshes of the same schema (or of the listing) share one task
+        task = self._pending.get(index_name)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            coroutine = self._fetch_schema(index_name) if index_name is not None else self._fetch_listing()
+            task = self._pending[index_name] = asyncio.create_task(coroutine)
+        return task
+
+    async def _fetch_schema(self, index_name: str) -> dict[str, Any]:
+        version = self._versions.get(index_name, 0)
+        try:
+            schema = await self._index_dao().retrieve_index_schema(index_name)
+        except ResourceNotFoundError:
+            if self._versions.get(index_name, 0) == version:
+                self._schemas.pop(index_name, None)
+            raise
+        if self._versions.get(index_name, 0) == version:
+            self._schemas[index_name] = (time.monotonic(), schema)
+        return schema
+
+    async def _fetch_listing(self):
+        listed_at = time.monotonic()
+        versions = dict(self._versions)
+        etags = await self._index_dao().retrieve_index_etags()
+
+        changed = [
+            name for name, etag in etags.items()
+            if name not in self._schemas or etag is None or self._schemas[name][1].get(ETAG_FIELD) != etag
+        ]
+        for name in etags.keys() & self._schemas.keys():
+            if name not in changed:
+                self._schemas[name] = (listed_at, self._schemas[name][1])
+        for name in self._schemas.keys() - etags.keys():
+            # Keep indexes created through this server while the listing was in flight
+            if self._versions.get(name, 0) == versions.get(name, 0):
+                del self._schemas[name]
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(name: str):
+            async with semaphore:
+                await self._refresh(name)
+
+        results = await asyncio.gather(*(fetch(name) for name in changed), return_exceptions=True)
+        for result in results:
+            # Indexes deleted since the listing are already forgotten
+            if isinstance(result, Exception) and not isinstance(result, ResourceNotFoundError):
+                raise result
+
+        self._listed_at = listed_at
+        logger.info(f"Refreshed the schemas of {len(etags)} indexes ({len(changed)} new or changed)")
+
+
+_schema_cache: Optional[SchemaCache] = None
+
+
+def get_schema_cache() -> SchemaCache:
+    """Returns the process-wide cache of index schemas."""
+    global _schema_cache
+    if _schema_cache is None:
+        _schema_cache = SchemaCache()
+    return _schema_cache
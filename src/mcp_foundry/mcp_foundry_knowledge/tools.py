@@ -1,17 +1,22 @@
 
 from pathlib import Path
-from typing import Optional, List, cast
+from typing import Literal, Optional, List, cast
 import logging
 import sys
 
 import httpx
 from azure.search.documents.indexes._generated.models import FieldMapping
-from mcp_foundry.mcp_server import mcp
+from mcp_foundry.mcp_server import mcp, on_shutdown
 
-from .data_access_objects import SearchIndexDao, SearchClientDao, SearchIndexerDao, SearchIndexSchema, \
+from .data_access_objects import SearchIndexSchema, \
     convert_pydantic_model_to_search_index, FieldMappingModel, convert_to_field_mappings, \
     OperationResult, \
-    SearchDocument
+    SearchDocument, get_search_client_registry
+from .deletion import bulk_delete_documents
+from .export import IndexExporter
+from .ingestion import BulkDocumentIngestor, read_documents
+from .query_cache import get_query_result_cache, normalize_query
+from .schema_cache import get_schema_cache
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +26,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger("mcp_foundry_knowledge")
 
+
+@on_shutdown
+async def close_search_clients() -> None:
+    """Closes the pooled Azure AI Search clients when the server stops."""
+    await get_search_client_registry().close()
+
 @mcp.tool(description="Reads the content of a local file and returns it as a string")
 def fk_fetch_local_file_contents(file_path: str, encoding: str = "utf-8") -> str:
     """
@@ -71,8 +82,8 @@ async def list_index_names() -> list[str]:
     Returns:
         list[str]: A list containing the names of all available search indexes.
     """
-    dao = SearchIndexDao()
-    return dao.retrieve_index_names()
+    dao = get_search_client_registry().index_dao()
+    return await dao.retrieve_index_names()
 
 @mcp.tool(description="Retrieves the schemas for all indexes ")
 async def list_index_schemas() -> list[OperationResult]:
@@ -82,8 +93,7 @@ async def list_index_schemas() -> list[OperationResult]:
     Returns:
         list[OperationResult]: A list of dictionaries, each representing the schema of an index.
     """
-    dao = SearchIndexDao()
-    return cast(list[OperationResult], dao.retrieve_index_schemas())
+    return cast(list[OperationResult], await get_schema_cache().list_schemas())
 
 @mcp.tool(description="Retrieves the schema for a specific index")
 async def retrieve_index_schema(index_name: str) -> OperationResult:
@@ -96,8 +106,7 @@ async def retrieve_index_schema(index_name: str) -> OperationResult:
     Returns:
         OperationResult: A dictionary representing the schema of the specified index.
     """
-    dao = SearchIndexDao()
-    return cast(OperationResult, dao.retrieve_index_schema(index_name))
+    return cast(OperationResult, await get_schema_cache().get_schema(index_name))
 
 @mcp.tool(description="Creates an AI Search index")
 async def create_index(index_definition: SearchIndexSchema) -> OperationResult:
@@ -110,9 +119,15 @@ async def create_index(index_definition: SearchIndexSchema) -> OperationResult:
     Returns:
         OperationResult: The serialized response of the created index.
     """
-    dao = SearchIndexDao()
+    dao = get_search_client_registry().index_dao()
     compatible_index_definition = convert_pydantic_model_to_search_index(index_definition)
-    return cast(OperationResult, dao.create_index(compatible_index_definition))
+    try:
+        result = await dao.create_index(compatible_index_definition)
+    finally:
+        # Results cached for an index of the same name, deleted outside this server, are stale
+        get_query_result_cache().invalidate(index_definition.name)
+    get_schema_cache().put(result)
+    return cast(OperationResult, result)
 
 @mcp.tool(description="Updates an AI Search index with a new index definition")
 async def modify_index(index_name: str, updated_index_definition: SearchIndexSchema) -> OperationResult:
@@ -126,9 +141,14 @@ async def modify_index(index_name: str, updated_index_definition: SearchIndexSch
     Returns:
         OperationResult: The serialized response of the modified index.
     """
-    dao = SearchIndexDao()
+    dao = get_search_client_registry().index_dao()
     compatible_index_definition = convert_pydantic_model_to_search_index(updated_index_definition)
-    return cast(OperationResult, dao.modify_index(index_name, compatible_index_definition))
+    try:
+        result = await dao.modify_index(index_name, compatible_index_definition)
+    finally:
+        get_query_result_cache().invalidate(index_name)
+    get_schema_cache().put(result)
+    return cast(OperationResult, result)
 
 @mcp.tool(description="Deletes the specified index")
 async def delete_index(index_name: str) -> str:
@@ -141,12 +161,16 @@ async def delete_index(index_name: str) -> str:
     Returns:
         str: The result of the operation
     """
-    dao = SearchIndexDao()
-    dao.delete_index(index_name)
+    dao = get_search_client_registry().index_dao()
+    try:
+        await dao.delete_index(index_name)
+    finally:
+        get_query_result_cache().invalidate(index_name)
+        get_schema_cache().remove(index_name)
     return "Successful"
 
 @mcp.tool(description="Return the total number of documents in the index")
-def get_document_count(index_name: str) -> int:
+async def get_document_count(index_name: str) -> int:
     """
     Returns the total number of documents in the index
 
@@ -156,12 +180,12 @@ def get_document_count(index_name: str) -> int:
     Returns:
         int: The total number of documents in the index
     """
-    search_client_dao = SearchClientDao(index_name)
-    result = search_client_dao.get_document_count()
+    search_client_dao = get_search_client_registry().client_dao(index_name)
+    result = await search_client_dao.get_document_count()
     return result
 
 @mcp.tool(description="Adds a document to the index")
-def add_document(index_name: str, document: SearchDocument) -> OperationResult:
+async def add_document(index_name: str, document: SearchDocument) -> OperationResult:
     """
     Add a document to the specified Azure AI Search index
 
@@ -172,10 +196,62 @@ def add_document(index_name: str, document: SearchDocument) -> OperationResult:
     Returns:
         OperationResult: The serialized result of the add operation for the single document.
     """
-    search_client_dao = SearchClientDao(index_name)
-    result = search_client_dao.add_document(document.model_dump())
+    search_client_dao = get_search_client_registry().client_dao(index_name)
+    try:
+        result = await search_client_dao.add_document(document.model_dump())
+    finally:
+        get_query_result_cache().invalidate(index_name)
     return cast(OperationResult, result)
 
+async def _key_field_name(index_name: str) -> str:
+    """Returns the name of the key field of an index, from its schema."""
+    schema = await get_schema_cache().get_schema(index_name)
+    for search_field in schema.get("fields", []):
+        if search_field.get("key"):
+            return search_field["name"]
+    raise ValueError(f"Index '{index_name}' has no key field")
+
+@mcp.tool(description="Uploads many documents to the index in parallel batches, from a list or a local JSON/JSONL file")
+async def add_documents_in_bulk(
+        index_name: str,
+        documents: Optional[list[dict]] = None,
+        file_path: Optional[str] = None,
+        key_field_name: Optional[str] = None,
+        validate_documents: bool = False,
+) -> OperationResult:
+    """
+    Uploads many documents to the specified Azure AI Search index.
+
+    Documents are sent in batches bounded by document count and payload size, several batches at a time.
+    Documents that fail with a transient error are retried on their own; the others are reported.
+
+    Args:
+        index_name (str): the name of the index we are adding the documents to
+        documents (list[dict]): The documents to upload. Either this or file_path must be given.
+        file_path (str): A local file with one JSON document per line (JSONL), or a JSON array (.json).
+            JSONL files are streamed, so they can be larger than memory.
+        key_field_name (str): The name of the key field of the index. Read from the index schema when omitted.
+        validate_documents (bool): Validate every document as a SearchDocument before uploading it.
+            Off by default: documents are sent as they are, and the service validates them.
+
+    Returns:
+        OperationResult: Counts of uploaded, failed and retried documents, with the first failures.
+    """
+    if (documents is None) == (file_path is None):
+        raise ValueError("Exactly one of documents or file_path must be given")
+
+    source = documents if documents is not None else read_documents(file_path)
+    if validate_documents:
+        source = (SearchDocument.model_validate(document).model_dump() for document in source)
+
+    key_field_name = key_field_name or await _key_field_name(index_name)
+    ingestor = BulkDocumentIngestor(get_search_client_registry().client_dao(index_name), key_field_name)
+    try:
+        report = await ingestor.ingest(source)
+    finally:
+        get_query_result_cache().invalidate(index_name)
+    return cast(OperationResult, report.to_dict())
+
 @mcp.tool(description="Removes a document from the index")
 async def delete_document(index_name: str, key_field_name: str, key_value: str) -> OperationResult:
     """
@@ -189,8 +265,46 @@ async def delete_document(index_name: str, key_field_name: str, key_value: str)
     Returns:
         OperationResult: A list of serialized results for each document deletion operation.
     """
-    search_client_dao = SearchClientDao(index_name)
-    return cast(OperationResult, search_client_dao.delete_document(key_field_name, key_value))
+    search_client_dao = get_search_client_registry().client_dao(index_name)
+    try:
+        return cast(OperationResult, await search_client_dao.delete_document(key_field_name, key_value))
+    finally:
+        get_query_result_cache().invalidate(index_name)
+
+@mcp.tool(description="Removes many documents from the index, by key or by OData filter, in parallel batches")
+async def delete_documents_in_bulk(
+        index_name: str,
+        document_keys: Optional[list[str]] = None,
+        query_filter: Optional[str] = None,
+        key_field_name: Optional[str] = None,
+) -> OperationResult:
+    """
+    Removes many documents from the index.
+
+    Args:
+        index_name (str): the name of the index from which to delete the documents
+        document_keys (list[str]): The keys of the documents to delete. Either this or query_filter must be given.
+        query_filter (str): An OData $filter expression; every matching document is deleted.
+            Requires the key field to be sortable, since matches are found with a key-ordered scan.
+        key_field_name (str): The name of the key field of the index. Read from the index schema when omitted.
+
+    Returns:
+        OperationResult: Counts of deleted and failed documents, with the first failures by key.
+    """
+    schema = await get_schema_cache().get_schema(index_name)
+    key_field = next((field for field in schema.get("fields", []) if field.get("key")), None)
+    key_field_name = key_field_name or (key_field or {}).get("name")
+    if not key_field_name:
+        raise ValueError(f"Index '{index_name}' has no key field")
+    if query_filter is not None and key_field is not None and not key_field.get("sortable"):
+        raise ValueError(f"Deleting by filter needs a sortable key field, and '{key_field_name}' is not sortable")
+
+    search_client_dao = get_search_client_registry().client_dao(index_name)
+    try:
+        report = await bulk_delete_documents(search_client_dao, key_field_name, document_keys, query_filter)
+    finally:
+        get_query_result_cache().invalidate(index_name)
+    return cast(OperationResult, report.to_dict())
 
 @mcp.tool(description="Search a specific index for documents in that index")
 async def query_index(
@@ -203,9 +317,13 @@ async def query_index(
         skip: Optional[int] = None,
         top: Optional[int] = None,
         include_total_count: Optional[bool] = None,
-) -> list[dict]:
+        continuation_token: Optional[str] = None,
+) -> dict:
     """Searches the Azure search index for documents matching the query criteria
 
+        Results are returned one server page at a time, capped in size. When more results are available the
+        response includes a continuation_token: call again with the same parameters and that token to get them.
+
         :param str index_name: The name of the index to query. This parameter is required
         :param str search_text: A full-text search query expression; Use "*" or omit this parameter to
             match all documents.
@@ -227,23 +345,94 @@ async def query_index(
             another Search request for the next page of results.
         :param bool include_total_count: A value that specifies whether to fetch the total count of
             results. Default is false. Setting this value to true may have a performance impact. Note that
-            the count returned is an approximation.
-        :rtype: list[dict]
+            the count returned is an approximation. Only returned with the first page.
+        :param str continuation_token: The continuation_token of the previous response, to get the next results.
+        :return: ``results``, ``continuation_token`` (null when there are no more results) and, if requested,
+            ``total_count``.
+        :rtype: dict
         """
-    search_client_dao = SearchClientDao(index_name)
-
-    search_results: list[dict] = search_client_dao.query_index(
-        search_text=search_text,
-        include_total_count=include_total_count,
+    # Normalized once, so the cache key and the continuation tokens agree on which queries are the same
+    query = normalize_query(
+        search_text,
         query_filter=query_filter,
         order_by=order_by,
         select=select,
         skip=skip,
-        top=top
+        top=top,
+    )
+    query_cache = get_query_result_cache()
+    cache_key = query_cache.make_key(
+        index_name,
+        **query,
+        include_total_count=include_total_count or None,
+        continuation_token=continuation_token,
+    )
+    cached = query_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    generation = query_cache.generation(index_name)
+    search_client_dao = get_search_client_registry().client_dao(index_name)
+
+    search_results: dict = await search_client_dao.query_index_page(
+        **query,
+        include_total_count=include_total_count,
+        continuation_token=continuation_token,
     )
 
+    query_cache.put(cache_key, search_results, generation)
     return search_results
 
+@mcp.tool(description="Exports the documents of an index to a local JSONL or Parquet file")
+async def export_index(
+        index_name: str,
+        file_path: str,
+        export_format: Literal["jsonl", "parquet"] = "jsonl",
+        query_filter: Optional[str] = None,
+        select: Optional[List[str]] = None,
+        parallel_ranges: int = 1,
+) -> OperationResult:
+    """
+    Exports the documents of an index to a local file, for backups and offline analysis.
+
+    The index is walked in key order with range filters, so there is no limit on the number of documents,
+    and documents are streamed to the file without being held in memory. The key field must be sortable.
+
+    Args:
+        index_name (str): the name of the index to export
+        file_path (str): The local file to write. It is replaced if it exists.
+        export_format (str): "jsonl" for one JSON document per line, or "parquet" (requires pyarrow).
+        query_filter (str): An OData $filter expression; only matching documents are exported.
+        select (list[str]): The fields to export. All retrievable fields by default. The key is always exported.
+        parallel_ranges (int): Split the key space into this many ranges, fetched concurrently (1 to 16).
+
+    Returns:
+        OperationResult: The path of the file, the number of documents exported per range and in total.
+    """
+    if not 1 <= parallel_ranges <= 16:
+        raise ValueError("parallel_ranges must be between 1 and 16")
+
+    schema = await get_schema_cache().get_schema(index_name)
+    key_field = next((field for field in schema.get("fields", []) if field.get("key")), None)
+    if key_field is None:
+        raise ValueError(f"Index '{index_name}' has no key field")
+    if not key_field.get("sortable"):
+        raise ValueError(f"Exporting needs a sortable key field, and '{key_field['name']}' is not sortable")
+
+    exporter = IndexExporter(get_search_client_registry().client_dao(index_name), key_field["name"], schema)
+    result = await exporter.export(file_path, export_format, query_filter, select, parallel_ranges)
+    return cast(OperationResult, result)
+
+@mcp.tool(description="Returns the hit/miss statistics of the query result cache")
+async def get_query_cache_stats() -> dict:
+    """
+    Returns the statistics of the cache of query_index results.
+
+    Returns:
+        dict: The number of cached entries and their size in bytes, hits, misses, hit ratio, evictions and invalidations.
+    """
+    return get_query_result_cache().stats()
+
 @mcp.tool(
     description="Retrieves the list of all the names of the indexers")
 async def list_indexers() -> list[str]:
@@ -253,8 +442,8 @@ async def list_indexers() -> list[str]:
     Returns:
         list[str]: A list of indexer names.
     """
-    search_indexer_dao = SearchIndexerDao()
-    return search_indexer_dao.list_indexers()
+    search_indexer_dao = get_search_client_registry().indexer_dao()
+    return await search_indexer_dao.list_indexers()
 
 @mcp.tool(description="Retrieves the details of a specific indexer by name.")
 async def get_indexer(name: str) -> OperationResult:
@@ -267,8 +456,8 @@ async def get_indexer(name: str) -> OperationResult:
     Returns:
         OperationResult: A dictionary containing the indexer details.
     """
-    search_indexer_dao = SearchIndexerDao()
-    return cast(OperationResult, search_indexer_dao.get_indexer(name))
+    search_indexer_dao = get_search_client_registry().indexer_dao()
+    return cast(OperationResult, await search_indexer_dao.get_indexer(name))
 
 @mcp.tool(description="Creates a new indexer")
 async def create_indexer(
@@ -295,12 +484,12 @@ async def create_indexer(
     Returns:
         OperationResult: A dictionary representing the created indexer.
     """
-    search_indexer_dao = SearchIndexerDao()
+    search_indexer_dao = get_search_client_registry().indexer_dao()
 
     compat_field_mappings = convert_to_field_mappings(field_mappings)
     compat_output_field_mappings = convert_to_field_mappings(output_field_mappings)
 
-    result = search_indexer_dao.create_indexer(
+    result = await search_indexer_dao.create_indexer(
         name=name,
         data_source_name=data_source_name,
         target_index_name=target_index_name,
@@ -323,8 +512,8 @@ async def delete_indexer(name: str) -> str:
     Returns:
         None
     """
-    search_indexer_dao = SearchIndexerDao()
-    search_indexer_dao.delete_indexer(name)
+    search_indexer_dao = get_search_client_registry().indexer_dao()
+    await search_indexer_dao.delete_indexer(name)
     return "Successful"
 
 @mcp.tool(description="Retrieves the list of all data source names")
@@ -335,8 +524,8 @@ async def list_data_sources() -> list[str]:
     Returns:
         list[str]: A list of data source names.
     """
-    search_indexer_dao = SearchIndexerDao()
-    return search_indexer_dao.list_data_sources()
+    search_indexer_dao = get_search_client_registry().indexer_dao()
+    return await search_indexer_dao.list_data_sources()
 
 @mcp.tool(description="Retrieves the details of a specific data source by name")
 async def get_data_source(name: str) -> OperationResult:
@@ -349,8 +538,8 @@ async def get_data_source(name: str) -> OperationResult:
     Returns:
         OperationResult: A dictionary containing the data source details.
     """
-    search_indexer_dao = SearchIndexerDao()
-    return cast(OperationResult, search_indexer_dao.get_data_source(name))
+    search_indexer_dao = get_search_client_registry().indexer_dao()
+    return cast(OperationResult, await search_indexer_dao.get_data_source(name))
 
 @mcp.tool(description="Retrieves the list of the names of all skill sets")
 async def list_skill_sets() -> list[str]:
@@ -360,8 +549,8 @@ async def list_skill_sets() -> list[str]:
     Returns:
         list[str]: A list of skill set names.
     """
-    search_indexer_dao = SearchIndexerDao()
-    return search_indexer_dao.list_skill_sets()
+    search_indexer_dao = get_search_client_registry().indexer_dao()
+    return await search_indexer_dao.list_skill_sets()
 
 @mcp.tool(description="Retrieves the details of a specific skill set by name")
 async def get_skill_set(skill_set_name: str) -> OperationResult:
@@ -374,5 +563,5 @@ async def get_skill_set(skill_set_name: str) -> OperationResult:
     Returns:
         OperationResult: A dictionary containing the skill set details.
     """
-    search_indexer_dao = SearchIndexerDao()
-    return cast(OperationResult, search_indexer_dao.get_skill_set(skill_set_name))
+    search_indexer_dao = get_search_client_registry().indexer_dao()
+    return cast(OperationResult, await search_indexer_dao.get_skill_set(skill_set_name))
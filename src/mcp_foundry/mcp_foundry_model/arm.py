@@ -0,0 +1,212 @@
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from azure.core.exceptions import HttpResponseError
+from azure.mgmt.resource import ResourceManagementClient
+from azure.mgmt.resource.resources.models import Deployment, DeploymentMode, DeploymentProperties
+
+from .management import get_management_client_pool
+
+logger = logging.getLogger("mcp_foundry")
+
+COGNITIVE_SERVICES_API_VERSION = "2025-04-01-preview"
+ARM_TEMPLATE_SCHEMA = "https://schema.management.azure.com/schemas/2019-04-01/deploymentTemplate.json#"
+
+
+@dataclass(frozen=True)
+class ArmTemplate:
+    """An ARM template in canonical form, identified by the SHA-256 of its content."""
+    content: dict
+    content_hash: str
+
+
+_compiled_templates: dict[str, ArmTemplate] = {}
+
+
+def compile_template(template: dict) -> ArmTemplate:
+    """
+    Canonicalizes an ARM template and returns the cached copy with the same content, if any.
+
+    Templates are parameterized, so the handful of distinct templates is compiled once per process
+    and every deployment of the same template shares one object.
+    """
+    canonical = json.dumps(template, sort_keys=True, separators=(",", ":"))
+    content_hash = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+    compiled = _compiled_templates.get(content_hash)
+    if compiled is None:
+        compiled = _compiled_templates[content_hash] = ArmTemplate(json.loads(canonical), content_hash)
+    return compiled
+
+
+def _template(parameters: dict, resources: list[dict]) -> dict:
+    return {
+        "$schema": ARM_TEMPLATE_SCHEMA,
+        "contentVersion": "1.0.0.0",
+        "parameters": parameters,
+        "resources": resources,
+    }
+
+
+def ai_services_account_resource() -> dict:
+    """Resource of an AI Services account that supports project management, named by the `ai_services_name` parameter."""
+    return {
+        "type": "Microsoft.CognitiveServices/accounts",
+        "apiVersion": COGNITIVE_SERVICES_API_VERSION,
+        "name": "[parameters('ai_services_name')]",
+        "location": "[parameters('location')]",
+        "identity": {"type": "SystemAssigned"},
+        "kind": "AIServices",
+        "sku": {"name": "S0"},
+        "properties": {
+            # Networking
+            "publicNetworkAccess": "Enabled",
+            # Specifies whether this resource support project management as child resources, used as containers
+            # for access management, data isolation, and cost in AI Foundry.
+            "allowProjectManagement": True,
+            # Defines developer API endpoint subdomain
+            "customSubDomainName": "[parameters('ai_services_name')]",
+            # Auth
+            "disableLocalAuth": False,
+        },
+    }
+
+
+def foundry_project_resource() -> dict:
+    """Resource of a Foundry project under the account named by the `ai_services_name` parameter."""
+    return {
+        "type": "Microsoft.CognitiveServices/accounts/projects",
+        "apiVersion": COGNITIVE_SERVICES_API_VERSION,
+        "name": "[format('{0}/{1}', parameters('ai_services_name'), parameters('project_name'))]",
+        "location": "[parameters('location')]",
+        "identity": {"type": "SystemAssigned"},
+        "properties": {},
+    }
+
+
+@lru_cache(maxsize=None)
+def ai_services_account_template() -> ArmTemplate:
+    """Template creating an AI Services account. Parameters: `ai_services_name`, `location`."""
+    return compile_template(_template(
+        {"ai_services_name": {"type": "string"}, "location": {"type": "string"}},
+        [ai_services_account_resource()],
+    ))
+
+
+@lru_cache(maxsize=None)
+def foundry_project_template() -> ArmTemplate:
+    """Template creating a Foundry project in an existing account. Parameters: `ai_services_name`, `project_name`, `location`."""
+    return compile_template(_template(
+        {
+            "ai_services_name": {"type": "string"},
+            "project_name": {"type": "string"},
+            "location": {"type": "string"},
+        },
+        [foundry_project_resource()],
+    ))
+
+
+def model_deployments_resource() -> dict:
+    """
+    Copy loop creating every model deployment of the `model_deployments` array parameter on the account.
+
+    Cognitive Services rejects concurrent deployment operations on one account, so the loop runs
+    serially; it still runs in parallel with the other resources that only depend on the account.
+    """
+    deployment = "parameters('model_deployments')[copyIndex()]"
+    return {
+        "type": "Microsoft.CognitiveServices/accounts/deployments",
+        "apiVersion": COGNITIVE_SERVICES_API_VERSION,
+        "name": f"[format('{{0}}/{{1}}', parameters('ai_services_name'), {deployment}.deployment_name)]",
+        "copy": {
+            "name": "modelDeployments",
+            "count": "[length(parameters('model_deployments'))]",
+            "mode": "serial",
+            "batchSize": 1,
+        },
+        "sku": {"name": f"[{deployment}.sku_name]", "capacity": f"[{deployment}.sku_capacity]"},
+        "properties": {
+            "model": {
+                "format": f"[{deployment}.model_format]",
+                "name": f"[{deployment}.model_name]",
+                "version": f"[{deployment}.model_version]",
+            },
+        },
+    }
+
+
+@lru_cache(maxsize=None)
+def foundry_stack_template(with_project: bool = True) -> ArmTemplate:
+    """
+    Template creating an account, optionally a project and any number of model deployments in one deployment.
+
+    Parameters: `ai_services_name`, `location`, `project_name` and `model_deployments` (array of
+    `ModelDeploymentSpec` dicts). The project and the model deployments only depend on the account,
+    so ARM creates them side by side once the account exists. Without `with_project` the project
+    resource is left out of the template, since ARM validates its name even when a condition skips it.
+    """
+    account_id = "[resourceId('Microsoft.CognitiveServices/accounts', parameters('ai_services_name'))]"
+    project = [{**foundry_project_resource(), "dependsOn": [account_id]}] if with_project else []
+    return compile_template(_template(
+        {
+            "ai_services_name": {"type": "string"},
+            "location": {"type": "string"},
+            "project_name": {"type": "string", "defaultValue": ""},
+            "model_deployments": {"type": "array", "defaultValue": []},
+        },
+        [
+            ai_services_account_resource(),
+            *project,
+            {**model_deployments_resource(), "dependsOn": [account_id]},
+        ],
+    ))
+
+
+def deployment_name_for(template: ArmTemplate, parameters: dict[str, Any]) -> str:
+    """
+    Derives a stable ARM deployment name from a template and its parameter values.
+
+    Re-running the same provisioning call reuses the same deployment entry instead of adding
+    one more to the resource group's deployment history, which ARM caps.
+    """
+    digest = hashlib.sha256(
+        (template.content_hash + json.dumps(parameters, sort_keys=True)).encode("utf-8")
+    ).hexdigest()
+    return f"mcp-foundry-{digest[:16]}"
+
+
+def deploy_arm_template(subscription_id: str, resource_group: str, template: ArmTemplate,
+                        parameters: dict[str, Any]) -> dict:
+    """
+    Deploys an ARM template to a resource group in-process and waits for it to finish.
+
+    Args:
+        subscription_id (str): The ID of the Azure subscription.
+        resource_group (str): The resource group to deploy to.
+        template (ArmTemplate): The compiled template.
+        parameters (dict): Plain parameter values by name.
+
+    Returns:
+        dict: The finished ARM deployment.
+
+    Raises:
+        HttpResponseError: If ARM rejects the deployment or the deployment fails.
+    """
+    client = get_management_client_pool().get(ResourceManagementClient, subscription_id)
+    deployment = Deployment(properties=DeploymentProperties(
+        mode=DeploymentMode.INCREMENTAL,
+        template=template.content,
+        parameters={name: {"value": value} for name, value in parameters.items()},
+    ))
+
+    try:
+        poller = client.deployments.begin_create_or_update(
+            resource_group, deployment_name_for(template, parameters), deployment
+        )
+        return poller.result().as_dict()
+    except HttpResponseError as e:
+        logger.error(f"ARM deployment to resource group '{resource_group}' failed: {e.message}")
+        raise
@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import os
+from typing import Optional
+
+from azure.mgmt.cognitiveservices import CognitiveServicesManagementClient
+from azure.mgmt.cognitiveservices.models import Deployment, DeploymentModel, DeploymentProperties, Sku
+
+from .jobs import DeploymentJob, DeploymentJobTracker, get_deployment_job_tracker
+from .management import get_management_client_pool
+from .models import BulkDeploymentTarget
+from .quotas import QuotaCache, get_quota_cache, parse_usage_name
+
+logger = logging.getLogger("mcp_foundry")
+
+BULK_DEPLOYMENT_CONCURRENCY = int(os.environ.get("MODEL_BULK_DEPLOYMENT_CONCURRENCY", "4"))
+# How long a rollout waits for one deployment to settle before moving on to the next one on the same account
+BULK_DEPLOYMENT_TIMEOUT_SECONDS = 1800.0
+
+AccountKey = tuple[str, str, str]
+QuotaKey = tuple[str, str, str, str]
+
+
+def _account_key(target: BulkDeploymentTarget) -> AccountKey:
+    return target.subscription_id, target.resource_group, target.azure_ai_services_name
+
+
+def _get_account_location(account_key: AccountKey) -> str:
+    subscription_id, resource_group, azure_ai_services_name = account_key
+    client = get_management_client_pool().get(CognitiveServicesManagementClient, subscription_id)
+    return client.accounts.get(resource_group, azure_ai_services_name).location
+
+
+async def check_quota_headroom(targets: list[BulkDeploymentTarget],
+                               quota_cache: QuotaCache) -> tuple[list[Optional[str]], dict[AccountKey, str]]:
+    """
+    Checks every target against the free quota of its account's region, reserving capacity as it goes.
+
+    Targets are granted in order; a target that would exceed what is left for its
+    (subscription, region, SKU, model) is refused, so a rollout never fails over quota halfway through.
+    Models without a quota entry (e.g. non-OpenAI models) are not limited here.
+
+    Returns:
+        tuple: For each target, None if it can be deployed, otherwise the reason it can't; and the
+            region of every account that could be read.
+    """
+    account_keys = list(dict.fromkeys(_account_key(target) for target in targets))
+    locations = await asyncio.gather(
+        *(asyncio.to_thread(_get_account_location, key) for key in account_keys), return_exceptions=True
+    )
+    location_by_account = dict(zip(account_keys, locations))
+
+    regions = list({
+        (key[0], location) for key, location in location_by_account.items() if not isinstance(location, Exception)
+    })
+    scans = await asyncio.gather(*(quota_cache.get_usages(*region) for region in regions), return_exceptions=True)
+
+    remaining: dict[QuotaKey, float] = {}
+    for (subscription_id, location), usages in zip(regions, scans):
+        if isinstance(usages, Exception):
+            continue
+        for usage in usages:
+            parsed = parse_usage_name(usage)
+            if parsed is not None:
+                sku, model = parsed
+                available = (usage.get("limit") or 0) - (usage.get("current_value") or 0)
+                remaining[(subscription_id, location, sku.lower(), model.lower())] = available
+
+    reasons: list[Optional[str]] = []
+    for target in targets:
+        location = location_by_account[_account_key(target)]
+        if isinstance(location, Exception):
+            reasons.append(f"Could not read account '{target.azure_ai_services_name}': {location}")
+            continue
+
+        key = (target.subscription_id, location, target.sku_name.lower(), target.model_name.lower())
+        available = remaining.get(key)
+        if available is not None and target.sku_capacity > available:
+            reasons.append(
+                f"Insufficient {target.sku_name} quota for {target.model_name} in {location}: "
+                f"{target.sku_capacity} requested, {max(available, 0)} available"
+            )
+            continue
+
+        if available is not None:
+            remaining[key] = available - target.sku_capacity
+        reasons.append(None)
+
+    regions_by_account = {
+        key: location for key, location in location_by_account.items() if not isinstance(location, Exception)
+    }
+    return reasons, regions_by_account
+
+
+class BulkDeploymentScheduler:
+    """
+    Rolls out model deployments across many accounts concurrently.
+
+    At most `concurrency` deployments run at once per subscription, to stay clear of management-plane
+    throttling, and deployments on the same account run one after the other, since Cognitive Services
+    rejects concurrent deployment operations on one account. Each deployment is tracked as a job, so the
+    rollout can be followed with the deployment job tracker.
+    """
+
+    def __init__(self, tracker: DeploymentJobTracker, quota_cache: QuotaCache,
+                 concurrency: int = BULK_DEPLOYMENT_CONCURRENCY):
+        self.tracker = tracker
+        self.quota_cache = quota_cache
+        self.concurrency = concurrency
+        self._subscription_slots: dict[str, asyncio.Semaphore] = {}
+        self._account_locks: dict[AccountKey, asyncio.Lock] = {}
+        self._rollouts: set[asyncio.Task] = set()
+
+    async def schedule(self, targets: list[BulkDeploymentTarget]) -> list[dict]:
+        """
+        Checks quota for every target and starts deploying the ones that fit, in the background.
+
+        Returns:
+            list[dict]: One entry per target: its job, or the reason it was skipped.
+        """
+        reasons, regions_by_account = await check_quota_headroom(targets, self.quota_cache)
+
+        results, scheduled = [], []
+        for target, reason in zip(targets, reasons):
+            if reason is not None:
+                results.append({"deployment_name": target.deployment_name,
+                                "azure_ai_services_name": target.azure_ai_services_name,
+                                "skipped": reason})
+                continue
+
+            job, created = self.tracker.track(*_account_key(target), target.deployment_name, queued=True)
+            if not created:
+                results.append({**job.to_dict(), "skipped": "A deployment with this name is already in progress"})
+                continue
+
+            scheduled.append((target, job, regions_by_account[_account_key(target)]))
+            results.append(job.to_dict())
+
+        if scheduled:
+            rollout = asyncio.create_task(self._run(scheduled))
+            # Keep a reference so the rollout isn't garbage collected while it runs
+            self._rollouts.add(rollout)
+            rollout.add_done_callback(self._rollouts.discard)
+        return results
+
+    async def _run(self, scheduled: list[tuple[BulkDeploymentTarget, DeploymentJob, str]]):
+        await asyncio.gather(*(self._deploy(target, job, location) for target, job, location in scheduled))
+
+    async def _deploy(self, target: BulkDeploymentTarget, job: DeploymentJob, location: str):
+        account_key = _account_key(target)
+        subscription_slots = self._subscription_slots.setdefault(
+            target.subscription_id, asyncio.Semaphore(self.concurrency)
+        )
+        account_lock = self._account_locks.setdefault(account_key, asyncio.Lock())
+
+        async with account_lock, subscription_slots:
+            try:
+                await asyncio.to_thread(self._submit, target)
+            except Exception as e:
+                logger.error(f"Could not submit deployment '{target.deployment_name}': {e}")
+                self.tracker.mark_failed(job, str(e))
+                return
+
+            self.tracker.mark_submitted(job)
+            await self.tracker.wait([job.job_id], timeout=BULK_DEPLOYMENT_TIMEOUT_SECONDS)
+
+        # The deployment consumed quota, the next check must see fresh usages
+        self.quota_cache.invalidate(target.subscription_id, location)
+
+    @staticmethod
+    def _submit(target: BulkDeploymentTarget):
+        client = get_management_client_pool().get(CognitiveServicesManagementClient, target.subscription_id)
+        client.deployments.begin_create_or_update(
+            target.resource_group,
+            target.azure_ai_services_name,
+            target.deployment_name,
+            deployment=Deployment(
+                properties=DeploymentProperties(model=DeploymentModel(
+                    format=target.model_format, name=target.model_name, version=target.model_version,
+                )),
+                sku=Sku(name=target.sku_name, capacity=target.sku_capacity),
+            ),
+            polling=False,
+        )
+
+
+_bulk_scheduler: Optional[BulkDeploymentScheduler] = None
+
+
+def get_bulk_deployment_scheduler() -> BulkDeploymentScheduler:
+    """Returns the process-wide bulk deployment scheduler."""
+    global _bulk_scheduler
+    if _bulk_scheduler is None:
+        _bulk_scheduler = BulkDeploymentScheduler(get_deployment_job_tracker(), get_quota_cache())
+    return _bulk_scheduler
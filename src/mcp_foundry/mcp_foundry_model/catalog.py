@@ -0,0 +1,310 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+from mcp.server.fastmcp import Context
+
+from .catalog_index import CatalogIndex
+from .cursors import CursorStore
+from .models import CatalogSummary, ModelsList
+from .utils import get_models_list
+
+logger = logging.getLogger("mcp_foundry")
+
+CATALOG_CACHE_PATH = os.environ.get(
+    "MODEL_CATALOG_CACHE_PATH", str(Path.home() / ".cache" / "mcp-foundry" / "model_catalog.sqlite3")
+)
+CATALOG_TTL_SECONDS = float(os.environ.get("MODEL_CATALOG_TTL_SECONDS", "3600"))
+
+# Upper bound on catalog pages walked by a full refresh; the catalog is far smaller than this today
+CATALOG_MAX_PAGES = 200
+
+
+class CatalogStore:
+    """
+    On-disk SQLite snapshot of the Azure AI Foundry model catalog, stored as compact summaries.
+
+    The snapshot is replaced atomically on every successful refresh, so readers never see a
+    half-written catalog.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Location of the SQLite database file. Parent directories are created on demand.
+        """
+        self.path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        connection.execute("CREATE TABLE IF NOT EXISTS snapshot (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS summaries (position INTEGER PRIMARY KEY, name TEXT, summary TEXT NOT NULL)"
+        )
+        return connection
+
+    def load(self) -> tuple[Optional[list[CatalogSummary]], Optional[float]]:
+        """
+        Reads the stored snapshot.
+
+        Returns:
+            tuple: The list of summaries and the epoch time it was fetched at, or `(None, None)`
+                when no snapshot has been stored yet.
+        """
+        connection = self._connect()
+        try:
+            row = connection.execute("SELECT value FROM snapshot WHERE key = 'fetched_at'").fetchone()
+            if row is None:
+                return None, None
+            summaries = [
+                CatalogSummary.from_summary(json.loads(summary))
+                for (summary,) in connection.execute("SELECT summary FROM summaries ORDER BY position")
+            ]
+            return summaries, float(row[0])
+        finally:
+            connection.close()
+
+    def save(self, summaries: list[CatalogSummary], fetched_at: float):
+        """
+        Replaces the stored snapshot with the given summaries.
+
+        Args:
+            summaries (list[CatalogSummary]): The full list of catalog summaries.
+            fetched_at (float): Epoch time at which the summaries were fetched.
+        """
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute("DELETE FROM summaries")
+                connection.executemany(
+                    "INSERT INTO summaries (position, name, summary) VALUES (?, ?, ?)",
+                    ((position, summary.name, json.dumps(summary.to_dict())) for position, summary in enumerate(summaries)),
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO snapshot (key, value) VALUES ('fetched_at', ?)", (str(fetched_at),)
+                )
+        finally:
+            connection.close()
+
+
+class ModelCatalog:
+    """
+    Local mirror of the model catalog, backed by a `CatalogStore` and refreshed in the background.
+
+    The first call on a cold cache waits for a full fetch. After that, reads are served from memory
+    and a stale snapshot (older than the TTL) triggers a single background refresh while the
+    current snapshot keeps being served. Each snapshot is indexed once with a `CatalogIndex`.
+    """
+
+    def __init__(self, store: CatalogStore, ttl_seconds: float):
+        self.store = store
+        self.ttl_seconds = ttl_seconds
+        self._index: Optional[CatalogIndex] = None
+        self._fetched_at: Optional[float] = None
+        self._snapshot_loaded = False
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def is_stale(self) -> bool:
+        return self._fetched_at is None or time.time() - self._fetched_at > self.ttl_seconds
+
+    async def get_index(self, ctx: Context) -> Optional[CatalogIndex]:
+        """
+        Returns the index over the mirrored catalog, fetching the catalog if nothing has been mirrored yet.
+
+        Args:
+            ctx (Context): The context of the current session, used for the client headers of any refresh.
+
+        Returns:
+            Optional[CatalogIndex]: The catalog index, or None if the catalog could not be fetched
+                and no snapshot exists.
+        """
+        if not self._snapshot_loaded:
+            await self._load_snapshot()
+
+        if self._index is None:
+            await asyncio.shield(self._ensure_refresh(ctx))
+        elif self.is_stale():
+            self._ensure_refresh(ctx)
+
+        return self._index
+
+    async def get_loaded_index(self, ctx: Context) -> Optional[CatalogIndex]:
+        """
+        Returns the index over the mirrored catalog without waiting for a fetch.
+
+        A missing or stale snapshot starts a background refresh, so later calls can be served
+        from the mirror. Callers that need an answer right away fall back to a filtered catalog query.
+
+        Returns:
+            Optional[CatalogIndex]: The catalog index, or None if nothing has been mirrored yet.
+        """
+        if not self._snapshot_loaded:
+            await self._load_snapshot()
+
+        if self._index is None or self.is_stale():
+            self._ensure_refresh(ctx)
+
+        return self._index
+
+    async def refresh(self, ctx: Context) -> bool:
+        """
+        Fetches the full catalog and replaces the mirrored snapshot.
+
+        Returns:
+            bool: True if the snapshot was replaced, False if the fetch was incomplete and the
+                previous snapshot was kept.
+        """
+        fetched_at = time.time()
+        models_list = await get_models_list(ctx, max_pages=CATALOG_MAX_PAGES)
+
+        if models_list is None or models_list.fetched_models_count == 0 \
+                or models_list.fetched_models_count < models_list.total_models_count:
+            logger.warning("Model catalog refresh was incomplete, keeping the previous snapshot")
+            return False
+
+        summaries = [CatalogSummary.from_summary(summary) for summary in models_list.summaries]
+
+        try:
+            await asyncio.to_thread(self.store.save, summaries, fetched_at)
+        except Exception as e:
+            logger.error(f"Exception saving model catalog snapshot: {e}")
+
+        self._index = CatalogIndex(summaries)
+        self._fetched_at = fetched_at
+        logger.info(f"Model catalog mirror refreshed with {len(self._index)} models")
+        return True
+
+    def _ensure_refresh(self, ctx: Context) -> asyncio.Task:
+        """Starts a refresh unless one is already running on this event loop."""
+        task = self._refresh_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._refresh_quietly(ctx))
+            self._refresh_task = task
+        return task
+
+    async def _refresh_quietly(self, ctx: Context):
+        try:
+            await self.refresh(ctx)
+        except Exception as e:
+            logger.error(f"Exception refreshing model catalog mirror: {e}")
+
+    async def _load_snapshot(self):
+        try:
+            summaries, fetched_at = await asyncio.to_thread(self.store.load)
+        except Exception as e:
+            logger.error(f"Exception loading model catalog snapshot: {e}")
+            summaries, fetched_at = None, None
+
+        self._snapshot_loaded = True
+        if summaries is not None and self._index is None:
+            self._index = CatalogIndex(summaries)
+            self._fetched_at = fetched_at
+
+
+catalog_cursors = CursorStore()
+
+
+def _next_page_cursor(state: dict, **changes) -> str:
+    """Stores the paging state of the following page, without the page cached for the current cursor."""
+    next_state = {key: value for key, value in state.items() if key != "page"}
+    next_state.update(changes)
+    return catalog_cursors.create(next_state)
+
+
+async def get_catalog_page(ctx: Context, state: dict) -> ModelsList:
+    """
+    Returns the page of models described by a paging state and a cursor for the page after it.
+
+    Two kinds of paging state are supported:
+        - mirror paging, `{"matches": [...], "offset": int, "page_size": int, "fields": ...}`, walks a list
+          of matches from the catalog mirror. The list is pinned in the state, so a background refresh
+          cannot shift pages under a client that is walking it.
+        - live paging, `{"filters": {...}, "local_filters": {...}, "continuation_token": str, "fields": ...}`,
+          issues exactly one catalog request per page and keeps the upstream continuation token on the server.
+          The catalog API has no inference task, deployment option or name prefix filter, so `local_filters`
+          are applied to each page once it is fetched: pages can hold fewer models than the catalog returned,
+          and `total_models_count` counts the models matching the upstream filters only.
+
+    Args:
+        ctx (Context): The context of the current session.
+        state (dict): The paging state, as created by the first listing or stored behind a cursor.
+
+    Returns:
+        ModelsList: The page, with `next_cursor` set when more models are available.
+
+    Raises:
+        RuntimeError: If the catalog did not return the page after a continuation token.
+    """
+    fields = state.get("fields")
+
+    if "matches" in state:
+        matches, offset, page_size = state["matches"], state["offset"], state["page_size"]
+        page = matches[offset:offset + page_size]
+        next_offset = offset + len(page)
+        next_cursor = None
+        if next_offset < len(matches):
+            next_cursor = _next_page_cursor(state, offset=next_offset)
+        return ModelsList(
+            total_models_count=len(matches),
+            fetched_models_count=len(page),
+            summaries=[summary.to_dict(fields) for summary in page],
+            next_cursor=next_cursor,
+        )
+
+    continuation_token = state.get("continuation_token", "")
+    models_list = await get_models_list(ctx, **state["filters"], max_pages=1, continuation_token=continuation_token)
+    if continuation_token and models_list.continuation_token == continuation_token:
+        # get_models_list hands back the token it was given when the request failed
+        raise RuntimeError("The model catalog did not return the requested page")
+
+    next_cursor = None
+    if models_list.continuation_token:
+        next_cursor = _next_page_cursor(state, continuation_token=models_list.continuation_token)
+    summaries = [CatalogSummary.from_summary(summary) for summary in models_list.summaries]
+    if state.get("local_filters"):
+        summaries = CatalogIndex(summaries).search(**state["local_filters"])
+    return ModelsList(
+        total_models_count=models_list.total_models_count,
+        fetched_models_count=len(summaries),
+        summaries=[summary.to_dict(fields) for summary in summaries],
+        next_cursor=next_cursor,
+    )
+
+
+async def get_catalog_page_for_cursor(ctx: Context, cursor: str) -> Optional[ModelsList]:
+    """
+    Returns the page addressed by a cursor, or None if the cursor is unknown or has expired.
+
+    The page is fetched once per cursor: asking for the same cursor again (or concurrently) returns the
+    same page and the same next cursor without another upstream request.
+    """
+    state = catalog_cursors.get(cursor)
+    if state is None:
+        return None
+
+    page = state.get("page")
+    if page is None:
+        page = state["page"] = asyncio.ensure_future(get_catalog_page(ctx, state))
+    try:
+        return await asyncio.shield(page)
+    except Exception:
+        # Let the next attempt retry the fetch
+        state.pop("page", None)
+        raise
+
+
+_model_catalog: Optional[ModelCatalog] = None
+
+
+def get_model_catalog() -> ModelCatalog:
+    """Returns the process-wide model catalog mirror."""
+    global _model_catalog
+    if _model_catalog is None:
+        _model_catalog = ModelCatalog(CatalogStore(CATALOG_CACHE_PATH), CATALOG_TTL_SECONDS)
+    return _model_catalog
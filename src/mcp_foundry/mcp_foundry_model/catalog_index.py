@@ -0,0 +1,152 @@
+from bisect import bisect_left
+from typing import Iterable, Optional
+
+from .models import CatalogSummary
+
+
+def _normalize_values(values: Optional[str | Iterable[str]]) -> list[str]:
+    """Turns a single filter value or a list of values into a list of non-empty, lower-cased values."""
+    if values is None:
+        return []
+    if isinstance(values, str):
+        values = [values]
+    return [value.strip().lower() for value in values if value and value.strip()]
+
+
+class CatalogIndex:
+    """
+    Inverted index over model catalog summaries.
+
+    Every filterable field maps each distinct (lower-cased) value to the positions of the summaries
+    carrying it, so filters are answered by intersecting posting sets instead of scanning the catalog.
+    Results are always returned in catalog order.
+    """
+
+    def __init__(self, summaries: list[CatalogSummary]):
+        self.summaries = summaries
+        self._postings: dict[str, dict[str, set[int]]] = {
+            "publisher": {},
+            "license": {},
+            "inference_task": {},
+            "deployment_option": {},
+        }
+        self._free_playground: set[int] = set()
+        self._names: dict[str, list[int]] = {}
+        self._names_folded: dict[str, list[int]] = {}
+
+        for position, summary in enumerate(summaries):
+            self._add("publisher", summary.publisher, position)
+            self._add("license", summary.license, position)
+            for inference_task in summary.inference_tasks:
+                self._add("inference_task", inference_task, position)
+
+            for option, enabled in summary.deployment_options.items():
+                if enabled:
+                    self._add("deployment_option", option, position)
+
+            if summary.free_playground:
+                self._free_playground.add(position)
+
+            if summary.name:
+                self._names.setdefault(summary.name, []).append(position)
+                self._names_folded.setdefault(summary.name.lower(), []).append(position)
+
+        # Sorted (folded name, position) pairs for prefix lookups with bisect
+        self._sorted_names = sorted(
+            (folded, position) for folded, positions in self._names_folded.items() for position in positions
+        )
+
+    def __len__(self) -> int:
+        return len(self.summaries)
+
+    def _add(self, field: str, value: Optional[str], position: int):
+        if not value:
+            return
+        self._postings[field].setdefault(value.lower(), set()).add(position)
+
+    def _match_field(self, field: str, values: list[str], substring: bool) -> set[int]:
+        """Union of the postings of every value of the field matching any of the requested values."""
+        postings = self._postings[field]
+        positions: set[int] = set()
+        for value in values:
+            if substring:
+                # Distinct publishers/licenses are few, so scanning the keys stays cheap
+                for indexed_value, indexed_positions in postings.items():
+                    if value in indexed_value:
+                        positions |= indexed_positions
+            else:
+                positions |= postings.get(value, set())
+        return positions
+
+    def lookup_name(self, name: str) -> Optional[CatalogSummary]:
+        """
+        Resolves a model name to its summary.
+
+        An exact match wins; otherwise the lookup falls back to a case-insensitive match.
+
+        Returns:
+            Optional[CatalogSummary]: The first matching summary, or None if the name is not in the catalog.
+        """
+        positions = self._names.get(name) or self._names_folded.get(name.lower())
+        return self.summaries[positions[0]] if positions else None
+
+    def _positions_with_prefix(self, prefix: str) -> set[int]:
+        prefix = prefix.lower()
+        positions: set[int] = set()
+        for index in range(bisect_left(self._sorted_names, (prefix, -1)), len(self._sorted_names)):
+            folded, position = self._sorted_names[index]
+            if not folded.startswith(prefix):
+                break
+            positions.add(position)
+        return positions
+
+    def search(self, search_for_free_playground: bool = False,
+               publisher_name: Optional[str | Iterable[str]] = None,
+               license_name: Optional[str | Iterable[str]] = None,
+               inference_task: Optional[str | Iterable[str]] = None,
+               deployment_option: Optional[str | Iterable[str]] = None,
+               model_name: Optional[str | Iterable[str]] = None,
+               model_name_prefix: Optional[str] = None) -> list[CatalogSummary]:
+        """
+        Returns the summaries matching every given filter.
+
+        Each filter accepts a single value or a list of values; values of the same filter are OR-ed
+        and different filters are AND-ed. Publisher and license match on case-insensitive substrings,
+        like the catalog `contains` operator. Inference tasks, deployment options (`openai`,
+        `serverless_endpoint`, `managed_compute`, `free_playground`) and model names match exactly,
+        ignoring case.
+        """
+        candidate_sets: list[set[int]] = []
+
+        if search_for_free_playground is True:
+            candidate_sets.append(self._free_playground)
+
+        for field, values, substring in (
+            ("publisher", publisher_name, True),
+            ("license", license_name, True),
+            ("inference_task", inference_task, False),
+            ("deployment_option", deployment_option, False),
+        ):
+            values = _normalize_values(values)
+            if values:
+                candidate_sets.append(self._match_field(field, values, substring))
+
+        names = _normalize_values(model_name)
+        if names:
+            candidate_sets.append({position for name in names for position in self._names_folded.get(name, [])})
+
+        if model_name_prefix:
+            candidate_sets.append(self._positions_with_prefix(model_name_prefix))
+
+        if not candidate_sets:
+            return list(self.summaries)
+
+        # Intersect starting from the smallest set so the work is bounded by the number of matches
+        candidate_sets.sort(key=len)
+        positions = set(candidate_sets[0])
+        for candidates in candidate_sets[1:]:
+            positions &= candidates
+            if not positions:
+                break
+
+        return [self.summaries[position] for position in sorted(positions)]
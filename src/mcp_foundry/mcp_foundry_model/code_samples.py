@@ -0,0 +1,186 @@
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Optional
+from urllib.parse import quote
+
+from jinja2 import Template
+from jinja2.sandbox import SandboxedEnvironment
+
+from .http_client import get_http_client
+
+logger = logging.getLogger("mcp_foundry")
+
+# Disk persistence is opt-in: templates and widget configs are only kept in memory unless a directory is set
+CODE_SAMPLE_CACHE_DIR = os.environ.get("MODEL_CODE_SAMPLE_CACHE_DIR", "")
+CODE_SAMPLE_CACHE_TTL_SECONDS = float(os.environ.get("MODEL_CODE_SAMPLE_CACHE_TTL_SECONDS", "86400"))
+TEMPLATE_CACHE_SIZE = int(os.environ.get("MODEL_CODE_SAMPLE_TEMPLATE_CACHE_SIZE", "32"))
+WIDGET_CACHE_SIZE = int(os.environ.get("MODEL_CODE_SAMPLE_WIDGET_CACHE_SIZE", "256"))
+
+TEMPLATE_URL = "https://ai.azure.com/modelcache/code2/oai-sdk-key-auth/en/{key}-python-template.md"
+WIDGET_URL = "https://ai.azure.com/modelcache/widgets/en/Serverless/azure-openai/{key}.json"
+
+
+def ejs_to_jinja2(ejs_template: str) -> str:
+    """Rewrites the `<%= value %>` placeholders of an EJS code sample template into escaped Jinja2 expressions."""
+    return re.sub(r"<%=\s+([\w\.]+)\s%>", r"{{ \1|e }}", ejs_template)
+
+
+class LRUCache:
+    """Small least-recently-used cache whose entries also expire after a TTL."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def get(self, key: str) -> Optional[Any]:
+        """Returns the cached value, or None if the key is missing or its entry has expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl_seconds:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any):
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class CodeSampleCache:
+    """
+    Two-level cache for the inputs of Azure AI Services code samples.
+
+    Compiled Jinja2 templates are kept by inference task and widget configs by model name, each in
+    its own LRU. On a memory miss the raw payload is read from the optional disk cache before falling
+    back to ai.azure.com, so a restarted server only has to recompile templates. Concurrent misses
+    for the same key share a single fetch.
+    """
+
+    def __init__(self, cache_dir: Optional[str], ttl_seconds: float,
+                 template_cache_size: int, widget_cache_size: int):
+        """
+        Args:
+            cache_dir (Optional[str]): Directory persisting the raw templates and widget configs, or
+                None/empty to keep them in memory only.
+            ttl_seconds (float): Age after which a cached entry, in memory or on disk, is fetched again.
+            template_cache_size (int): Maximum number of compiled templates kept in memory.
+            widget_cache_size (int): Maximum number of widget configs kept in memory.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.ttl_seconds = ttl_seconds
+        # Compiling against one shared sandbox lets every template reuse its parser and filters
+        self._env = SandboxedEnvironment()
+        self._templates = LRUCache(template_cache_size, ttl_seconds)
+        self._widgets = LRUCache(widget_cache_size, ttl_seconds)
+        self._pending: dict[tuple[str, str], asyncio.Task] = {}
+
+    async def get_template(self, inference_task: str) -> Template:
+        """
+        Returns the compiled code sample template of an inference task.
+
+        Raises:
+            httpx.HTTPError: If the template is not cached and can't be fetched.
+        """
+        return await self._get("templates", inference_task, TEMPLATE_URL, self._templates,
+                               lambda raw: self._env.from_string(ejs_to_jinja2(raw)))
+
+    async def get_widget_config(self, model_name: str) -> Any:
+        """
+        Returns the widget config of an Azure OpenAI model, which holds the examples used by its code samples.
+
+        Raises:
+            httpx.HTTPError: If the config is not cached and can't be fetched.
+            ValueError: If the fetched config is not valid JSON.
+        """
+        return await self._get("widgets", model_name, WIDGET_URL, self._widgets, json.loads)
+
+    async def _get(self, kind: str, key: str, url: str, cache: LRUCache, parse: Callable[[str], Any]) -> Any:
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+        task = self._pending.get((kind, key))
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._load(kind, key, url, cache, parse))
+            self._pending[(kind, key)] = task
+            task.add_done_callback(lambda _: self._pending.pop((kind, key), None))
+        return await asyncio.shield(task)
+
+    async def _load(self, kind: str, key: str, url: str, cache: LRUCache, parse: Callable[[str], Any]) -> Any:
+        raw = await asyncio.to_thread(self._read_from_disk, kind, key)
+        value = None
+        if raw is not None:
+            try:
+                value = parse(raw)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable cached {kind} entry '{key}': {e}")
+
+        if value is None:
+            response = await get_http_client().get(url.format(key=key))
+            response.raise_for_status()
+            raw = response.text
+            value = parse(raw)
+            await asyncio.to_thread(self._write_to_disk, kind, key, raw)
+
+        cache.put(key, value)
+        return value
+
+    def _path(self, kind: str, key: str) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / kind / quote(key, safe="")
+
+    def _read_from_disk(self, kind: str, key: str) -> Optional[str]:
+        path = self._path(kind, key)
+        try:
+            if path is None or time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _write_to_disk(self, kind: str, key: str, raw: str):
+        path = self._path(kind, key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so a concurrent reader never sees a partial file
+            temporary_path = path.with_name(f".{path.name}.tmp")
+            temporary_path.write_text(raw, encoding="utf-8")
+            temporary_path.replace(path)
+        except OSError as e:
+            logger.warning(f"Could not persist {kind} entry '{key}': {e}")
+
+
+_code_sample_cache: Optional[CodeSampleCache] = None
+
+
+def get_code_sample_cache() -> CodeSampleCache:
+    """Returns the process-wide code sample template cache."""
+    global _code_sample_cache
+    if _code_sample_cache is None:
+        _code_sample_cache = CodeSampleCache(
+            CODE_SAMPLE_CACHE_DIR, CODE_SAMPLE_CACHE_TTL_SECONDS, TEMPLATE_CACHE_SIZE, WIDGET_CACHE_SIZE
+        )
+    return _code_sample_cache
@@ -0,0 +1,66 @@
+import os
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+CURSOR_TTL_SECONDS = float(os.environ.get("MODEL_CATALOG_CURSOR_TTL_SECONDS", "900"))
+MAX_CURSORS = 1000
+
+
+class CursorStore:
+    """
+    Server-side paging state addressed by opaque cursors.
+
+    Clients only ever see a random token; the state behind it (filters, offsets, upstream
+    continuation tokens) stays on the server. Cursors expire after a TTL and the least recently
+    used ones are dropped once the store is full.
+    """
+
+    def __init__(self, ttl_seconds: float = CURSOR_TTL_SECONDS, max_cursors: int = MAX_CURSORS):
+        self.ttl_seconds = ttl_seconds
+        self.max_cursors = max_cursors
+        self._cursors: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def create(self, state: dict[str, Any]) -> str:
+        """
+        Stores paging state and returns the cursor addressing it.
+
+        Args:
+            state (dict): The paging state to keep for the cursor.
+
+        Returns:
+            str: An opaque, URL-safe cursor.
+        """
+        self._evict_expired()
+        cursor = secrets.token_urlsafe(16)
+        self._cursors[cursor] = (time.monotonic() + self.ttl_seconds, state)
+        while len(self._cursors) > self.max_cursors:
+            self._cursors.popitem(last=False)
+        return cursor
+
+    def get(self, cursor: str) -> Optional[dict[str, Any]]:
+        """
+        Returns the state of a cursor, or None if the cursor is unknown or has expired.
+
+        Reading a cursor extends its lifetime, so a slow client can keep walking the catalog.
+        """
+        entry = self._cursors.get(cursor)
+        if entry is None:
+            return None
+
+        expires_at, state = entry
+        now = time.monotonic()
+        if expires_at < now:
+            del self._cursors[cursor]
+            return None
+
+        self._cursors[cursor] = (now + self.ttl_seconds, state)
+        self._cursors.move_to_end(cursor)
+        return state
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        expired = [cursor for cursor, (expires_at, _) in self._cursors.items() if expires_at < now]
+        for cursor in expired:
+            del self._cursors[cursor]
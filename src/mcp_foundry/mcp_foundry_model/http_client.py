@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import os
+import time
+import weakref
+from dataclasses import dataclass, replace
+from typing import Any, Optional
+
+import httpx
+
+from mcp_foundry.mcp_server import on_shutdown
+
+logger = logging.getLogger("mcp_foundry")
+
+MAX_CONNECTIONS = int(os.environ.get("MODEL_HTTP_MAX_CONNECTIONS", "100"))
+MAX_CONNECTIONS_PER_HOST = int(os.environ.get("MODEL_HTTP_MAX_CONNECTIONS_PER_HOST", "10"))
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+REQUEST_TIMEOUT_SECONDS = float(os.environ.get("MODEL_HTTP_TIMEOUT_SECONDS", "30"))
+RESOURCE_TTL_SECONDS = float(os.environ.get("LABS_RESOURCE_TTL_SECONDS", "3600"))
+RESOURCE_MAX_STALE_SECONDS = float(os.environ.get("LABS_RESOURCE_MAX_STALE_SECONDS", "604800"))
+
+# One client per event loop: httpx connections are bound to the loop that opened them
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+class HostLimitedTransport(httpx.AsyncHTTPTransport):
+    """
+    HTTP transport that caps the number of in-flight requests per host.
+
+    httpx only limits connections for the whole pool, so a burst against one slow host
+    (e.g. the model catalog) could otherwise take every connection away from the others.
+    """
+
+    def __init__(self, max_requests_per_host: int, **kwargs):
+        super().__init__(**kwargs)
+        self._max_requests_per_host = max_requests_per_host
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores.setdefault(host, asyncio.Semaphore(self._max_requests_per_host))
+
+        async with semaphore:
+            response = await super().handle_async_request(request)
+            # Read the body while holding the slot so the stream is released before the next request starts
+            await response.aread()
+            return response
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the shared, connection-pooled HTTP client for the running event loop.
+
+    The client keeps HTTP/2 connections alive between tool calls, so catalog and Labs
+    requests from every MCP session reuse the same TLS connections instead of opening new ones.
+
+    Returns:
+        httpx.AsyncClient: The pooled client. Callers must not close it.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        limits = httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        )
+        transport = HostLimitedTransport(MAX_CONNECTIONS_PER_HOST, http2=True, limits=limits)
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(REQUEST_TIMEOUT_SECONDS),
+            follow_redirects=True,
+        )
+        _clients[loop] = client
+    return client
+
+
+@on_shutdown
+async def close_http_clients() -> None:
+    """Closes the pooled HTTP client owned by the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.pop(loop, None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+        logger.info("Closed pooled HTTP client")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A parsed JSON response together with the validators needed to revalidate it."""
+    body: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+async def conditional_get_json(url: str, headers: dict, cached: Optional[CachedResponse] = None) -> CachedResponse:
+    """
+    Fetches a JSON resource, revalidating a previously cached copy with `If-None-Match`/`If-Modified-Since`.
+
+    Args:
+        url (str): The resource URL.
+        headers (dict): Request headers, e.g. from `get_client_headers_info`.
+        cached (CachedResponse, optional): The copy held by the caller, if any.
+
+    Returns:
+        CachedResponse: The cached copy with a renewed fetch time when the server answers 304 Not Modified,
+            otherwise the newly fetched resource.
+
+    Raises:
+        httpx.HTTPStatusError: If the server answers with an error status.
+    """
+    request_headers = dict(headers)
+    if cached is not None:
+        if cached.etag:
+            request_headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            request_headers["If-Modified-Since"] = cached.last_modified
+
+    response = await get_http_client().get(url, headers=request_headers)
+
+    if response.status_code == 304 and cached is not None:
+        return replace(cached, fetched_at=time.time())
+
+    response.raise_for_status()
+    return CachedResponse(
+        body=response.json(),
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+        fetched_at=time.time(),
+    )
+
+
+class ResourceCache:
+    """
+    Stale-while-revalidate cache of JSON resources that rarely change, keyed by URL.
+
+    A copy younger than `ttl_seconds` is served as is. An older copy is still served immediately
+    while a single background request revalidates it with its validators, so callers only ever
+    wait on the very first fetch, or once a copy is older than `max_stale_seconds`. Even then a
+    failed revalidation falls back to the stale copy, so upstream blips don't surface to callers.
+    """
+
+    def __init__(self, ttl_seconds: float, max_stale_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self._entries: dict[str, CachedResponse] = {}
+        self._revalidations: dict[str, asyncio.Task] = {}
+
+    async def get(self, url: str, headers: dict) -> Any:
+        """
+        Returns the JSON body of a resource.
+
+        Args:
+            url (str): The resource URL.
+            headers (dict): Request headers used when the resource has to be (re)fetched.
+
+        Raises:
+            httpx.HTTPError: If the resource can't be fetched and nothing is cached yet.
+        """
+        cached = self._entries.get(url)
+        if cached is not None and cached.age() <= self.ttl_seconds:
+            return cached.body
+
+        task = self._revalidate(url, headers)
+        if cached is not None and cached.age() <= self.max_stale_seconds:
+            return cached.body
+
+        try:
+            return (await asyncio.shield(task)).body
+        except Exception as e:
+            if cached is None:
+                raise
+            logger.warning(f"Serving stale copy of {url}, revalidation failed: {e}")
+            return cached.body
+
+    def _revalidate(self, url: str, headers: dict) -> asyncio.Task:
+        """Starts revalidating a resource unless a revalidation is already running on this event loop."""
+        task = self._revalidations.get(url)
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._fetch(url, headers))
+            # Background revalidations may never be awaited; their failures are already logged
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._revalidations[url] = task
+        return task
+
+    async def _fetch(self, url: str, headers: dict) -> CachedResponse:
+        try:
+            cached = await conditional_get_json(url, headers, self._entries.get(url))
+        except Exception as e:
+            logger.warning(f"Could not revalidate {url}: {e}")
+            raise
+        self._entries[url] = cached
+        return cached
+
+
+_resource_cache: Optional[ResourceCache] = None
+
+
+def get_resource_cache() -> ResourceCache:
+    """Returns the process-wide cache of static Labs resources (guidance and instruction documents)."""
+    global _resource_cache
+    if _resource_cache is None:
+        _resource_cache = ResourceCache(RESOURCE_TTL_SECONDS, RESOURCE_MAX_STALE_SECONDS)
+    return _resource_cache
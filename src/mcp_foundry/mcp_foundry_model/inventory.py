@@ -0,0 +1,177 @@
+import asyncio
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from azure.mgmt.cognitiveservices import CognitiveServicesManagementClient
+
+from .management import get_management_client_pool
+
+logger = logging.getLogger("mcp_foundry")
+
+INVENTORY_TTL_SECONDS = float(os.environ.get("MODEL_INVENTORY_TTL_SECONDS", "600"))
+INVENTORY_CONCURRENCY = int(os.environ.get("MODEL_INVENTORY_CONCURRENCY", "16"))
+
+
+@dataclass(frozen=True, slots=True)
+class DeploymentRecord:
+    """One model deployment of the fleet, flattened for filtering."""
+    subscription_id: str
+    resource_group: str
+    azure_ai_services_name: str
+    location: Optional[str]
+    deployment_name: str
+    model_name: Optional[str]
+    model_format: Optional[str]
+    model_version: Optional[str]
+    sku_name: Optional[str]
+    sku_capacity: Optional[int]
+    provisioning_state: Optional[str]
+
+    @classmethod
+    def from_deployment(cls, subscription_id: str, resource_group: str, azure_ai_services_name: str,
+                        location: Optional[str], deployment: dict) -> "DeploymentRecord":
+        properties = deployment.get("properties") or {}
+        model = properties.get("model") or {}
+        sku = deployment.get("sku") or {}
+        return cls(
+            subscription_id=subscription_id,
+            resource_group=resource_group,
+            azure_ai_services_name=azure_ai_services_name,
+            location=location,
+            deployment_name=deployment.get("name"),
+            model_name=model.get("name"),
+            model_format=model.get("format"),
+            model_version=model.get("version"),
+            sku_name=sku.get("name"),
+            sku_capacity=sku.get("capacity"),
+            provisioning_state=properties.get("provisioning_state"),
+        )
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def resource_group_from_id(resource_id: str) -> str:
+    """Extracts the resource group from an ARM resource ID."""
+    parts = resource_id.split("/")
+    lowered = [part.lower() for part in parts]
+    return parts[lowered.index("resourcegroups") + 1]
+
+
+@dataclass
+class SubscriptionSnapshot:
+    fetched_at: float
+    deployments: list[DeploymentRecord]
+    accounts_scanned: int
+    errors: dict[str, str]
+
+
+class FleetInventory:
+    """
+    In-memory snapshot of the model deployments of every AI services account in a set of subscriptions.
+
+    A sweep lists the accounts of each subscription and then the deployments of every account, with at
+    most `concurrency` listing calls in flight. Snapshots are kept per subscription for `ttl_seconds`,
+    so fleet queries after the first sweep are answered from memory. A sweep that could not list the
+    accounts of a subscription is returned but not kept, so the next query sweeps it again.
+    """
+
+    def __init__(self, ttl_seconds: float = INVENTORY_TTL_SECONDS, concurrency: int = INVENTORY_CONCURRENCY):
+        self.ttl_seconds = ttl_seconds
+        self.concurrency = concurrency
+        # Shared by every sweep, so concurrent fleet queries stay within one budget of listing calls
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._snapshots: dict[str, SubscriptionSnapshot] = {}
+        self._sweeps: dict[str, asyncio.Task] = {}
+
+    async def get_snapshots(self, subscription_ids: list[str], refresh: bool = False) -> list[SubscriptionSnapshot]:
+        """
+        Returns the snapshot of every subscription, sweeping the ones that are missing, stale or asked to be refreshed.
+
+        Subscriptions are swept concurrently and share one concurrency budget.
+        """
+        now = time.time()
+
+        sweeps = []
+        for subscription_id in dict.fromkeys(subscription_ids):
+            snapshot = self._snapshots.get(subscription_id)
+            if snapshot is not None and not refresh and now - snapshot.fetched_at <= self.ttl_seconds:
+                sweeps.append(asyncio.sleep(0, snapshot))
+                continue
+
+            task = self._sweeps.get(subscription_id)
+            if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+                task = self._sweeps[subscription_id] = asyncio.create_task(self._sweep(subscription_id))
+            sweeps.append(asyncio.shield(task))
+
+        return list(await asyncio.gather(*sweeps))
+
+    async def _sweep(self, subscription_id: str) -> SubscriptionSnapshot:
+        fetched_at = time.time()
+        client = get_management_client_pool().get(CognitiveServicesManagementClient, subscription_id)
+
+        errors: dict[str, str] = {}
+        try:
+            async with self._semaphore:
+                accounts = await asyncio.to_thread(lambda: list(client.accounts.list()))
+        except Exception as e:
+            logger.error(f"Could not list AI services accounts of subscription {subscription_id}: {e}")
+            errors[subscription_id] = str(e)
+            accounts = []
+
+        async def list_account(account) -> list[DeploymentRecord]:
+            resource_group = resource_group_from_id(account.id)
+            async with self._semaphore:
+                deployments = await asyncio.to_thread(
+                    lambda: [deployment.as_dict() for deployment in client.deployments.list(resource_group, account.name)]
+                )
+            return [
+                DeploymentRecord.from_deployment(subscription_id, resource_group, account.name, account.location, deployment)
+                for deployment in deployments
+            ]
+
+        results = await asyncio.gather(*(list_account(account) for account in accounts), return_exceptions=True)
+
+        records: list[DeploymentRecord] = []
+        for account, result in zip(accounts, results):
+            if isinstance(result, Exception):
+                errors[account.id] = str(result)
+            else:
+                records.extend(result)
+
+        snapshot = SubscriptionSnapshot(fetched_at, records, len(accounts), errors)
+        if subscription_id not in errors:
+            self._snapshots[subscription_id] = snapshot
+        logger.info(f"Inventoried {len(records)} deployments across {len(accounts)} accounts in {subscription_id}")
+        return snapshot
+
+
+def filter_deployments(deployments: list[DeploymentRecord], model_name: str = "", model_version: str = "",
+                       sku_name: str = "", min_capacity: Optional[int] = None,
+                       max_capacity: Optional[int] = None) -> list[DeploymentRecord]:
+    """Filters deployment records. Names and versions match exactly, ignoring case; unset filters match everything."""
+    def matches(value: Optional[str], expected: str) -> bool:
+        return not expected or (value or "").lower() == expected.lower()
+
+    return [
+        record for record in deployments
+        if matches(record.model_name, model_name)
+        and matches(record.model_version, model_version)
+        and matches(record.sku_name, sku_name)
+        and (min_capacity is None or (record.sku_capacity or 0) >= min_capacity)
+        and (max_capacity is None or (record.sku_capacity or 0) <= max_capacity)
+    ]
+
+
+_fleet_inventory: Optional[FleetInventory] = None
+
+
+def get_fleet_inventory() -> FleetInventory:
+    """Returns the process-wide fleet deployment inventory."""
+    global _fleet_inventory
+    if _fleet_inventory is None:
+        _fleet_inventory = FleetInventory()
+    return _fleet_inventory
@@ -0,0 +1,251 @@
+import asyncio
+import logging
+import math
+import secrets
+import time
+from dataclasses import dataclass, field
+from typing import Literal, Optional
+
+from azure.mgmt.cognitiveservices import CognitiveServicesManagementClient
+
+from .management import get_management_client_pool
+
+logger = logging.getLogger("mcp_foundry")
+
+POLL_INITIAL_INTERVAL_SECONDS = 2.0
+POLL_MAX_INTERVAL_SECONDS = 30.0
+POLL_BACKOFF_FACTOR = 2.0
+# Finished jobs stay queryable for this long
+JOB_RETENTION_SECONDS = 3600.0
+
+TERMINAL_STATES = frozenset({"Succeeded", "Failed", "Canceled", "Disabled", "NotFound"})
+
+AccountKey = tuple[str, str, str]
+
+
+@dataclass
+class DeploymentJob:
+    """A model deployment operation submitted to an Azure AI services account, tracked until it settles."""
+    job_id: str
+    subscription_id: str
+    resource_group: str
+    azure_ai_services_name: str
+    deployment_name: str
+    submitted_at: float
+    provisioning_state: str = "Accepted"
+    error: Optional[str] = None
+    finished_at: Optional[float] = None
+    deployment: Optional[dict] = None
+    poll_interval: float = POLL_INITIAL_INTERVAL_SECONDS
+    next_poll_at: float = 0.0
+    _done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def account_key(self) -> AccountKey:
+        return self.subscription_id, self.resource_group, self.azure_ai_services_name
+
+    @property
+    def is_done(self) -> bool:
+        return self.provisioning_state in TERMINAL_STATES
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "subscription_id": self.subscription_id,
+            "resource_group": self.resource_group,
+            "azure_ai_services_name": self.azure_ai_services_name,
+            "deployment_name": self.deployment_name,
+            "provisioning_state": self.provisioning_state,
+            "done": self.is_done,
+            "error": self.error,
+            "elapsed_seconds": round((self.finished_at or time.time()) - self.submitted_at, 1),
+            "deployment": self.deployment,
+        }
+
+
+class DeploymentJobTracker:
+    """
+    Registry of outstanding model deployment operations, polled in the background.
+
+    A single poll loop serves every job. Jobs on the same account are refreshed together with one
+    `deployments.list` call, accounts are polled concurrently, and each job backs off exponentially
+    (up to `POLL_MAX_INTERVAL_SECONDS`) while it stays in progress. Waiters are woken as soon as a
+    poll sees their job reach a terminal state.
+    """
+
+    def __init__(self, initial_interval: float = POLL_INITIAL_INTERVAL_SECONDS,
+                 max_interval: float = POLL_MAX_INTERVAL_SECONDS):
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self._jobs: dict[str, DeploymentJob] = {}
+        self._poll_task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def track(self, subscription_id: str, resource_group: str, azure_ai_services_name: str,
+              deployment_name: str, queued: bool = False) -> tuple[DeploymentJob, bool]:
+        """
+        Starts tracking a deployment operation. Tracking the same deployment again returns its pending job.
+
+        Args:
+            queued (bool): The operation has not been submitted yet. The job is reported as `Queued` and
+                not polled until `mark_submitted` is called.
+
+        Returns:
+            tuple[DeploymentJob, bool]: The job, and whether it was created by this call.
+        """
+        for job in self._jobs.values():
+            if not job.is_done and job.account_key == (subscription_id, resource_group, azure_ai_services_name) \
+                    and job.deployment_name == deployment_name:
+                return job, False
+
+        self._prune()
+        now = time.time()
+        job = DeploymentJob(
+            job_id=secrets.token_hex(8),
+            subscription_id=subscription_id,
+            resource_group=resource_group,
+            azure_ai_services_name=azure_ai_services_name,
+            deployment_name=deployment_name,
+            submitted_at=now,
+            provisioning_state="Queued" if queued else "Accepted",
+            poll_interval=self.initial_interval,
+            next_poll_at=math.inf if queued else now + self.initial_interval,
+        )
+        self._jobs[job.job_id] = job
+        self._ensure_polling()
+        return job, True
+
+    def mark_submitted(self, job: DeploymentJob):
+        """Starts polling a queued job once its operation has been submitted."""
+        now = time.time()
+        job.submitted_at = now
+        job.provisioning_state = "Accepted"
+        job.next_poll_at = now + job.poll_interval
+        self._ensure_polling()
+
+    def mark_failed(self, job: DeploymentJob, error: str):
+        """Settles a job whose operation could not be submitted."""
+        job.provisioning_state = "Failed"
+        job.error = error
+        job.finished_at = time.time()
+        job._done.set()
+
+    def get(self, job_id: str) -> Optional[DeploymentJob]:
+        return self._jobs.get(job_id)
+
+    def jobs(self) -> list[DeploymentJob]:
+        self._prune()
+        return list(self._jobs.values())
+
+    async def wait(self, job_ids: list[str], timeout: float,
+                   return_when: Literal["any", "all"] = "all") -> list[DeploymentJob]:
+        """
+        Waits until the given jobs reach a terminal state, or until the timeout elapses.
+
+        Args:
+            job_ids (list[str]): The jobs to wait for. Unknown IDs are ignored.
+            timeout (float): Maximum number of seconds to wait.
+            return_when (str): "all" to wait for every job, "any" to return as soon as one of them settles.
+
+        Returns:
+            list[DeploymentJob]: The known jobs, in their latest state.
+        """
+        jobs = [self._jobs[job_id] for job_id in job_ids if job_id in self._jobs]
+        pending = [asyncio.ensure_future(job._done.wait()) for job in jobs if not job.is_done]
+        if pending and timeout > 0:
+            self._ensure_polling()
+            await asyncio.wait(
+                pending, timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED if return_when == "any" else asyncio.ALL_COMPLETED,
+            )
+        for waiter in pending:
+            waiter.cancel()
+        return jobs
+
+    def _ensure_polling(self):
+        task = self._poll_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._wakeup = asyncio.Event()
+            self._poll_task = asyncio.create_task(self._poll_loop())
+        else:
+            self._wakeup.set()
+
+    async def _poll_loop(self):
+        while True:
+            pending = [job for job in self._jobs.values() if not job.is_done]
+            if not pending:
+                return
+
+            now = time.time()
+            due: dict[AccountKey, list[DeploymentJob]] = {}
+            for job in pending:
+                if job.next_poll_at <= now:
+                    due.setdefault(job.account_key, []).append(job)
+
+            if due:
+                await asyncio.gather(*(self._poll_account(key, jobs) for key, jobs in due.items()))
+                continue
+
+            self._wakeup.clear()
+            next_poll_at = min(job.next_poll_at for job in pending)
+            # Only queued jobs left: sleep until one of them is submitted
+            timeout = None if next_poll_at == math.inf else max(next_poll_at - now, 0)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll_account(self, account_key: AccountKey, jobs: list[DeploymentJob]):
+        subscription_id, resource_group, azure_ai_services_name = account_key
+        try:
+            deployments = await asyncio.to_thread(self._list_deployments, subscription_id, resource_group,
+                                                  azure_ai_services_name)
+        except Exception as e:
+            logger.warning(f"Could not poll deployments of '{azure_ai_services_name}': {e}")
+            deployments = None
+
+        now = time.time()
+        for job in jobs:
+            if deployments is not None:
+                self._update(job, deployments.get(job.deployment_name))
+            if job.is_done:
+                job.finished_at = now
+                job._done.set()
+            else:
+                job.poll_interval = min(job.poll_interval * POLL_BACKOFF_FACTOR, self.max_interval)
+                job.next_poll_at = now + job.poll_interval
+
+    @staticmethod
+    def _list_deployments(subscription_id: str, resource_group: str, azure_ai_services_name: str) -> dict[str, dict]:
+        client = get_management_client_pool().get(CognitiveServicesManagementClient, subscription_id)
+        return {
+            deployment.name: deployment.as_dict()
+            for deployment in client.deployments.list(resource_group, account_name=azure_ai_services_name)
+        }
+
+    @staticmethod
+    def _update(job: DeploymentJob, deployment: Optional[dict]):
+        if deployment is None:
+            job.provisioning_state = "NotFound"
+            job.error = f"Deployment '{job.deployment_name}' no longer exists on '{job.azure_ai_services_name}'"
+            return
+
+        job.deployment = deployment
+        job.provisioning_state = (deployment.get("properties") or {}).get("provisioning_state") or job.provisioning_state
+
+    def _prune(self):
+        cutoff = time.time() - JOB_RETENTION_SECONDS
+        expired = [job_id for job_id, job in self._jobs.items() if job.finished_at is not None and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+_deployment_jobs: Optional[DeploymentJobTracker] = None
+
+
+def get_deployment_job_tracker() -> DeploymentJobTracker:
+    """Returns the process-wide tracker of model deployment operations."""
+    global _deployment_jobs
+    if _deployment_jobs is None:
+        _deployment_jobs = DeploymentJobTracker()
+    return _deployment_jobs
@@ -0,0 +1,125 @@
+import asyncio
+import logging
+import os
+from typing import Optional
+
+import httpx
+from mcp.server.fastmcp import Context
+
+from .http_client import CachedResponse, conditional_get_json
+from .utils import get_client_headers_info, labs_api_url
+
+logger = logging.getLogger("mcp_foundry")
+
+LABS_CACHE_TTL_SECONDS = float(os.environ.get("LABS_CACHE_TTL_SECONDS", "300"))
+
+
+class LabsProjectRegistry:
+    """
+    Cached registry of the Azure AI Foundry Labs projects.
+
+    The project list is kept in memory with a name → project dict and revalidated with a conditional
+    GET once it is older than the TTL. Whenever the list changes, the `/implementation` payload of
+    every project is prefetched in the background, so Labs lookups are answered locally.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._projects: Optional[CachedResponse] = None
+        self._projects_by_name: dict[str, dict] = {}
+        self._implementations: dict[str, CachedResponse] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._prefetch_task: Optional[asyncio.Task] = None
+
+    async def get_projects(self, ctx: Context) -> list[dict]:
+        """
+        Returns the Labs projects, revalidating the cached list when it is older than the TTL.
+
+        A stale list keeps being served if revalidation fails.
+
+        Raises:
+            httpx.HTTPError: If the list can't be fetched and nothing is cached yet.
+        """
+        if self._projects is None or self._projects.age() > self.ttl_seconds:
+            task = self._refresh_task
+            if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+                task = self._refresh_task = asyncio.create_task(self._refresh_projects(ctx))
+            try:
+                await asyncio.shield(task)
+            except Exception as e:
+                if self._projects is None:
+                    raise
+                logger.warning(f"Serving stale Labs projects, revalidation failed: {e}")
+
+        return self._projects.body["projects"]
+
+    async def get_project(self, ctx: Context, name: str) -> Optional[dict]:
+        """Returns the Labs project with the given name, or None if there is no such project."""
+        await self.get_projects(ctx)
+        return self._projects_by_name.get(name)
+
+    async def get_implementation(self, ctx: Context, name: str) -> dict:
+        """
+        Returns the `/implementation` payload of a Labs project, from the prefetched cache when possible.
+
+        Raises:
+            httpx.HTTPError: If the payload can't be fetched and nothing is cached yet.
+        """
+        cached = self._implementations.get(name)
+        if cached is None or cached.age() > self.ttl_seconds:
+            try:
+                cached = await self._fetch_implementation(ctx, name)
+            except Exception:
+                if cached is None:
+                    raise
+                logger.warning(f"Serving stale implementation for Labs project '{name}'")
+        return cached.body
+
+    async def _refresh_projects(self, ctx: Context):
+        previous = self._projects
+        projects = await conditional_get_json(f"{labs_api_url}/projects?source=afl", get_client_headers_info(ctx), previous)
+
+        if previous is not None and projects.body is previous.body:
+            self._projects = projects
+            return
+
+        self._projects_by_name = {project["name"]: project for project in projects.body["projects"]}
+        self._projects = projects
+        logger.info(f"Labs project registry loaded {len(self._projects_by_name)} projects")
+
+        self._prefetch_task = asyncio.create_task(self._prefetch_implementations(ctx, list(self._projects_by_name)))
+
+    async def _fetch_implementation(self, ctx: Context, name: str) -> CachedResponse:
+        cached = await conditional_get_json(
+            f"{labs_api_url}/projects/{name}/implementation", get_client_headers_info(ctx), self._implementations.get(name)
+        )
+        self._implementations[name] = cached
+        return cached
+
+    async def _prefetch_implementations(self, ctx: Context, names: list[str]):
+        results = await asyncio.gather(*(self._fetch_implementation(ctx, name) for name in names), return_exceptions=True)
+        failures = [name for name, result in zip(names, results) if isinstance(result, Exception)]
+        if failures:
+            logger.warning(f"Could not prefetch implementations for Labs projects: {', '.join(failures)}")
+
+
+_labs_registry: Optional[LabsProjectRegistry] = None
+
+
+def get_labs_registry() -> LabsProjectRegistry:
+    """Returns the process-wide Labs project registry."""
+    global _labs_registry
+    if _labs_registry is None:
+        _labs_registry = LabsProjectRegistry(LABS_CACHE_TTL_SECONDS)
+    return _labs_registry
+
+
+async def get_code_sample_for_labs_model(model_name: str, ctx: Context) -> str:
+    try:
+        implementation = await get_labs_registry().get_implementation(ctx, model_name)
+        return implementation['project']
+    except httpx.HTTPStatusError as e:
+        return f"Error fetching projects from API: {e.response.status_code}"
+    except Exception as e:
+        logger.error(f"Exception in get_code_sample_for_labs_model: {e}")
+        return f"Exception: {e}"
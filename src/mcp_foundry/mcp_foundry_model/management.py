@@ -0,0 +1,164 @@
+import logging
+import os
+import threading
+import time
+from typing import Any, Optional, TypeVar
+
+from azure.core.credentials import AccessToken, TokenCredential
+from azure.identity import DefaultAzureCredential
+
+from mcp_foundry.mcp_server import on_shutdown
+
+logger = logging.getLogger("mcp_foundry")
+
+# Tokens are renewed in the background once they get this close to expiring
+TOKEN_REFRESH_MARGIN_SECONDS = float(os.environ.get("AZURE_TOKEN_REFRESH_MARGIN_SECONDS", "300"))
+# Below this remaining lifetime the caller waits for a new token instead of using the current one
+TOKEN_MIN_LIFETIME_SECONDS = 30.0
+
+ClientT = TypeVar("ClientT")
+
+
+class CachedTokenCredential:
+    """
+    Token credential wrapper that caches access tokens per scope set and renews them before they expire.
+
+    `DefaultAzureCredential` probes its whole credential chain, and some of its members (e.g. the
+    Azure CLI) don't cache tokens at all, so every management client used to pay for a fresh token.
+    Here a token is requested once per scope set, shared by every client, and renewed on a
+    background thread once it is within `refresh_margin_seconds` of expiring, so callers don't wait.
+    """
+
+    def __init__(self, credential: TokenCredential, refresh_margin_seconds: float = TOKEN_REFRESH_MARGIN_SECONDS):
+        self._credential = credential
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self._tokens: dict[tuple, AccessToken] = {}
+        self._refreshing: set[tuple] = set()
+        self._lock = threading.Lock()
+
+    def get_token(self, *scopes: str, claims: Optional[str] = None, tenant_id: Optional[str] = None,
+                  **kwargs: Any) -> AccessToken:
+        if claims:
+            # Claims challenges must always reach the underlying credential
+            return self._credential.get_token(*scopes, claims=claims, tenant_id=tenant_id, **kwargs)
+
+        key = (tenant_id, *sorted(scopes))
+        token = self._tokens.get(key)
+        remaining = token.expires_on - time.time() if token is not None else 0
+
+        if remaining > TOKEN_MIN_LIFETIME_SECONDS:
+            if remaining < self.refresh_margin_seconds:
+                self._refresh_in_background(key, scopes, tenant_id, kwargs)
+            return token
+
+        with self._lock:
+            token = self._tokens.get(key)
+            if token is None or token.expires_on - time.time() <= TOKEN_MIN_LIFETIME_SECONDS:
+                token = self._fetch(key, scopes, tenant_id, kwargs)
+        return token
+
+    def _fetch(self, key: tuple, scopes: tuple, tenant_id: Optional[str], kwargs: dict) -> AccessToken:
+        token = self._credential.get_token(*scopes, tenant_id=tenant_id, **kwargs)
+        self._tokens[key] = token
+        return token
+
+    def _refresh_in_background(self, key: tuple, scopes: tuple, tenant_id: Optional[str], kwargs: dict):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                with self._lock:
+                    self._fetch(key, scopes, tenant_id, kwargs)
+            except Exception as e:
+                # The current token is still valid; the next call retries
+                logger.warning(f"Proactive token refresh failed: {e}")
+            finally:
+                self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name="azure-token-refresh", daemon=True).start()
+
+    def close(self):
+        self._tokens.clear()
+        close = getattr(self._credential, "close", None)
+        if close is not None:
+            close()
+
+
+class ManagementClientPool:
+    """
+    Process-wide pool of Azure management clients, one per client type and subscription.
+
+    Every client shares a single `CachedTokenCredential`, so the credential chain is probed once and
+    each token is acquired once for the whole server. Clients keep their HTTP connection pools alive
+    between tool calls and are closed when the server shuts down.
+    """
+
+    def __init__(self, credential: Optional[CachedTokenCredential] = None):
+        self._credential = credential
+        self._clients: dict[tuple[type, str], Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def credential(self) -> CachedTokenCredential:
+        with self._lock:
+            if self._credential is None:
+                self._credential = CachedTokenCredential(DefaultAzureCredential())
+            return self._credential
+
+    def get(self, client_class: type[ClientT], subscription_id: str) -> ClientT:
+        """
+        Returns the pooled client of the given type for a subscription, creating it on first use.
+
+        Args:
+            client_class (type): The management client class, e.g. `CognitiveServicesManagementClient`.
+            subscription_id (str): The ID of the Azure subscription.
+
+        Returns:
+            The shared client. Callers must not close it.
+        """
+        key = (client_class, subscription_id)
+        client = self._clients.get(key)
+        if client is None:
+            credential = self.credential
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = client_class(credential=credential, subscription_id=subscription_id)
+        return client
+
+    def close(self):
+        """Closes every pooled client and the shared credential."""
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+            credential, self._credential = self._credential, None
+
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                logger.error(f"Exception closing management client: {e}")
+        if credential is not None:
+            credential.close()
+        if clients:
+            logger.info(f"Closed {len(clients)} pooled management clients")
+
+
+_management_client_pool: Optional[ManagementClientPool] = None
+
+
+def get_management_client_pool() -> ManagementClientPool:
+    """Returns the process-wide pool of Azure management clients."""
+    global _management_client_pool
+    if _management_client_pool is None:
+        _management_client_pool = ManagementClientPool()
+    return _management_client_pool
+
+
+@on_shutdown
+def close_management_clients() -> None:
+    """Closes the pooled management clients when the server stops."""
+    if _management_client_pool is not None:
+        _management_client_pool.close()
@@ -1,4 +1,8 @@
+import sys
+from dataclasses import dataclass
 from enum import Enum
+from typing import Iterable, Optional
+
 from pydantic import BaseModel
 
 class DeploymentOption(Enum):
@@ -11,6 +15,87 @@ class DeploymentOption(Enum):
     MANAGED_COMPUTE = "Managed Compute"
     LABS = "Labs"
 
+def _intern(value: Optional[str]) -> Optional[str]:
+    # Publishers, licenses and tasks repeat across thousands of summaries, keep one copy of each
+    return sys.intern(value) if isinstance(value, str) else None
+
+@dataclass(frozen=True, slots=True)
+class CatalogSummary:
+    """
+    Compact record of a model catalog summary.
+
+    Only the fields agents use are kept, together with the computed deployment options, so a mirrored
+    catalog takes a fraction of the memory of the raw catalog summaries.
+    """
+    asset_id: str
+    name: str
+    display_name: Optional[str]
+    publisher: Optional[str]
+    version: Optional[str]
+    license: Optional[str]
+    inference_tasks: tuple[str, ...]
+    summary: Optional[str]
+    openai: bool = False
+    serverless_endpoint: bool = False
+    managed_compute: bool = False
+    free_playground: bool = False
+
+    # Field names exposed to clients, matching the catalog API
+    FIELDS = ("assetId", "name", "displayName", "publisher", "version", "license", "inferenceTasks", "summary",
+              "deployment_options")
+
+    @classmethod
+    def from_summary(cls, summary: dict) -> "CatalogSummary":
+        """
+        Builds a compact record from a catalog summary, as returned by `get_models_list` or `to_dict`.
+        """
+        deployment_options = summary.get("deployment_options") or {}
+        return cls(
+            asset_id=summary.get("assetId", ""),
+            name=summary.get("name", ""),
+            display_name=summary.get("displayName"),
+            publisher=_intern(summary.get("publisher")),
+            version=summary.get("version"),
+            license=_intern(summary.get("license")),
+            inference_tasks=tuple(_intern(task) for task in summary.get("inferenceTasks") or []),
+            summary=summary.get("summary"),
+            openai=bool(deployment_options.get("openai")),
+            serverless_endpoint=bool(deployment_options.get("serverless_endpoint")),
+            managed_compute=bool(deployment_options.get("managed_compute")),
+            free_playground=bool(deployment_options.get("free_playground")),
+        )
+
+    @property
+    def deployment_options(self) -> dict[str, bool]:
+        return {
+            "openai": self.openai,
+            "serverless_endpoint": self.serverless_endpoint,
+            "managed_compute": self.managed_compute,
+            "free_playground": self.free_playground,
+        }
+
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> dict:
+        """
+        Serializes the record with the catalog field names.
+
+        Args:
+            fields (Iterable[str], optional): The fields to include, from `CatalogSummary.FIELDS`. All fields by default.
+        """
+        values = {
+            "assetId": self.asset_id,
+            "name": self.name,
+            "displayName": self.display_name,
+            "publisher": self.publisher,
+            "version": self.version,
+            "license": self.license,
+            "inferenceTasks": list(self.inference_tasks),
+            "summary": self.summary,
+            "deployment_options": self.deployment_options,
+        }
+        if fields is None:
+            return values
+        return {field: values[field] for field in fields}
+
 class ModelsList(BaseModel):
     """
     Model to store the list of models in the MCP Foundry.
@@ -18,6 +103,8 @@ class ModelsList(BaseModel):
     total_models_count: int
     fetched_models_count: int
     summaries: list[dict]
+    continuation_token: Optional[str] = None
+    next_cursor: Optional[str] = None
 
 class ModelDetails(BaseModel):
     """
@@ -27,4 +114,23 @@ class ModelDetails(BaseModel):
     code_sample_azure: str | dict | None
     code_sample_github: str | dict | None
     type: DeploymentOption
-    link: str
\ No newline at end of file
+    link: str
+
+class ModelDeploymentSpec(BaseModel):
+    """
+    Model deployment to create on an Azure AI services account as part of a provisioning request.
+    """
+    deployment_name: str
+    model_name: str
+    model_format: str
+    model_version: Optional[str] = None
+    sku_name: str = "GlobalStandard"
+    sku_capacity: int = 1
+
+class BulkDeploymentTarget(ModelDeploymentSpec):
+    """
+    Model deployment to roll out to a given Azure AI services account.
+    """
+    subscription_id: str
+    resource_group: str
+    azure_ai_services_name: str
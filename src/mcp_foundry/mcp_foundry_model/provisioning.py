@@ -0,0 +1,128 @@
+import logging
+from typing import Any, Callable
+
+from azure.core.exceptions import ResourceNotFoundError
+from azure.mgmt.cognitiveservices import CognitiveServicesManagementClient
+
+from .arm import ai_services_account_template, deploy_arm_template, foundry_project_template
+from .management import get_management_client_pool
+
+logger = logging.getLogger("mcp_foundry")
+
+
+def normalize_location(location: str) -> str:
+    """ARM reports locations lower-cased without spaces (`East US` → `eastus`)."""
+    return location.replace(" ", "").lower()
+
+
+def desired_account_state(azure_ai_services_name: str, location: str) -> dict:
+    """The settings `ai_services_account_template` gives an account, in the shape ARM returns it."""
+    return {
+        "location": normalize_location(location),
+        "kind": "AIServices",
+        "sku": {"name": "S0"},
+        "identity": {"type": "SystemAssigned"},
+        "properties": {
+            "publicNetworkAccess": "Enabled",
+            "allowProjectManagement": True,
+            "customSubDomainName": azure_ai_services_name,
+            "disableLocalAuth": False,
+        },
+    }
+
+
+def desired_project_state(location: str) -> dict:
+    """The settings `foundry_project_template` gives a project, in the shape ARM returns it."""
+    return {
+        "location": normalize_location(location),
+        "identity": {"type": "SystemAssigned"},
+    }
+
+
+def diff_state(current: Any, desired: Any, path: str = "") -> list[str]:
+    """
+    Compares a resource against its desired state.
+
+    Only the settings present in `desired` are compared, so read-only and server-managed fields of the
+    current resource are ignored. Strings are compared case-insensitively, like ARM does for enums.
+
+    Returns:
+        list[str]: The dotted paths of the settings that differ; empty when nothing would change.
+    """
+    if isinstance(desired, dict):
+        if not isinstance(current, dict):
+            return [path or "."]
+        return [
+            difference
+            for key, value in desired.items()
+            for difference in diff_state(current.get(key), value, f"{path}.{key}" if path else key)
+        ]
+
+    if isinstance(desired, str) and isinstance(current, str):
+        return [] if current.lower() == desired.lower() else [path]
+
+    return [] if current == desired else [path]
+
+
+def _ensure(kind: str, get_current: Callable[[], Any], desired: dict, deploy: Callable[[], Any]) -> tuple[Any, bool]:
+    """
+    Deploys a resource only when it is missing or differs from its desired state.
+
+    Returns:
+        tuple: The resource as it is after the call, and whether a deployment was submitted.
+    """
+    try:
+        current = get_current()
+    except ResourceNotFoundError:
+        current = None
+
+    if current is not None:
+        differences = diff_state(current.serialize(keep_readonly=True), desired)
+        if not differences:
+            logger.info(f"{kind} is already in the desired state, skipping deployment")
+            return current, False
+        logger.info(f"{kind} differs from the desired state in {', '.join(differences)}, deploying")
+
+    deploy()
+    return get_current(), True
+
+
+def ensure_ai_services_account(subscription_id: str, resource_group: str, azure_ai_services_name: str,
+                               location: str) -> tuple[Any, bool]:
+    """
+    Creates or updates an AI Services account, skipping the ARM deployment when it already has the requested settings.
+
+    Returns:
+        tuple: The account, and whether a deployment was submitted.
+    """
+    client = get_management_client_pool().get(CognitiveServicesManagementClient, subscription_id)
+    return _ensure(
+        f"Azure AI services account '{azure_ai_services_name}'",
+        lambda: client.accounts.get(resource_group, azure_ai_services_name),
+        desired_account_state(azure_ai_services_name, location),
+        lambda: deploy_arm_template(subscription_id, resource_group, ai_services_account_template(), {
+            "ai_services_name": azure_ai_services_name,
+            "location": location,
+        }),
+    )
+
+
+def ensure_foundry_project(subscription_id: str, resource_group: str, azure_ai_services_name: str,
+                           project_name: str, location: str) -> tuple[Any, bool]:
+    """
+    Creates or updates a Foundry project, skipping the ARM deployment when it already has the requested settings.
+
+    Returns:
+        tuple: The project, and whether a deployment was submitted.
+    """
+    client = get_management_client_pool().get(CognitiveServicesManagementClient, subscription_id)
+    return _ensure(
+        f"Foundry project '{project_name}'",
+        lambda: client.projects.get(resource_group, azure_ai_services_name, project_name),
+        desired_project_state(location),
+        lambda: deploy_arm_template(subscription_id, resource_group, foundry_project_template(), {
+            "ai_services_name": azure_ai_services_name,
+            "project_name": project_name,
+            "location": location,
+        }),
+    )
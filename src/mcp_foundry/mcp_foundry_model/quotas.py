@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import os
+import time
+from typing import Iterable, Optional
+
+from azure.mgmt.cognitiveservices import CognitiveServicesManagementClient
+
+from .management import get_management_client_pool
+
+logger = logging.getLogger("mcp_foundry")
+
+QUOTA_CACHE_TTL_SECONDS = float(os.environ.get("MODEL_QUOTA_CACHE_TTL_SECONDS", "300"))
+QUOTA_SCAN_CONCURRENCY = int(os.environ.get("MODEL_QUOTA_SCAN_CONCURRENCY", "16"))
+
+# Regions offering Azure OpenAI / AI services model deployments, scanned when no region is given
+DEFAULT_QUOTA_LOCATIONS = (
+    "australiaeast", "brazilsouth", "canadaeast", "eastus", "eastus2", "francecentral", "germanywestcentral",
+    "italynorth", "japaneast", "koreacentral", "northcentralus", "norwayeast", "polandcentral", "southafricanorth",
+    "southcentralus", "southindia", "spaincentral", "swedencentral", "switzerlandnorth", "uaenorth", "uksouth",
+    "westeurope", "westus", "westus3",
+)
+
+QuotaKey = tuple[str, str]
+
+
+class QuotaCache:
+    """
+    Short-lived cache of the model quota usages of each subscription and region.
+
+    Usages are listed through the pooled management client on worker threads, so many regions are
+    fetched concurrently (bounded by `concurrency`), and concurrent requests for the same region
+    share one call.
+    """
+
+    def __init__(self, ttl_seconds: float = QUOTA_CACHE_TTL_SECONDS, concurrency: int = QUOTA_SCAN_CONCURRENCY):
+        self.ttl_seconds = ttl_seconds
+        self.concurrency = concurrency
+        self._usages: dict[QuotaKey, tuple[float, list[dict]]] = {}
+        self._pending: dict[QuotaKey, asyncio.Task] = {}
+        self._semaphores: dict[asyncio.AbstractEventLoop, asyncio.Semaphore] = {}
+
+    async def get_usages(self, subscription_id: str, location: str) -> list[dict]:
+        """
+        Returns the quota usages of a region, from the cache when they are younger than the TTL.
+
+        Raises:
+            HttpResponseError: If the usages can't be listed.
+        """
+        key = (subscription_id, location)
+        cached = self._usages.get(key)
+        if cached is not None and time.monotonic() - cached[0] <= self.ttl_seconds:
+            return cached[1]
+
+        task = self._pending.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._fetch(key))
+            self._pending[key] = task
+            task.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(task)
+
+    def invalidate(self, subscription_id: str, location: str):
+        """Drops the cached usages of a region, e.g. after a deployment consumed some of its quota."""
+        self._usages.pop((subscription_id, location), None)
+
+    async def scan(self, subscription_id: str, locations: Iterable[str]) -> tuple[dict[str, list[dict]], dict[str, str]]:
+        """
+        Fetches the usages of several regions concurrently.
+
+        Returns:
+            tuple: The usages by region, and an error message by region for the regions that failed.
+        """
+        locations = list(dict.fromkeys(locations))
+        results = await asyncio.gather(
+            *(self.get_usages(subscription_id, location) for location in locations), return_exceptions=True
+        )
+
+        usages, errors = {}, {}
+        for location, result in zip(locations, results):
+            if isinstance(result, Exception):
+                errors[location] = str(result)
+            else:
+                usages[location] = result
+        return usages, errors
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            self._semaphores = {loop: asyncio.Semaphore(self.concurrency)}
+            semaphore = self._semaphores[loop]
+        return semaphore
+
+    async def _fetch(self, key: QuotaKey) -> list[dict]:
+        async with self._semaphore():
+            usages = await asyncio.to_thread(self._list_usages, *key)
+        self._usages[key] = (time.monotonic(), usages)
+        return usages
+
+    @staticmethod
+    def _list_usages(subscription_id: str, location: str) -> list[dict]:
+        client = get_management_client_pool().get(CognitiveServicesManagementClient, subscription_id)
+        return [usage.as_dict() for usage in client.usages.list(location)]
+
+
+def parse_usage_name(usage: dict) -> Optional[tuple[str, str]]:
+    """
+    Splits a model usage name such as `OpenAI.GlobalStandard.gpt-4o` into its SKU and model.
+
+    Returns:
+        Optional[tuple[str, str]]: `(sku, model)`, or None for usages that are not per-model (e.g. account counts).
+    """
+    value = (usage.get("name") or {}).get("value") or ""
+    parts = value.split(".", 2)
+    if len(parts) != 3:
+        return None
+    return parts[1], parts[2]
+
+
+def build_quota_matrix(usages_by_location: dict[str, list[dict]], model_name: str = "", sku_name: str = "",
+                       min_available: float = 0) -> dict[str, dict[str, dict[str, dict]]]:
+    """
+    Aggregates regional usages into a model → SKU → region availability matrix.
+
+    Args:
+        usages_by_location (dict): Usages by region, as returned by `QuotaCache.scan`.
+        model_name (str): Only keep this model (case-insensitive) when set.
+        sku_name (str): Only keep this SKU (case-insensitive) when set.
+        min_available (float): Only keep regions with at least this much free quota.
+
+    Returns:
+        dict: `{model: {sku: {region: {"current_value", "limit", "available"}}}}`.
+    """
+    matrix: dict[str, dict[str, dict[str, dict]]] = {}
+    for location, usages in usages_by_location.items():
+        for usage in usages:
+            parsed = parse_usage_name(usage)
+            if parsed is None:
+                continue
+            sku, model = parsed
+            if model_name and model.lower() != model_name.lower():
+                continue
+            if sku_name and sku.lower() != sku_name.lower():
+                continue
+
+            current_value, limit = usage.get("current_value") or 0, usage.get("limit") or 0
+            available = max(limit - current_value, 0)
+            if available < min_available:
+                continue
+
+            matrix.setdefault(model, {}).setdefault(sku, {})[location] = {
+                "current_value": current_value,
+                "limit": limit,
+                "available": available,
+            }
+    return matrix
+
+
+_quota_cache: Optional[QuotaCache] = None
+
+
+def get_quota_cache() -> QuotaCache:
+    """Returns the process-wide quota usage cache."""
+    global _quota_cache
+    if _quota_cache is None:
+        _quota_cache = QuotaCache()
+    return _quota_cache
@@ -1,10 +1,12 @@
 from mcp.server.fastmcp import Context
 from mcp_foundry.mcp_server import mcp
-import requests
+import asyncio
 import os
+import httpx
 import sys
+import time
 import logging
-from typing import Optional
+from typing import Literal, Optional
 
 from azure.mgmt.cognitiveservices.models import (
     Deployment,
@@ -14,19 +16,32 @@ from azure.mgmt.cognitiveservices.models import (
     Sku,
 )
 
-from .models import ModelDetails
+from .arm import deploy_arm_template, foundry_stack_template
+from .bulk import get_bulk_deployment_scheduler
+from .catalog import get_catalog_page, get_catalog_page_for_cursor, get_model_catalog
+from .http_client import get_resource_cache
+from .inventory import filter_deployments, get_fleet_inventory
+from .jobs import get_deployment_job_tracker
+from .labs import get_code_sample_for_labs_model, get_labs_registry
+from .models import BulkDeploymentTarget, CatalogSummary, ModelDeploymentSpec, ModelDetails
+from .provisioning import ensure_ai_services_account, ensure_foundry_project
+from .quotas import DEFAULT_QUOTA_LOCATIONS, build_quota_matrix, get_quota_cache
 from .utils import (
-    deploy_inline_bicep_template,
+    FETCH_TIMEOUT_SECONDS,
+    fetch_with_timeout,
     get_client_headers_info,
     get_code_sample_for_deployment_under_ai_services,
     get_code_sample_for_github_model,
-    get_code_sample_for_labs_model,
     get_cognitiveservices_client,
+    get_model_registry_details,
     get_models_list,
 )
 
 labs_api_url = os.environ.get("LABS_API_URL", "https://foundry-labs-mcp-api.azurewebsites.net/api/v1")
 
+# Budget for reading the catalog mirror, leaving the rest of the lookup timeout for the catalog query
+MIRROR_LOOKUP_TIMEOUT_SECONDS = 2.0
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -36,7 +51,11 @@ logging.basicConfig(
 logger = logging.getLogger("mcp_foundry_model")
 
 @mcp.tool()
-async def list_models_from_model_catalog(ctx: Context, search_for_free_playground: bool = False, publisher_name = "", license_name = "") -> str:
+async def list_models_from_model_catalog(ctx: Context, search_for_free_playground: bool = False,
+                                         publisher_name: str | list[str] = "", license_name: str | list[str] = "",
+                                         inference_task: str | list[str] = "", deployment_option: str | list[str] = "",
+                                         model_name_prefix: str = "", fields: Optional[list[str]] = None,
+                                         cursor: str = "") -> str:
     """
     Retrieves a list of supported models from the Azure AI Foundry catalog.
 
@@ -49,34 +68,96 @@ async def list_models_from_model_catalog(ctx: Context, search_for_free_playgroun
         search_for_free_playground (bool, optional): If `True`, filters models to include only those that
             can be used for free by users for prototyping. If `False`, all models will be included regardless of free playground support.
             Defaults to `False`.
-        publisher_name (str, optional): A filter to specify the publisher of the models to retrieve. If provided,
-            only models from this publisher will be returned. Defaults to an empty string, meaning no filter is applied.
-        license_name (str, optional): A filter to specify the license type of the models to retrieve. If provided,
-            only models with this license will be returned. Defaults to an empty string, meaning no filter is applied.
+        publisher_name (str | list[str], optional): A filter to specify the publisher(s) of the models to retrieve. If provided,
+            only models from these publishers will be returned. Defaults to an empty string, meaning no filter is applied.
+        license_name (str | list[str], optional): A filter to specify the license type(s) of the models to retrieve. If provided,
+            only models with one of these licenses will be returned. Defaults to an empty string, meaning no filter is applied.
+        inference_task (str | list[str], optional): A filter on the inference task(s) supported by the models,
+            e.g. `chat-completion` or `embeddings`. Defaults to an empty string, meaning no filter is applied.
+        deployment_option (str | list[str], optional): A filter on how the models can be deployed. One or more of
+            `openai`, `serverless_endpoint`, `managed_compute` and `free_playground`. Defaults to an empty string, meaning no filter is applied.
+        model_name_prefix (str, optional): Only return models whose name starts with this prefix (case-insensitive),
+            e.g. `Phi-4`. Defaults to an empty string, meaning no filter is applied.
+        fields (list[str], optional): The fields to return for each model, from `assetId`, `name`, `displayName`,
+            `publisher`, `version`, `license`, `inferenceTasks`, `summary` and `deployment_options`.
+            Defaults to all of them. Request only the fields you need to keep large listings small.
+        cursor (str, optional): The `next_cursor` returned by a previous call, to fetch the next page of that listing.
+            When a cursor is given, the filters and fields of the original call are reused and the other parameters are ignored.
 
     Returns:
         str: A JSON-encoded string containing the list of models and their metadata. The list will include 
              model names, inference model names, summaries, and the total count of models retrieved.
+             When more models match than fit in one response, `next_cursor` holds the cursor for the next page.
 
     Usage:
         Use this function when users inquire about available models from the Azure AI Foundry catalog.
-        It can also be used when filtering models by free playground usage, publisher name, or license type.
+        It can also be used when filtering models by free playground usage, publisher name, license type, inference task or deployment option.
+        Filters can be combined, and each filter can take several values that are matched with OR.
+        To go through more models than a single response holds, call this function again with the returned `next_cursor`.
         If user didn't specify free playground or ask for models that support GitHub token, always explain that by default it will show the all the models but some of them would support free playground.
         Explain to the user that if they want to find models suitable for prototyping and free to use with support for free playground, they can look for models that supports free playground, or look for models that they can use with GitHub token.
     """
-    max_pages = 3
-    # Note: if max_pages becomes larger, the agent will find it more difficult to "summarize" the result, which may not be desired.
-    # max_pages = 10
-
-    logger.debug("Calling get_models_list with parameters:")
+    max_models = 150
+    # Note: if max_models becomes larger, the agent will find it more difficult to "summarize" the result, which may not be desired.
+
+    if cursor:
+        try:
+            models_list = await get_catalog_page_for_cursor(ctx, cursor)
+        except Exception as e:
+            logger.error(f"Exception fetching the catalog page for cursor '{cursor}': {e}")
+            return f"Could not fetch the page for cursor '{cursor}'. Retry with the same cursor."
+        if models_list is None:
+            return f"Cursor '{cursor}' is unknown or has expired. List the models again without a cursor."
+        return models_list.json(exclude={"continuation_token"})
+
+    logger.debug("Listing models from the catalog mirror with parameters:")
     logger.debug(f"search_for_free_playground: {search_for_free_playground}")
     logger.debug(f"publisher_name: {publisher_name}")
     logger.debug(f"license_name: {license_name}")
-    logger.debug(f"max_pages: {max_pages}")
+    logger.debug(f"inference_task: {inference_task}")
+    logger.debug(f"deployment_option: {deployment_option}")
+    logger.debug(f"model_name_prefix: {model_name_prefix}")
+    logger.debug(f"fields: {fields}")
+    logger.debug(f"max_models: {max_models}")
+
+    unknown_fields = [field for field in fields or [] if field not in CatalogSummary.FIELDS]
+    if unknown_fields:
+        return f"Unknown fields requested: {', '.join(unknown_fields)}. Valid fields are: {', '.join(CatalogSummary.FIELDS)}"
+
+    catalog_index = await get_model_catalog().get_index(ctx)
+
+    if catalog_index is None:
+        # The mirror could not be populated, fall back to paging through the catalog directly.
+        # The remote API only supports a single publisher and license value.
+        publisher_name = publisher_name if isinstance(publisher_name, str) else next(iter(publisher_name), "")
+        license_name = license_name if isinstance(license_name, str) else next(iter(license_name), "")
+        state = {
+            "filters": {
+                "search_for_free_playground": search_for_free_playground,
+                "publisher_name": publisher_name,
+                "license_name": license_name,
+            },
+            "local_filters": {
+                "inference_task": inference_task,
+                "deployment_option": deployment_option,
+                "model_name_prefix": model_name_prefix,
+            },
+            "fields": fields,
+        }
+    else:
+        matches = catalog_index.search(
+            search_for_free_playground=search_for_free_playground,
+            publisher_name=publisher_name,
+            license_name=license_name,
+            inference_task=inference_task,
+            deployment_option=deployment_option,
+            model_name_prefix=model_name_prefix,
+        )
+        state = {"matches": matches, "offset": 0, "page_size": max_models, "fields": fields}
 
-    models_list = get_models_list(ctx, search_for_free_playground, publisher_name, license_name, max_pages)
+    models_list = await get_catalog_page(ctx, state)
 
-    return models_list.json()
+    return models_list.json(exclude={"continuation_token"})
 
 @mcp.tool()
 async def list_azure_ai_foundry_labs_projects(ctx: Context):
@@ -99,15 +180,10 @@ async def list_azure_ai_foundry_labs_projects(ctx: Context):
         - The list returned may change frequently as new models and projects are developed and made available for exploration.
     """
 
-    headers = get_client_headers_info(ctx)
-
-    response = requests.get(f"{labs_api_url}/projects?source=afl", headers=headers)
-    if response.status_code != 200:
-        return f"Error fetching projects from API: {response.status_code}"
-
-    project_response = response.json()
-
-    return project_response["projects"]
+    try:
+        return await get_labs_registry().get_projects(ctx)
+    except httpx.HTTPStatusError as e:
+        return f"Error fetching projects from API: {e.response.status_code}"
 
 @mcp.tool()
 async def get_model_details_and_code_samples(model_name: str, ctx: Context):
@@ -138,8 +214,6 @@ async def get_model_details_and_code_samples(model_name: str, ctx: Context):
         Call this function when you need to retrieve detailed information about a model using its asset ID. 
         This is useful when users inquire about a model's features, or when specific metadata about a model is required.
     """
-    headers = get_client_headers_info(ctx)
-
     #TODO: Have link go to actual model card not just generic site
     model_details = {
         "details": {},
@@ -149,59 +223,95 @@ async def get_model_details_and_code_samples(model_name: str, ctx: Context):
         "link": "https://ai.azure.com/explore/models"
     }
 
-    response = requests.get(f"{labs_api_url}/projects?source=afl", headers=headers)
-    if response.status_code != 200:
-        return f"Error fetching projects from API: {response.status_code}"
-
-    project_response = response.json()
-
-    project_names = [project["name"] for project in project_response["projects"]]
+    async def resolve_catalog_summary():
+        # The mirror only answers when it is already loaded; a cold mirror is warmed in the background
+        # while the filtered catalog query answers this call.
+        catalog_index = await fetch_with_timeout(get_model_catalog().get_loaded_index(ctx),
+                                                 "reading the model catalog mirror", MIRROR_LOOKUP_TIMEOUT_SECONDS)
+        summary = catalog_index.lookup_name(model_name) if catalog_index is not None else None
+        if summary is not None:
+            return summary
+        models_list = await get_models_list(ctx, model_name=model_name)
+        if models_list is None:
+            raise RuntimeError("The model catalog returned an invalid response")
+        if not models_list.summaries:
+            return None
+        return CatalogSummary.from_summary(models_list.summaries[0])
+
+    # The Labs project lookup and the catalog lookup are independent. A failing Labs API
+    # only means the model can't be matched against Labs projects.
+    labs_project, model_list_details = await asyncio.gather(
+        fetch_with_timeout(get_labs_registry().get_project(ctx, model_name), "looking up Labs projects"),
+        asyncio.wait_for(resolve_catalog_summary(), FETCH_TIMEOUT_SECONDS),
+        return_exceptions=True,
+    )
 
-    if model_name in project_names:
-        model_details["details"] = project_response["projects"][project_names.index(model_name)]
+    if labs_project is not None:
+        model_details["details"] = labs_project
         model_details["code_sample_github"] = await get_code_sample_for_labs_model(model_name, ctx)
         model_details["type"] = "Labs"
         model_details["link"] = "https://ai.azure.com/labs"
         return ModelDetails(**model_details)
-    
-    model_list_details = get_models_list(ctx, model_name=model_name)
-    if model_list_details.fetched_models_count == 0:
+
+    if isinstance(model_list_details, Exception):
+        return f"Could not look up model '{model_name}' in the catalog: {model_list_details!r}. Please try again."
+    if model_list_details is None:
         return f"Model '{model_name}' not found in the catalog."
-    
-    model_list_details  = model_list_details.summaries[0]
 
-    response = requests.get(f"https://ai.azure.com/api/westus2/modelregistry/v1.0/registry/models?assetIdOrReference={model_list_details['assetId']}", headers=headers)
-    if response.status_code != 200:
-        return f"Error fetching model details from API: {response.status_code}"
+    async def no_fetch():
+        return None
+
+    azure_code_sample_needed = model_list_details.openai or model_list_details.serverless_endpoint
+
+    # Once the assetId is known, the registry details and the code samples are fetched together.
+    # The GitHub guidance is fetched speculatively for models the catalog lists with a free playground.
+    details, code_sample_github, code_sample_azure = await asyncio.gather(
+        fetch_with_timeout(get_model_registry_details(model_list_details.asset_id, ctx),
+                           f"fetching model registry details for '{model_name}'"),
+        fetch_with_timeout(get_code_sample_for_github_model(model_list_details.publisher, model_list_details.name, ctx),
+                           f"fetching GitHub guidance for '{model_name}'")
+        if model_list_details.free_playground else no_fetch(),
+        fetch_with_timeout(get_code_sample_for_deployment_under_ai_services(model_list_details.name, model_list_details.inference_tasks[0], "<your-aoai-endpoint>", "<your-deployment-name>"),
+                           f"fetching code sample for '{model_name}'")
+        if azure_code_sample_needed and model_list_details.inference_tasks else no_fetch(),
+    )
 
-    model_details["details"] = response.json()
+    if details is not None:
+        model_details["details"] = details
+        free_playground = (details.get("kvTags") or {}).get("freePlayground") == "true"
+    else:
+        # Partial result: describe the model from its catalog summary
+        model_details["details"] = model_list_details.to_dict()
+        free_playground = model_list_details.free_playground
 
     # Free playground model add GH guidance to model details
-    if "freePlayground" in model_details['details']['kvTags'] and model_details['details']['kvTags']["freePlayground"] == "true":
+    if free_playground:
         model_details["type"] = "Free Playground"
-        model_details["code_sample_github"] = await get_code_sample_for_github_model(model_list_details["publisher"], model_list_details["name"], ctx)
+        if code_sample_github is None:
+            code_sample_github = await get_code_sample_for_github_model(model_list_details.publisher, model_list_details.name, ctx)
+        model_details["code_sample_github"] = code_sample_github
 
     # OpenAI model add OpenAI guidance to model details
-    if model_list_details["deployment_options"]["openai"]:
+    if model_list_details.openai:
         if not model_details["type"] == "Free Playground":
             model_details["type"] = "OpenAI"
-        model_details["code_sample_azure"] = get_code_sample_for_deployment_under_ai_services(model_list_details["name"], model_list_details['inferenceTasks'][0], "<your-aoai-endpoint>", "<your-deployment-name>")
+        model_details["code_sample_azure"] = code_sample_azure
 
     # PayGo model add PayGo guidance to model details
-    elif model_list_details["deployment_options"]["serverless_endpoint"]:
+    elif model_list_details.serverless_endpoint:
         if not model_details["type"] == "Free Playground":
             model_details["type"] = "Serverless Endpoint"
-        model_details["code_sample_azure"] = get_code_sample_for_deployment_under_ai_services(model_list_details["name"],model_list_details['inferenceTasks'][0], "<your-aoai-endpoint>", "<your-deployment-name>")
+        model_details["code_sample_azure"] = code_sample_azure
 
     # Managed compute model add managed compute guidance to model details
-    elif model_list_details["deployment_options"]["managed_compute"]:
+    elif model_list_details.managed_compute:
         model_details["type"] = "Managed Compute"
         pass
 
     return ModelDetails(**model_details)
 
 @mcp.tool()
-def get_prototyping_instructions_for_github_and_labs(ctx: Context) -> str:
+async def get_prototyping_instructions_for_github_and_labs(ctx: Context) -> str:
     """
     Provides comprehensive instructions and setup guidance for starting to work with models from Azure AI Foundry and Azure AI Foundry Labs.
 
@@ -231,15 +341,17 @@ def get_prototyping_instructions_for_github_and_labs(ctx: Context) -> str:
     """
 
     headers = get_client_headers_info(ctx)
-    response = requests.get(f"{labs_api_url}/resources/resource/copilot-instructions.md", headers=headers)
-    if response.status_code != 200:
-        return f"Error fetching instructions from API: {response.status_code}"
+    try:
+        copilot_instructions = await get_resource_cache().get(
+            f"{labs_api_url}/resources/resource/copilot-instructions.md", headers
+        )
+    except httpx.HTTPStatusError as e:
+        return f"Error fetching instructions from API: {e.response.status_code}"
 
-    copilot_instructions = response.json()
     return copilot_instructions["resource"]
 
 @mcp.tool()
-def get_model_quotas(subscription_id: str, location: str) -> list[dict]:
+async def get_model_quotas(subscription_id: str, location: str) -> list[dict]:
     """Get model quotas for a specific Azure location.
 
     Args:
@@ -255,11 +367,42 @@ def get_model_quotas(subscription_id: str, location: str) -> list[dict]:
         You should ensure that you use a valid subscription id.
     """
 
-    client = get_cognitiveservices_client(subscription_id)
-    return [usage.as_dict() for usage in client.usages.list(location)]
+    return await get_quota_cache().get_usages(subscription_id, location)
+
+@mcp.tool()
+async def scan_model_quotas(
+    subscription_id: str,
+    locations: Optional[list[str]] = None,
+    model_name: str = "",
+    sku_name: str = "",
+    min_available: int = 0,
+) -> dict:
+    """Scan model quotas across many Azure locations at once and return a model/SKU/region availability matrix.
+
+    Args:
+        subscription_id: The ID of the Azure subscription. This is string
+            with the format `xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx`
+        locations: (Optional) The Azure locations to scan. Defaults to every region offering Azure OpenAI models.
+        model_name: (Optional) Only report this model, e.g. "gpt-4o".
+        sku_name: (Optional) Only report this deployment SKU, e.g. "GlobalStandard".
+        min_available: (Optional) Only report regions with at least this much free quota.
+
+    Returns:
+        dict: `quotas` maps model → SKU → location → `current_value`, `limit` and `available`;
+            `errors` maps the locations that could not be scanned to the reason.
+
+    Usage:
+        Call this instead of `get_model_quotas` once per region when choosing where to deploy a model.
+    """
+
+    usages, errors = await get_quota_cache().scan(subscription_id, locations or DEFAULT_QUOTA_LOCATIONS)
+    return {
+        "quotas": build_quota_matrix(usages, model_name=model_name, sku_name=sku_name, min_available=min_available),
+        "errors": errors,
+    }
 
 @mcp.tool()
-def create_azure_ai_services_account(
+async def create_azure_ai_services_account(
     subscription_id: str,
     resource_group: str,
     azure_ai_services_name: str,
@@ -268,6 +411,7 @@ def create_azure_ai_services_account(
     """Create an Azure AI services account.
 
     The created Azure AI services account can be used to create a Foundry Project.
+    Safe to call repeatedly: if the account already exists with these settings, it is returned without redeploying.
 
     Args:
         resource_group: The name of the resource group to create the account in.
@@ -280,42 +424,10 @@ def create_azure_ai_services_account(
         dict: The created Azure AI services account.
     """
 
-    bicep_template = f"""
-param ai_services_name string = '{azure_ai_services_name}'
-param location string = 'eastus'
-
-resource account 'Microsoft.CognitiveServices/accounts@2025-04-01-preview' = {{
-  name: ai_services_name
-  location: location
-  identity: {{
-    type: 'SystemAssigned'
-  }}
-  kind: 'AIServices'
-  sku: {{
-    name: 'S0'
-  }}
-  properties: {{
-    // Networking
-    publicNetworkAccess: 'Enabled'
-
-    // Specifies whether this resource support project management as child resources, used as containers for access management, data isolation, and cost in AI Foundry.
-    allowProjectManagement: true
-
-    // Defines developer API endpoint subdomain
-    customSubDomainName: ai_services_name
-
-    // Auth
-    disableLocalAuth: false
-  }}
-}}
-"""
-
-    # TODO: Use the Python SDK once the update is released
-    deploy_inline_bicep_template(subscription_id, resource_group, bicep_template)
-
-    client = get_cognitiveservices_client(subscription_id)
-
-    return client.accounts.get(resource_group, azure_ai_services_name)
+    account, _ = await asyncio.to_thread(
+        ensure_ai_services_account, subscription_id, resource_group, azure_ai_services_name, location
+    )
+    return account
 
 @mcp.tool()
 def list_deployments_from_azure_ai_services(subscription_id: str, resource_group: str, azure_ai_services_name: str) -> list[dict]:
@@ -356,7 +468,7 @@ async def deploy_model_on_ai_services(
     sku_capacity: Optional[int] = None,
     scale_type: Optional[str] = None,
     scale_capacity: Optional[int] = None,
-) -> Deployment:
+) -> dict:
     """Deploy a model to Azure AI.
 
     This function is used to deploy a model on Azure AI Services, allowing users to integrate the model into their applications and utilize its capabilities.
@@ -378,7 +490,9 @@ async def deploy_model_on_ai_services(
         scale_capacity: (Optional) The scale capacity for the deployment.
 
     Returns:
-        Deployment: The deployment object created or updated.
+        dict: The deployment job tracking the operation. Pass its `job_id` to `get_deployment_job_status`
+            to follow the deployment until it succeeds or fails. If a deployment with this name is already
+            in progress, its job is returned with a `skipped` note and nothing is submitted.
     """
 
     model = DeploymentModel(
@@ -405,26 +519,78 @@ async def deploy_model_on_ai_services(
         scale_settings=scale_settings,
     )
 
+    tracker = get_deployment_job_tracker()
+    # Claim the deployment before submitting, so a rollout already queued for it isn't overwritten
+    job, created = tracker.track(subscription_id, resource_group, azure_ai_services_name, deployment_name,
+                                 queued=True)
+    if not created:
+        return {**job.to_dict(), "skipped": "A deployment with this name is already in progress"}
+
     client = get_cognitiveservices_client(subscription_id)
 
-    return client.deployments.begin_create_or_update(
-        resource_group,
-        azure_ai_services_name,
-        deployment_name,
-        deployment=Deployment(properties=properties, sku=sku),
-        polling=False,
-    )
+    try:
+        await asyncio.to_thread(
+            client.deployments.begin_create_or_update,
+            resource_group,
+            azure_ai_services_name,
+            deployment_name,
+            deployment=Deployment(properties=properties, sku=sku),
+            polling=False,
+        )
+    except Exception as e:
+        tracker.mark_failed(job, str(e))
+        raise
+
+    tracker.mark_submitted(job)
+    return job.to_dict()
 
 @mcp.tool()
-def create_foundry_project(
+async def get_deployment_job_status(
+    job_ids: Optional[list[str]] = None,
+    wait_seconds: float = 0,
+    return_when: Literal["any", "all"] = "all",
+) -> list[dict]:
+    """Get the status of model deployment jobs, optionally waiting for them to finish.
+
+    Deployment jobs are returned by `deploy_model_on_ai_services`. The server polls every pending job in the
+    background, so waiting here is much cheaper than calling `list_deployments_from_azure_ai_services` in a loop.
+
+    Args:
+        job_ids: (Optional) The jobs to report on. All known jobs are reported when omitted.
+        wait_seconds: (Optional) Maximum number of seconds to wait for the jobs to reach a terminal state
+            (`Succeeded`, `Failed`, `Canceled`, `Disabled` or `NotFound`). Returns immediately when 0.
+        return_when: (Optional) "all" waits until every job is done, "any" returns as soon as one of them is.
+
+    Returns:
+        list: The jobs with their `provisioning_state`, a `done` flag and, once polled, the deployment itself.
+
+    Usage:
+        Call this with a `wait_seconds` of up to a few minutes right after deploying models, instead of
+        repeatedly listing deployments.
+    """
+
+    tracker = get_deployment_job_tracker()
+    if job_ids is None:
+        job_ids = [job.job_id for job in tracker.jobs()]
+
+    unknown = [job_id for job_id in job_ids if tracker.get(job_id) is None]
+    jobs = await tracker.wait(job_ids, timeout=wait_seconds, return_when=return_when)
+    return [job.to_dict() for job in jobs] + [
+        {"job_id": job_id, "error": "Unknown job, it may have expired"} for job_id in unknown
+    ]
+
+@mcp.tool()
+async def create_foundry_project(
     subscription_id: str,
     resource_group: str,
     azure_ai_services_name: str,
     project_name: str,
     location: str = "eastus",
-) -> None:
+) -> dict:
     """Create an Azure AI Foundry Project.
 
+    Safe to call repeatedly: if the project already exists with these settings, it is returned without redeploying.
+
     Args:
         subscription_id: The ID of the subscription to create the account in.
         resource_group: The name of the resource group to create the account in.
@@ -434,30 +600,115 @@ def create_foundry_project(
         location: The Azure region to create the account in.
 
     Returns:
-        dict: The created Azure AI services account.
+        dict: The created Azure AI Foundry project.
     """
 
-    bicep_template = f"""
-param ai_services_name string = '{azure_ai_services_name}'
-param location string = '{location}'
-param defaultProjectName string = '{project_name}'
+    project, _ = await asyncio.to_thread(
+        ensure_foundry_project, subscription_id, resource_group, azure_ai_services_name, project_name, location
+    )
+    return project.as_dict()
 
+@mcp.tool()
+async def provision_foundry_stack(
+    subscription_id: str,
+    resource_group: str,
+    azure_ai_services_name: str,
+    location: str,
+    project_name: str = "",
+    model_deployments: Optional[list[ModelDeploymentSpec]] = None,
+) -> dict:
+    """Provision an Azure AI services account, a Foundry project and model deployments in a single ARM deployment.
 
-resource account 'Microsoft.CognitiveServices/accounts@2025-04-01-preview' existing = {{
-  name: ai_services_name
-}}
+    Prefer this over calling `create_azure_ai_services_account`, `create_foundry_project` and
+    `deploy_model_on_ai_services` one after the other: ARM creates the project and the model deployments
+    side by side as soon as the account exists, so the whole stack takes about one deployment's time.
 
-resource project 'Microsoft.CognitiveServices/accounts/projects@2025-04-01-preview' = {{
-  name: defaultProjectName
-  parent: account
-  location: location
+    Args:
+        subscription_id: The ID of the Azure subscription. This is string
+            with the format `xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx`.
+        resource_group: The name of the resource group to provision into.
+        azure_ai_services_name: The name of the Azure AI services account to create or update.
+        location: The Azure region of the account and the project.
+        project_name: (Optional) The name of the Foundry project to create. No project is created when empty.
+        model_deployments: (Optional) The model deployments to create on the account. Each entry needs a
+            `deployment_name`, `model_name` and `model_format` and may set `model_version`,
+            `sku_name` (default "GlobalStandard") and `sku_capacity` (default 1).
+
+    Returns:
+        dict: The finished ARM deployment, listing the created resources in `properties.output_resources`.
+    """
 
-  identity: {{
-    type: 'SystemAssigned'
-  }}
-  properties: {{  }}
-}}
-"""
+    return await asyncio.to_thread(deploy_arm_template, subscription_id, resource_group,
+                                   foundry_stack_template(with_project=bool(project_name)), {
+        "ai_services_name": azure_ai_services_name,
+        "location": location,
+        "project_name": project_name,
+        "model_deployments": [deployment.model_dump() for deployment in model_deployments or []],
+    })
 
-    # TODO: Use the Python SDK once the update is released
-    return deploy_inline_bicep_template(subscription_id, resource_group, bicep_template)
+@mcp.tool()
+async def deploy_models_in_bulk(targets: list[BulkDeploymentTarget]) -> list[dict]:
+    """Deploy models to many Azure AI services accounts at once, checking quota before anything is deployed.
+
+    Every target is checked against the free quota of its account's region first; targets that don't fit
+    are skipped instead of failing halfway through the rollout. The others are deployed in the background,
+    a few at a time per subscription and one at a time per account.
+
+    Args:
+        targets: The deployments to roll out. Each entry needs `subscription_id`, `resource_group`,
+            `azure_ai_services_name`, `deployment_name`, `model_name` and `model_format`, and may set
+            `model_version`, `sku_name` (default "GlobalStandard") and `sku_capacity` (default 1).
+
+    Returns:
+        list: One entry per target: either its deployment job (starting in the `Queued` state) or a
+            `skipped` reason.
+
+    Usage:
+        Follow the rollout with `get_deployment_job_status`, passing the returned job IDs.
+    """
+
+    return await get_bulk_deployment_scheduler().schedule(targets)
+
+@mcp.tool()
+async def get_deployment_inventory(
+    subscription_ids: list[str],
+    model_name: str = "",
+    model_version: str = "",
+    sku_name: str = "",
+    min_capacity: Optional[int] = None,
+    max_capacity: Optional[int] = None,
+    refresh: bool = False,
+) -> dict:
+    """Get the model deployments of every Azure AI services account in one or more subscriptions.
+
+    The first call sweeps every account of the subscriptions in parallel; later calls are answered from a
+    local snapshot, so the fleet can be queried repeatedly with different filters at no extra cost.
+
+    Args:
+        subscription_ids: The IDs of the Azure subscriptions to inventory. Each is a string
+            with the format `xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx`.
+        model_name: (Optional) Only return deployments of this model, e.g. "gpt-4o".
+        model_version: (Optional) Only return deployments of this model version.
+        sku_name: (Optional) Only return deployments with this SKU, e.g. "GlobalStandard".
+        min_capacity: (Optional) Only return deployments with at least this capacity.
+        max_capacity: (Optional) Only return deployments with at most this capacity.
+        refresh: (Optional) Sweep the subscriptions again instead of using the snapshot.
+
+    Returns:
+        dict: `deployments` (one entry per matching deployment, with its account, location, model and SKU),
+            `accounts_scanned`, `snapshot_age_seconds` and the `errors` of accounts that couldn't be listed.
+    """
+
+    snapshots = await get_fleet_inventory().get_snapshots(subscription_ids, refresh=refresh)
+    deployments = filter_deployments(
+        [record for snapshot in snapshots for record in snapshot.deployments],
+        model_name=model_name, model_version=model_version, sku_name=sku_name,
+        min_capacity=min_capacity, max_capacity=max_capacity,
+    )
+    now = time.time()
+    return {
+        "deployments": [record.to_dict() for record in deployments],
+        "accounts_scanned": sum(snapshot.accounts_scanned for snapshot in snapshots),
+        "snapshot_age_seconds": round(max((now - snapshot.fetched_at for snapshot in snapshots), default=0), 1),
+        "errors": {key: error for snapshot in snapshots for key, error in snapshot.errors.items()},
+    }
@@ -1,35 +1,16 @@
-import json
+import asyncio
 import logging
 import os
-import re
-import subprocess
-import sys
-import tempfile
-from pathlib import Path
 from typing import Optional
 
 import dotenv
-import json
-import logging
-import os
-import re
-import subprocess
-import sys
-import tempfile
-from pathlib import Path
-from typing import Optional
-
-import dotenv
-import requests
-from azure.identity import DefaultAzureCredential
-from azure.mgmt.cognitiveservices import CognitiveServicesManagementClient
-from jinja2.sandbox import SandboxedEnvironment
-from markupsafe import Markup
-from azure.identity import DefaultAzureCredential
+import httpx
 from azure.mgmt.cognitiveservices import CognitiveServicesManagementClient
-from jinja2.sandbox import SandboxedEnvironment
 from markupsafe import Markup
 from mcp.server.fastmcp import Context
+from mcp_foundry.mcp_foundry_model.code_samples import get_code_sample_cache
+from mcp_foundry.mcp_foundry_model.http_client import get_http_client, get_resource_cache
+from mcp_foundry.mcp_foundry_model.management import get_management_client_pool
 from mcp_foundry.mcp_foundry_model.models import ModelsList
 
 dotenv.load_dotenv()
@@ -39,6 +20,23 @@ logging.basicConfig(level=logging.DEBUG)
 
 labs_api_url = os.environ.get("LABS_API_URL", "https://foundry-labs-mcp-api.azurewebsites.net/api/v1")
 
+FETCH_TIMEOUT_SECONDS = float(os.environ.get("MODEL_FETCH_TIMEOUT_SECONDS", "20"))
+
+async def fetch_with_timeout(awaitable, description: str, timeout: float = FETCH_TIMEOUT_SECONDS):
+    """
+    Awaits a fetch with a timeout, returning None instead of raising when it fails or times out.
+
+    Used by tools that fan out to several services, so one slow or failing dependency only costs
+    its own part of the result.
+    """
+    try:
+        return await asyncio.wait_for(awaitable, timeout)
+    except asyncio.TimeoutError:
+        logger.error(f"Timed out after {timeout}s {description}")
+    except Exception as e:
+        logger.error(f"Exception {description}: {e}")
+    return None
+
 def get_client_headers_info(ctx):
     """Get client headers info."""
     client_info = getattr(
@@ -51,11 +49,16 @@ def get_client_headers_info(ctx):
     }
     return headers
  
-def get_models_list(ctx: Context, search_for_free_playground: bool = False, publisher_name: str = "", license_name: str = "", 
-                    max_pages: int = 10, model_name: str = "") -> ModelsList:
-    """Get a list of all supported models from Azure AI Foundry with optional filters."""
+async def get_models_list(ctx: Context, search_for_free_playground: bool = False, publisher_name: str = "", license_name: str = "", 
+                    max_pages: int = 10, model_name: str = "", continuation_token: str = "") -> ModelsList:
+    """Get a list of all supported models from Azure AI Foundry with optional filters.
+
+    Fetching starts from `continuation_token` when given. The returned `continuation_token` resumes
+    right after the last page fetched, and is None once the catalog has been walked to the end.
+    """
     url = "https://api.catalog.azureml.ms/asset-gallery/v1.0/models"
     headers = get_client_headers_info(ctx)
+    client = get_http_client()
 
     filters = []
 
@@ -93,10 +96,13 @@ def get_models_list(ctx: Context, search_for_free_playground: bool = False, publ
         })
 
     body = {"filters": filters}
+    if continuation_token:
+        body["continuationToken"] = continuation_token
     logger.info(f"Request body: {body}")
 
     models_list = {"total_models_count": 0,
-                   "fetched_models_count": 0, "summaries": []}
+                   "fetched_models_count": 0, "summaries": [],
+                   "continuation_token": continuation_token or None}
 
     page_count = 0
 
@@ -104,7 +110,7 @@ def get_models_list(ctx: Context, search_for_free_playground: bool = False, publ
         while True and page_count < max_pages:
             page_count += 1
             try:
-                response = requests.post(url, json=body, headers=headers)
+                response = await client.post(url, json=body, headers=headers)
                 response.raise_for_status()
             except Exception as e:
                 logger.error(f"Exception during POST request on page {page_count}: {e}")
@@ -158,6 +164,7 @@ def get_models_list(ctx: Context, search_for_free_playground: bool = False, publ
 
             models_list["total_models_count"] = res_json.get("totalCount", 0)
             models_list["summaries"].extend(res_json["summaries"])
+            models_list["continuation_token"] = res_json.get("continuationToken") or None
 
             # If there are no more pages, break the loop
             if not res_json.get("continuationToken", False):
@@ -183,37 +190,32 @@ def get_models_list(ctx: Context, search_for_free_playground: bool = False, publ
 async def get_code_sample_for_github_model(publisher_name: str, model_name: str, ctx: Context) -> str:
     headers = get_client_headers_info(ctx)
     try:
-        response = requests.get(f"{labs_api_url}/resources/resource/gh_guidance.md", headers=headers)
-        if response.status_code != 200:
-            return f"Error fetching projects from API: {response.status_code}"
-        guidance = response.json()
+        guidance = await get_resource_cache().get(f"{labs_api_url}/resources/resource/gh_guidance.md", headers)
         GH_GUIDANCE = guidance["resource"]["content"]
         guidance = GH_GUIDANCE.replace("{{inference_model_name}}", f"{publisher_name}/{model_name}")
         return guidance
+    except httpx.HTTPStatusError as e:
+        return f"Error fetching projects from API: {e.response.status_code}"
     except Exception as e:
         logger.error(f"Exception in get_code_sample_for_github_model: {e}")
         return f"Exception: {e}"
 
-async def get_code_sample_for_labs_model(model_name: str, ctx: Context) -> str:
-    headers = get_client_headers_info(ctx)
-    try:
-        response = requests.get(f"{labs_api_url}/projects/{model_name}/implementation", headers=headers)
-        if response.status_code != 200:
-            return f"Error fetching projects from API: {response.status_code}"
-        project_response = response.json()
-        return project_response['project']
-    except Exception as e:
-        logger.error(f"Exception in get_code_sample_for_labs_model: {e}")
-        return f"Exception: {e}"
+async def get_model_registry_details(asset_id: str, ctx: Context) -> dict:
+    """Get the full model registry entry for a catalog asset."""
+    response = await get_http_client().get(
+        f"https://ai.azure.com/api/westus2/modelregistry/v1.0/registry/models?assetIdOrReference={asset_id}",
+        headers=get_client_headers_info(ctx),
+    )
+    response.raise_for_status()
+    return response.json()
 
 def get_cognitiveservices_client(
     subscription_id: str,
 ) -> CognitiveServicesManagementClient:
-    return CognitiveServicesManagementClient(
-        credential=DefaultAzureCredential(), subscription_id=subscription_id
-    )
+    """Returns the pooled Cognitive Services management client of a subscription. Callers must not close it."""
+    return get_management_client_pool().get(CognitiveServicesManagementClient, subscription_id)
 
-def  get_code_sample_for_deployment_under_ai_services(model_name:str, inference_task: str, endpoint: str, deployment_name: str) -> Optional[str]:
+async def get_code_sample_for_deployment_under_ai_services(model_name:str, inference_task: str, endpoint: str, deployment_name: str) -> Optional[str]:
     """Get a code snippet for a specific deployment.
 
     This function is used to get code examples and implementation instructions for deploying models in Azure AI Services, helping users understand how to integrate and use the models effectively in their applications.
@@ -227,30 +229,22 @@ def  get_code_sample_for_deployment_under_ai_services(model_name:str, inference_
         str: A rendered code snippet demonstrating usage of the deployment.
     """
 
-    template_response = requests.get(
-            f"https://ai.azure.com/modelcache/code2/oai-sdk-key-auth/en/{inference_task}-python-template.md",
-        )
+    code_sample_cache = get_code_sample_cache()
 
-    if not template_response.ok:
-        logger.error(f"Error fetching template: {template_response.status_code}")
-        return None
+    # The template and the widget config are independent, fetch (or look them up) together
+    template, model_template_config = await asyncio.gather(
+        code_sample_cache.get_template(inference_task),
+        code_sample_cache.get_widget_config(model_name),
+        return_exceptions=True,
+    )
 
-    ejs_template = template_response.text
-    try:
-        model_template_config = (
-            requests.get(
-                f"https://ai.azure.com/modelcache/widgets/en/Serverless/azure-openai/{model_name}.json"
-            )
-        ).json()
-    except Exception as e:
-        logger.error(f"Error fetching model template config: {e}")
+    if isinstance(template, Exception):
+        logger.error(f"Error fetching template: {template}")
         return None
 
-    naive_jinja2_template = re.sub(r"<%=\s+([\w\.]+)\s%>", r"{{ \1|e }}", ejs_template)
-
-    env = SandboxedEnvironment()
-
-    template = env.from_string(naive_jinja2_template)
+    if isinstance(model_template_config, Exception):
+        logger.error(f"Error fetching model template config: {model_template_config}")
+        return None
 
     additionalParameters = {}
 
@@ -296,41 +290,3 @@ async def get_ai_services_usage_list(ctx: Context) -> str:
     headers = get_client_headers_info(ctx)
 
     pass
-
-def az(*args: str) -> dict:
-    """Run azure-cli and return output
-
-    :param str *args: The command line arguments to provide to git
-    :returns: The standard output of the git command. Surrounding whitespace is removed
-    :rtype: str
-    """
-    output = subprocess.run(
-        [sys.executable, "-m", "azure.cli", *args, "-o", "json"],
-        text=True,
-        capture_output=True,
-        check=True,
-    ).stdout.strip()
-
-    return json.loads(output)
-
-def deploy_inline_bicep_template(
-    subscription_id: str, resource_group: str, bicep_template: str
-):
-    """Deploy a bicep template from a string"""
-    with tempfile.NamedTemporaryFile(suffix=".bicep") as tmp:
-        Path(tmp.name).write_text(bicep_template, encoding="utf-8")
-        try:
-            return az(
-                "deployment",
-                "group",
-                "create",
-                "--subscription",
-                subscription_id,
-                "--resource-group",
-                resource_group,
-                "--template-file",
-                tmp.name,
-            )
-        except subprocess.CalledProcessError as e:
-            logger.exception(e.stderr + e.stdout)
-            raise
\ No newline at end of file
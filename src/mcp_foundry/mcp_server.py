@@ -1,7 +1,11 @@
 import importlib
+import inspect
 import os
 import logging
 import sys
+from typing import Awaitable, Callable, Literal
+
+import anyio
 from mcp.server.fastmcp import FastMCP
 
 mcp = FastMCP("azure-ai-foundry-mcp-server")
@@ -14,6 +18,51 @@ logging.basicConfig(
 )
 logger = logging.getLogger("mcp_server")
 
+ShutdownHook = Callable[[], Awaitable[None] | None]
+
+_shutdown_hooks: list[ShutdownHook] = []
+
+def on_shutdown(hook: ShutdownHook) -> ShutdownHook:
+    """
+    Registers a callable (sync or async) that releases process-wide resources when the server stops.
+
+    FastMCP lifespans are entered once per client session, so pooled clients shared across
+    sessions are closed here instead. Hooks run in reverse registration order.
+    """
+    _shutdown_hooks.append(hook)
+    return hook
+
+async def run_shutdown_hooks():
+    """Runs every registered shutdown hook, logging (not raising) individual failures."""
+    for hook in reversed(_shutdown_hooks):
+        try:
+            result = hook()
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            logger.error(f"❌ Error running shutdown hook {getattr(hook, '__name__', hook)}: {e}")
+
+def run_server(transport: Literal["stdio", "sse", "streamable-http"] = "stdio"):
+    """
+    Runs the MCP server on the given transport and runs the shutdown hooks on the same event loop once it stops.
+    """
+    if transport not in ("stdio", "sse", "streamable-http"):
+        raise ValueError(f"Unknown transport: {transport}")
+
+    async def _serve():
+        try:
+            if transport == "sse":
+                await mcp.run_sse_async()
+            elif transport == "streamable-http":
+                await mcp.run_streamable_http_async()
+            else:
+                await mcp.run_stdio_async()
+        finally:
+            with anyio.CancelScope(shield=True):
+                await run_shutdown_hooks()
+
+    anyio.run(_serve)
+
 def auto_import_modules(base_package: str, targets: list[str]):
     """
     Automatically imports specified Python modules (e.g., tools.py, resources.py, prompts.py)
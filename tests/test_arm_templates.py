@@ -0,0 +1,52 @@
+from mcp_foundry.mcp_foundry_model.arm import (
+    ai_services_account_template,
+    compile_template,
+    deployment_name_for,
+    foundry_project_template,
+    foundry_stack_template,
+)
+
+def test_compile_template_caches_by_content_hash():
+    first = compile_template({"resources": [], "parameters": {"location": {"type": "string"}}})
+    second = compile_template({"parameters": {"location": {"type": "string"}}, "resources": []})
+    other = compile_template({"parameters": {}, "resources": []})
+
+    assert second is first
+    assert other.content_hash != first.content_hash
+
+def test_provisioning_templates_are_parameterized():
+    account = ai_services_account_template()
+    project = foundry_project_template()
+
+    assert ai_services_account_template() is account
+    assert set(account.content["parameters"]) == {"ai_services_name", "location"}
+    assert account.content["resources"][0]["properties"]["allowProjectManagement"] is True
+    assert set(project.content["parameters"]) == {"ai_services_name", "project_name", "location"}
+    assert project.content["resources"][0]["type"] == "Microsoft.CognitiveServices/accounts/projects"
+
+def test_deployment_names_are_stable_per_template_and_parameters():
+    template = ai_services_account_template()
+    parameters = {"ai_services_name": "my-ai-services", "location": "eastus"}
+
+    assert deployment_name_for(template, parameters) == deployment_name_for(template, dict(reversed(parameters.items())))
+    assert deployment_name_for(template, parameters) != deployment_name_for(template, {**parameters, "location": "westus"})
+    assert deployment_name_for(template, parameters).startswith("mcp-foundry-")
+
+def test_foundry_stack_template_orders_resources_on_the_account():
+    template = foundry_stack_template()
+    account, project, deployments = template.content["resources"]
+    account_id = "[resourceId('Microsoft.CognitiveServices/accounts', parameters('ai_services_name'))]"
+
+    assert foundry_stack_template() is template
+    assert "dependsOn" not in account
+    assert project["dependsOn"] == [account_id]
+    assert project["name"] == "[format('{0}/{1}', parameters('ai_services_name'), parameters('project_name'))]"
+    assert deployments["dependsOn"] == [account_id]
+    assert deployments["copy"]["mode"] == "serial"
+
+    # Without a project, no resource is left with an empty name segment
+    without_project = foundry_stack_template(with_project=False)
+    assert [resource["type"] for resource in without_project.content["resources"]] == [
+        "Microsoft.CognitiveServices/accounts", "Microsoft.CognitiveServices/accounts/deployments",
+    ]
+    assert without_project.content_hash != template.content_hash
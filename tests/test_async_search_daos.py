@@ -0,0 +1,98 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from mcp_foundry.mcp_foundry_knowledge.data_access_objects import AsyncSearchClientDao, AsyncSearchIndexDao
+from mcp_foundry.mcp_foundry_knowledge.data_access_objects.registry import SearchClientRegistry
+
+@pytest.fixture(autouse=True)
+def search_environment(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_ENDPOINT", "https://example.search.windows.net")
+    monkeypatch.setenv("SEARCH_AUTHENTICATION_METHOD", "api-search-key")
+    monkeypatch.setenv("AZURE_AI_SEARCH_API_KEY", "key")
+
+class FakeCredential:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+class FakeSearchClient:
+    def __init__(self):
+        self.closed = False
+        self.uploaded = []
+
+    async def upload_documents(self, documents):
+        self.uploaded.extend(documents)
+        return [
+            SimpleNamespace(serialize=lambda keep_readonly, key=document["id"]: {"key": key, "status": True, "statusCode": 201})
+            for document in documents
+        ]
+
+    async def close(self):
+        self.closed = True
+
+async def _list_indexes(select=None):
+    for name, e_tag in (("hotels", '"0x1"'), ("products", '"0x2"')):
+        yield SimpleNamespace(name=name, e_tag=e_tag)
+
+@pytest.mark.asyncio
+async def test_async_client_dao_serializes_results_and_leaves_shared_clients_open():
+    client = FakeSearchClient()
+    dao = AsyncSearchClientDao("hotels", client=client)
+
+    results = await dao.add_documents([{"id": "1"}, {"id": "2"}])
+    await dao.close()
+
+    assert results == [{"key": "1", "status": True, "statusCode": 201}, {"key": "2", "status": True, "statusCode": 201}]
+    assert client.uploaded == [{"id": "1"}, {"id": "2"}]
+    assert not client.closed
+
+@pytest.mark.asyncio
+async def test_async_index_dao_lists_etags_without_full_definitions():
+    dao = AsyncSearchIndexDao(client=SimpleNamespace(list_indexes=_list_indexes))
+
+    assert await dao.retrieve_index_etags() == {"hotels": '"0x1"', "products": '"0x2"'}
+
+def test_registry_recreates_clients_on_a_new_event_loop():
+    search_clients = SearchClientRegistry()
+
+    async def open_client():
+        dao = search_clients.client_dao("hotels")
+        session = search_clients._session
+        # Release the session on its own loop; the registry still holds clients bound to it
+        await session.close()
+        return dao, session
+
+    async def reopen_client():
+        try:
+            return search_clients.client_dao("hotels"), search_clients._session
+        finally:
+            await search_clients.close()
+
+    first_dao, first_session = asyncio.run(open_client())
+    second_dao, second_session = asyncio.run(reopen_client())
+
+    assert second_dao is not first_dao
+    assert second_session is not first_session
+
+@pytest.mark.asyncio
+async def test_registry_close_releases_the_session_and_the_credential():
+    search_clients = SearchClientRegistry()
+    credential = FakeCredential()
+    search_clients._fetch_credentials = lambda: credential
+
+    search_clients.index_dao()
+    search_clients.client_dao("hotels")
+    session = search_clients._session
+    await search_clients.close()
+
+    assert session.closed
+    assert credential.closed
+    assert search_clients._session is None and search_clients._credential is None
+
+    # The registry can be used again after closing, with a new session
+    search_clients.client_dao("hotels")
+    assert search_clients._session is not session
+    await search_clients.close()
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+from mcp_foundry.mcp_foundry_model import bulk
+from mcp_foundry.mcp_foundry_model.bulk import BulkDeploymentScheduler
+from mcp_foundry.mcp_foundry_model.jobs import DeploymentJobTracker
+from mcp_foundry.mcp_foundry_model.models import BulkDeploymentTarget
+from mcp_foundry.mcp_foundry_model.quotas import QuotaCache
+
+SUBSCRIPTION_ID = "00000000-0000-0000-0000-000000000000"
+
+def _target(account, deployment_name, sku_capacity):
+    return BulkDeploymentTarget(
+        subscription_id=SUBSCRIPTION_ID, resource_group="rg", azure_ai_services_name=account,
+        deployment_name=deployment_name, model_name="gpt-4o", model_format="OpenAI", sku_capacity=sku_capacity,
+    )
+
+@pytest.mark.asyncio
+async def test_bulk_deployments_respect_quota_and_serialize_per_account(monkeypatch):
+    submitted, in_flight, max_in_flight_per_account = [], {}, {}
+
+    monkeypatch.setattr(bulk, "_get_account_location", lambda account_key: "eastus")
+    quota_cache = QuotaCache(ttl_seconds=60)
+    quota_cache._list_usages = lambda subscription_id, location: [
+        {"name": {"value": "OpenAI.GlobalStandard.gpt-4o"}, "current_value": 100, "limit": 250},
+    ]
+
+    tracker = DeploymentJobTracker(initial_interval=0.01, max_interval=0.01)
+    tracker._list_deployments = lambda subscription_id, resource_group, account: {
+        name: {"properties": {"provisioning_state": "Succeeded"}} for _, name in submitted
+    }
+
+    scheduler = BulkDeploymentScheduler(tracker, quota_cache, concurrency=2)
+
+    def submit(target):
+        in_flight[target.azure_ai_services_name] = in_flight.get(target.azure_ai_services_name, 0) + 1
+        max_in_flight_per_account[target.azure_ai_services_name] = max(
+            max_in_flight_per_account.get(target.azure_ai_services_name, 0), in_flight[target.azure_ai_services_name]
+        )
+        submitted.append((target.azure_ai_services_name, target.deployment_name))
+
+    original_wait = tracker.wait
+
+    async def wait(job_ids, timeout, return_when="all"):
+        jobs = await original_wait(job_ids, timeout, return_when)
+        for job in jobs:
+            in_flight[job.azure_ai_services_name] -= 1
+        return jobs
+
+    scheduler._submit = submit
+    tracker.wait = wait
+
+    results = await scheduler.schedule([
+        _target("account-a", "chat-1", 100),
+        _target("account-a", "chat-2", 60),
+        _target("account-b", "chat-3", 20),
+        _target("account-a", "chat-4", 10),
+    ])
+
+    assert [result.get("provisioning_state") for result in results] == ["Queued", None, "Queued", "Queued"]
+    assert results[1]["skipped"].startswith("Insufficient GlobalStandard quota for gpt-4o in eastus")
+
+    await asyncio.gather(*scheduler._rollouts)
+    assert sorted(submitted) == [("account-a", "chat-1"), ("account-a", "chat-4"), ("account-b", "chat-3")]
+    assert all(tracker.get(result["job_id"]).provisioning_state == "Succeeded" for result in results if "job_id" in result)
+    assert max(max_in_flight_per_account.values()) == 1
+
+@pytest.mark.asyncio
+async def test_bulk_deployments_skip_deployments_already_queued(monkeypatch):
+    monkeypatch.setattr(bulk, "_get_account_location", lambda account_key: "eastus")
+    quota_cache = QuotaCache(ttl_seconds=60)
+    quota_cache._list_usages = lambda subscription_id, location: [
+        {"name": {"value": "OpenAI.GlobalStandard.gpt-4o"}, "current_value": 0, "limit": 250},
+    ]
+    tracker = DeploymentJobTracker(initial_interval=0.01, max_interval=0.01)
+    scheduler = BulkDeploymentScheduler(tracker, quota_cache, concurrency=2)
+    scheduler._run = lambda scheduled: asyncio.sleep(0)
+
+    # Still queued by an earlier bulk request, so it reports the same state as a new job
+    queued, _ = tracker.track(SUBSCRIPTION_ID, "rg", "account-a", "chat-1", queued=True)
+
+    results = await scheduler.schedule([
+        _target("account-a", "chat-1", 10),
+        _target("account-a", "chat-2", 10),
+        _target("account-a", "chat-2", 10),
+    ])
+
+    assert results[0]["job_id"] == queued.job_id
+    assert "skipped" in results[0]
+    assert "skipped" not in results[1]
+    assert results[2]["job_id"] == results[1]["job_id"]
+    assert "skipped" in results[2]
@@ -0,0 +1,58 @@
+import httpx
+import pytest
+from mcp_foundry.mcp_foundry_model import code_samples
+from mcp_foundry.mcp_foundry_model.code_samples import CodeSampleCache, LRUCache
+
+@pytest.fixture
+def modelcache_api(monkeypatch):
+    """Serves fake templates and widget configs through the pooled client and records the requests made to it."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("-python-template.md"):
+            return httpx.Response(200, text="client.chat(model=<%= deploymentName %>)")
+        return httpx.Response(200, json=[{"config": {"examples": []}}])
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(code_samples, "get_http_client", lambda: client)
+    return requests
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2, ttl_seconds=60)
+    cache.put("chat-completion", 1)
+    cache.put("embeddings", 2)
+    cache.get("chat-completion")
+    cache.put("completions", 3)
+
+    assert "embeddings" not in cache
+    assert cache.get("chat-completion") == 1
+
+    expired = LRUCache(maxsize=2, ttl_seconds=-1)
+    expired.put("chat-completion", 1)
+    assert expired.get("chat-completion") is None
+
+@pytest.mark.asyncio
+async def test_code_sample_cache_compiles_templates_once(modelcache_api):
+    cache = CodeSampleCache(None, ttl_seconds=60, template_cache_size=2, widget_cache_size=2)
+
+    first = await cache.get_template("chat-completion")
+    second = await cache.get_template("chat-completion")
+
+    assert second is first
+    assert first.render(deploymentName="<gpt-4o>") == "client.chat(model=&lt;gpt-4o&gt;)"
+    assert len(modelcache_api) == 1
+
+@pytest.mark.asyncio
+async def test_code_sample_cache_persists_to_disk(modelcache_api, tmp_path):
+    cache = CodeSampleCache(str(tmp_path), ttl_seconds=60, template_cache_size=2, widget_cache_size=2)
+    await cache.get_template("chat-completion")
+    await cache.get_widget_config("gpt-4o")
+
+    restarted = CodeSampleCache(str(tmp_path), ttl_seconds=60, template_cache_size=2, widget_cache_size=2)
+    template = await restarted.get_template("chat-completion")
+    widget_config = await restarted.get_widget_config("gpt-4o")
+
+    assert template.render(deploymentName="gpt-4o") == "client.chat(model=gpt-4o)"
+    assert widget_config == [{"config": {"examples": []}}]
+    assert len(modelcache_api) == 2
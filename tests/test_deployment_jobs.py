@@ -0,0 +1,84 @@
+import math
+from types import SimpleNamespace
+
+import pytest
+from mcp_foundry.mcp_foundry_model import tools
+from mcp_foundry.mcp_foundry_model.jobs import DeploymentJobTracker
+
+SUBSCRIPTION_ID = "00000000-0000-0000-0000-000000000000"
+
+def _deployment(name, state):
+    return {"name": name, "properties": {"provisioning_state": state}}
+
+@pytest.mark.asyncio
+async def test_jobs_on_one_account_are_polled_together():
+    polls = []
+    states = {"gpt-4o": ["Creating", "Succeeded"], "text-embedding-3-large": ["Creating", "Creating", "Failed"]}
+
+    def list_deployments(subscription_id, resource_group, azure_ai_services_name):
+        polls.append(azure_ai_services_name)
+        return {name: _deployment(name, history.pop(0) if len(history) > 1 else history[0])
+                for name, history in states.items()}
+
+    tracker = DeploymentJobTracker(initial_interval=0.01, max_interval=0.02)
+    tracker._list_deployments = list_deployments
+    chat, created = tracker.track(SUBSCRIPTION_ID, "rg", "my-ai-services", "gpt-4o")
+    embeddings, _ = tracker.track(SUBSCRIPTION_ID, "rg", "my-ai-services", "text-embedding-3-large")
+
+    again, created_again = tracker.track(SUBSCRIPTION_ID, "rg", "my-ai-services", "gpt-4o")
+    assert created and not created_again
+    assert again is chat
+
+    [first] = await tracker.wait([chat.job_id], timeout=5, return_when="any")
+    assert first.provisioning_state == "Succeeded"
+    assert first.to_dict()["done"]
+    assert polls == ["my-ai-services", "my-ai-services"]
+
+    await tracker.wait([chat.job_id, embeddings.job_id], timeout=5)
+    assert embeddings.provisioning_state == "Failed"
+
+@pytest.mark.asyncio
+async def test_wait_returns_immediately_without_timeout():
+    tracker = DeploymentJobTracker(initial_interval=60)
+    tracker._list_deployments = lambda *args: {}
+    job, _ = tracker.track(SUBSCRIPTION_ID, "rg", "my-ai-services", "gpt-4o")
+
+    assert await tracker.wait([job.job_id, "unknown"], timeout=0) == [job]
+    assert job.provisioning_state == "Accepted"
+
+@pytest.fixture
+def deployment_submissions(monkeypatch):
+    submitted = []
+    client = SimpleNamespace(deployments=SimpleNamespace(
+        begin_create_or_update=lambda resource_group, account, deployment_name, **kwargs: submitted.append(deployment_name)
+    ))
+    tracker = DeploymentJobTracker(initial_interval=60)
+    tracker._list_deployments = lambda *args: {}
+    monkeypatch.setattr(tools, "get_deployment_job_tracker", lambda: tracker)
+    monkeypatch.setattr(tools, "get_cognitiveservices_client", lambda subscription_id: client)
+    return tracker, submitted
+
+async def _deploy(deployment_name):
+    return await tools.deploy_model_on_ai_services(deployment_name, "gpt-4o", "OpenAI", "my-ai-services", "rg",
+                                                   SUBSCRIPTION_ID)
+
+@pytest.mark.asyncio
+async def test_direct_deployments_are_submitted_and_polled(deployment_submissions):
+    tracker, submitted = deployment_submissions
+
+    result = await _deploy("gpt-4o")
+
+    assert submitted == ["gpt-4o"]
+    assert result["provisioning_state"] == "Accepted"
+    assert tracker.get(result["job_id"]).next_poll_at < math.inf
+
+@pytest.mark.asyncio
+async def test_direct_deployments_do_not_overwrite_a_queued_rollout(deployment_submissions):
+    tracker, submitted = deployment_submissions
+    queued, _ = tracker.track(SUBSCRIPTION_ID, "rg", "my-ai-services", "gpt-4o", queued=True)
+
+    result = await _deploy("gpt-4o")
+
+    assert submitted == []
+    assert result["job_id"] == queued.job_id
+    assert result["skipped"] == "A deployment with this name is already in progress"
@@ -0,0 +1,57 @@
+import pytest
+from mcp_foundry.mcp_foundry_knowledge.data_access_objects import AsyncSearchClientDao
+from mcp_foundry.mcp_foundry_knowledge.deletion import bulk_delete_documents
+
+@pytest.fixture(autouse=True)
+def search_environment(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_ENDPOINT", "https://example.search.windows.net")
+
+class FakeSearchClient:
+    """Answers each search with the next queued page of documents."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.searches = []
+
+    async def search(self, **kwargs):
+        self.searches.append(kwargs)
+        return self._items(self.pages.pop(0) if self.pages else [])
+
+    @staticmethod
+    async def _items(items):
+        for item in items:
+            yield item
+
+@pytest.mark.asyncio
+async def test_scan_filters_on_the_key_range_and_escapes_quotes():
+    client = FakeSearchClient([[{"id": "a"}, {"id": "o'b"}], [{"id": "p"}]])
+    dao = AsyncSearchClientDao("hotels", client=client)
+
+    pages = [page async for page in dao.scan_index("id", query_filter="rating gt 3", select=["name"],
+                                                    start_after="Jack's", end_at="z'z", page_size=2)]
+
+    assert pages == [[{"id": "a"}, {"id": "o'b"}], [{"id": "p"}]]
+    assert [search["filter"] for search in client.searches] == [
+        "(rating gt 3) and id gt 'Jack''s' and id le 'z''z'",
+        "(rating gt 3) and id gt 'o''b' and id le 'z''z'",
+    ]
+    assert all(search["order_by"] == ["id asc"] and search["top"] == 2 for search in client.searches)
+    assert client.searches[0]["select"] == ["id", "name"]
+
+@pytest.mark.asyncio
+async def test_unbounded_scan_has_no_filter_and_stops_on_an_empty_page():
+    client = FakeSearchClient([[{"id": "a"}, {"id": "b"}]])
+    dao = AsyncSearchClientDao("hotels", client=client)
+
+    pages = [page async for page in dao.scan_index("id", page_size=2)]
+
+    assert pages == [[{"id": "a"}, {"id": "b"}]]
+    assert [search["filter"] for search in client.searches] == [None, "id gt 'b'"]
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("arguments", [{}, {"document_keys": ["1"], "query_filter": "rating gt 3"}])
+async def test_bulk_delete_needs_exactly_one_of_keys_or_filter(arguments):
+    dao = AsyncSearchClientDao("hotels", client=FakeSearchClient([]))
+
+    with pytest.raises(ValueError, match="Exactly one of document_keys or query_filter"):
+        await bulk_delete_documents(dao, "id", **arguments)
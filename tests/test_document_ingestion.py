@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from mcp_foundry.mcp_foundry_knowledge.data_access_objects.aio import document_size
+from mcp_foundry.mcp_foundry_knowledge.ingestion import BulkDocumentIngestor, iter_batches
+
+class FakeClientDao:
+    """Answers each upload with the statuses queued for its keys, succeeding by default."""
+
+    def __init__(self, statuses=None):
+        self.index_name = "hotels"
+        self.statuses = statuses or {}
+        self.batches = []
+
+    async def add_documents(self, documents):
+        self.batches.append([document["id"] for document in documents])
+        results = []
+        for document in documents:
+            key = document["id"]
+            statuses = self.statuses.get(key)
+            status_code = statuses.pop(0) if statuses else 201
+            results.append({"key": key, "status": status_code < 300, "statusCode": status_code,
+                            "errorMessage": None if status_code < 300 else f"Status {status_code}"})
+        return results
+
+def _documents(count, text=""):
+    return [{"id": str(number), "text": text} for number in range(count)]
+
+@pytest.mark.asyncio
+async def test_batches_are_bounded_by_count_and_bytes():
+    documents = _documents(5, text="x" * 100)
+    size = document_size(documents[0])
+
+    by_count = [len(batch) async for batch in iter_batches(documents, max_documents=2, max_bytes=10 * size)]
+    by_bytes = [len(batch) async for batch in iter_batches(documents, max_documents=10, max_bytes=3 * size)]
+    oversized = [len(batch) async for batch in iter_batches(documents, max_documents=10, max_bytes=size // 2)]
+
+    assert by_count == [2, 2, 1]
+    assert by_bytes == [3, 2]
+    assert oversized == [1, 1, 1, 1, 1]
+
+@pytest.mark.asyncio
+async def test_only_transient_failures_of_a_partial_success_are_retried():
+    dao = FakeClientDao({"1": [503, 201], "2": [400], "3": [429, 429, 429]})
+    ingestor = BulkDocumentIngestor(dao, "id", batch_size=10, max_retries=2, retry_base_delay=0)
+
+    report = await ingestor.ingest(_documents(4))
+
+    assert dao.batches == [["0", "1", "2", "3"], ["1", "3"], ["3"]]
+    assert (report.total, report.succeeded, report.failed, report.retried, report.batches) == (4, 2, 2, 3, 1)
+    assert report.failures == [
+        {"key": "2", "status_code": 400, "error_message": "Status 400"},
+        {"key": "3", "status_code": 429, "error_message": "Status 429"},
+    ]
+
+@pytest.mark.asyncio
+async def test_failure_report_counts_documents_without_keys():
+    dao = FakeClientDao()
+    ingestor = BulkDocumentIngestor(dao, "id", batch_size=2)
+
+    report = (await ingestor.ingest([{"id": "1"}, {"text": "no key"}, "not a document", {"id": "2"}])).to_dict()
+
+    assert dao.batches == [["1", "2"]]
+    assert (report["total"], report["succeeded"], report["failed"]) == (4, 2, 2)
+    assert report["failures"][0] == {"key": None, "status_code": None,
+                                     "error_message": "Document has no value for key field 'id'"}
+    assert not report["failures_truncated"]
+
+@pytest.mark.asyncio
+async def test_failing_source_cancels_the_batches_in_flight():
+    started, cancelled = asyncio.Event(), []
+
+    class SlowClientDao(FakeClientDao):
+        async def add_documents(self, documents):
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(documents[0]["id"])
+                raise
+
+    async def documents():
+        # A batch is handed over once the document after it is read
+        yield {"id": "1"}
+        yield {"id": "2"}
+        await started.wait()
+        raise ValueError("Invalid JSON on line 3")
+
+    ingestor = BulkDocumentIngestor(SlowClientDao(), "id", batch_size=1)
+    tasks_before = asyncio.all_tasks()
+
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        await ingestor.ingest(documents())
+
+    assert cancelled == ["1"]
+    assert asyncio.all_tasks() == tasks_before
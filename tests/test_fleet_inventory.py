@@ -0,0 +1,88 @@
+from types import SimpleNamespace
+
+import pytest
+from mcp_foundry.mcp_foundry_model import inventory
+from mcp_foundry.mcp_foundry_model.inventory import FleetInventory, filter_deployments, resource_group_from_id
+
+SUBSCRIPTION_ID = "00000000-0000-0000-0000-000000000000"
+
+def _account(name, resource_group):
+    return SimpleNamespace(
+        id=f"/subscriptions/{SUBSCRIPTION_ID}/resourceGroups/{resource_group}/providers/Microsoft.CognitiveServices/accounts/{name}",
+        name=name,
+        location="eastus",
+    )
+
+def _deployment(name, model_name, version, sku_name, capacity):
+    return SimpleNamespace(as_dict=lambda: {
+        "name": name,
+        "sku": {"name": sku_name, "capacity": capacity},
+        "properties": {"model": {"format": "OpenAI", "name": model_name, "version": version},
+                       "provisioning_state": "Succeeded"},
+    })
+
+class FakeClient:
+    def __init__(self):
+        self.calls = 0
+        self.accounts = SimpleNamespace(list=self._list_accounts)
+        self.deployments = SimpleNamespace(list=self._list_deployments)
+
+    def _list_accounts(self):
+        self.calls += 1
+        return [_account("account-a", "rg-a"), _account("account-b", "rg-b")]
+
+    def _list_deployments(self, resource_group, account_name):
+        self.calls += 1
+        if account_name == "account-a":
+            return [_deployment("chat", "gpt-4o", "2024-11-20", "GlobalStandard", 100),
+                    _deployment("embeddings", "text-embedding-3-large", "1", "Standard", 10)]
+        return [_deployment("chat", "gpt-4o", "2024-08-06", "GlobalStandard", 30)]
+
+def test_resource_group_from_id():
+    assert resource_group_from_id(_account("account-a", "My-RG").id) == "My-RG"
+
+@pytest.mark.asyncio
+async def test_fleet_inventory_sweeps_once_and_filters_from_memory(monkeypatch):
+    client = FakeClient()
+    monkeypatch.setattr(inventory, "get_management_client_pool", lambda: SimpleNamespace(get=lambda *args: client))
+    fleet = FleetInventory(ttl_seconds=60, concurrency=2)
+
+    [snapshot] = await fleet.get_snapshots([SUBSCRIPTION_ID])
+    await fleet.get_snapshots([SUBSCRIPTION_ID])
+
+    assert client.calls == 3
+    assert snapshot.accounts_scanned == 2
+    assert {(record.azure_ai_services_name, record.resource_group) for record in snapshot.deployments} == \
+        {("account-a", "rg-a"), ("account-b", "rg-b")}
+
+    gpt_4o = filter_deployments(snapshot.deployments, model_name="GPT-4o", min_capacity=50)
+    assert [(record.azure_ai_services_name, record.model_version) for record in gpt_4o] == [("account-a", "2024-11-20")]
+    assert len(filter_deployments(snapshot.deployments, sku_name="globalstandard")) == 2
+
+    await fleet.get_snapshots([SUBSCRIPTION_ID], refresh=True)
+    assert client.calls == 6
+
+@pytest.mark.asyncio
+async def test_fleet_inventory_does_not_keep_failed_account_listings(monkeypatch):
+    client = FakeClient()
+    listings = [RuntimeError("throttled"), [_account("account-b", "rg-b")]]
+
+    def list_accounts():
+        client.calls += 1
+        listing = listings.pop(0)
+        if isinstance(listing, Exception):
+            raise listing
+        return listing
+
+    client.accounts = SimpleNamespace(list=list_accounts)
+    monkeypatch.setattr(inventory, "get_management_client_pool", lambda: SimpleNamespace(get=lambda *args: client))
+    fleet = FleetInventory(ttl_seconds=60, concurrency=2)
+
+    [failed] = await fleet.get_snapshots([SUBSCRIPTION_ID])
+    [snapshot] = await fleet.get_snapshots([SUBSCRIPTION_ID])
+
+    assert failed.errors == {SUBSCRIPTION_ID: "throttled"}
+    assert failed.accounts_scanned == 0
+    assert snapshot.errors == {}
+    assert [record.azure_ai_services_name for record in snapshot.deployments] == ["account-b"]
+    assert client.calls == 3
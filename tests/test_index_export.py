@@ -0,0 +1,82 @@
+import asyncio
+import json
+import sys
+
+import pytest
+from mcp_foundry.mcp_foundry_knowledge.export import IndexExporter, arrow_schema_for, split_key_range
+
+INDEX_SCHEMA = {"name": "hotels", "fields": [{"name": "id", "type": "Edm.String", "key": True},
+                                             {"name": "name", "type": "Edm.String"}]}
+
+class FakeScanDao:
+    """Documents in key order, scanned in pages of two; earlier ranges finish last."""
+
+    index_name = "hotels"
+
+    def __init__(self, keys):
+        self.documents = [{"id": key, "name": f"Hotel {key}", "@search.score": 1.0} for key in sorted(keys)]
+
+    async def query_index(self, query_filter=None, order_by=None, select=None, top=None):
+        documents = self.documents if order_by == ["id asc"] else self.documents[::-1]
+        return [{"id": document["id"]} for document in documents[:top]]
+
+    async def scan_index(self, key_field_name, query_filter=None, select=None, start_after=None, end_at=None):
+        documents = [
+            document for document in self.documents
+            if (start_after is None or document["id"] > start_after) and (end_at is None or document["id"] <= end_at)
+        ]
+        await asyncio.sleep(0.01 if start_after is None else 0)
+        for offset in range(0, len(documents), 2):
+            yield documents[offset:offset + 2]
+
+def _covered_once(ranges, keys):
+    return all(
+        sum((start is None or key > start) and (end is None or key <= end) for start, end in ranges) == 1
+        for key in keys
+    )
+
+@pytest.mark.parametrize("low, high", [("a", "z"), ("doc-0001", "doc-9999"), ("A", "b"), ("ab", "abc"), ("x", "x")])
+@pytest.mark.parametrize("parts", [1, 2, 4, 16])
+def test_key_ranges_are_contiguous_and_cover_every_key(low, high, parts):
+    ranges = split_key_range(low, high, parts)
+
+    assert 1 <= len(ranges) <= max(parts, 1)
+    assert ranges[0][0] is None and ranges[-1][1] is None
+    assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+    assert all(start < end for start, end in ranges[1:-1])
+    assert _covered_once(ranges, [low, high, low + "0", high + "0", "", "~"])
+
+def test_equal_keys_or_a_single_part_give_one_unbounded_range():
+    assert split_key_range("x", "x", 4) == [(None, None)]
+    assert split_key_range("a", "z", 1) == [(None, None)]
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parallel_ranges", [1, 4])
+async def test_jsonl_export_writes_every_document_once_in_key_order(tmp_path, parallel_ranges):
+    keys = [f"doc-{number:03d}" for number in range(0, 200, 7)]
+    exporter = IndexExporter(FakeScanDao(keys), "id", INDEX_SCHEMA)
+
+    summary = await exporter.export(str(tmp_path / "hotels.jsonl"), parallel_ranges=parallel_ranges)
+
+    lines = (tmp_path / "hotels.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [{"id": key, "name": f"Hotel {key}"} for key in keys]
+    assert summary["documents"] == len(keys)
+    assert sum(key_range["documents"] for key_range in summary["ranges"]) == len(keys)
+    assert len(summary["ranges"]) > 1 if parallel_ranges > 1 else len(summary["ranges"]) == 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["hotels.jsonl"]
+
+def test_parquet_without_pyarrow_raises_a_clean_import_error(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    monkeypatch.setitem(sys.modules, "pyarrow.parquet", None)
+
+    with pytest.raises(ImportError, match=r"requires pyarrow: pip install 'mcp-foundry\[parquet\]'"):
+        arrow_schema_for(INDEX_SCHEMA)
+
+@pytest.mark.asyncio
+async def test_parquet_export_without_pyarrow_writes_nothing(monkeypatch, tmp_path):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    exporter = IndexExporter(FakeScanDao(["a", "b"]), "id", INDEX_SCHEMA)
+
+    with pytest.raises(ImportError, match="requires pyarrow"):
+        await exporter.export(str(tmp_path / "hotels.parquet"), export_format="parquet")
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,93 @@
+import httpx
+import pytest
+from mcp_foundry.mcp_foundry_model import http_client
+from mcp_foundry.mcp_foundry_model.http_client import CachedResponse, ResourceCache
+from mcp_foundry.mcp_foundry_model.labs import LabsProjectRegistry
+
+def _mock_ctx():
+    """Mock context for testing."""
+    class MockContext:
+        def __init__(self):
+            self.session = MockSession()
+    class MockSession:
+        def __init__(self):
+            self._client_params = MockClientParams()
+    class MockClientParams:
+        def __init__(self):
+            self.clientInfo = None
+    return MockContext()
+
+@pytest.fixture
+def labs_api(monkeypatch):
+    """Serves a fake Labs API through the pooled client and records the requests made to it."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/projects"):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"projects": [{"name": "omniparserv2"}, {"name": "magentic-one"}]},
+                                  headers={"ETag": '"v1"'})
+        name = request.url.path.split("/")[-2]
+        return httpx.Response(200, json={"project": f"implementation of {name}"})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(http_client, "get_http_client", lambda: client)
+    return requests
+
+@pytest.mark.asyncio
+async def test_labs_registry_serves_lookups_locally(labs_api):
+    registry = LabsProjectRegistry(ttl_seconds=300)
+    ctx = _mock_ctx()
+
+    assert await registry.get_project(ctx, "omniparserv2") == {"name": "omniparserv2"}
+    assert await registry.get_project(ctx, "unknown") is None
+    await registry._prefetch_task
+
+    requests_after_prefetch = len(labs_api)
+    implementation = await registry.get_implementation(ctx, "magentic-one")
+
+    assert implementation == {"project": "implementation of magentic-one"}
+    assert requests_after_prefetch == 3
+    assert len(labs_api) == requests_after_prefetch
+
+@pytest.mark.asyncio
+async def test_labs_registry_revalidates_with_etag(labs_api):
+    registry = LabsProjectRegistry(ttl_seconds=0)
+    ctx = _mock_ctx()
+
+    first = await registry.get_projects(ctx)
+    await registry._prefetch_task
+    second = await registry.get_projects(ctx)
+
+    assert second is first
+    assert labs_api[-1].headers["If-None-Match"] == '"v1"'
+
+@pytest.mark.asyncio
+async def test_resource_cache_serves_stale_copy_while_revalidating(labs_api):
+    cache = ResourceCache(ttl_seconds=0, max_stale_seconds=3600)
+    url = "https://foundry-labs-mcp-api.azurewebsites.net/api/v1/projects"
+
+    first = await cache.get(url, {})
+    second = await cache.get(url, {})
+    assert second is first
+    assert len(labs_api) == 1
+
+    await cache._revalidations[url]
+    assert len(labs_api) == 2
+    assert labs_api[-1].headers["If-None-Match"] == '"v1"'
+
+@pytest.mark.asyncio
+async def test_resource_cache_survives_upstream_errors(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503)
+
+    cache = ResourceCache(ttl_seconds=0, max_stale_seconds=0)
+    url = "https://foundry-labs-mcp-api.azurewebsites.net/api/v1/resources/resource/gh_guidance.md"
+    cache._entries[url] = CachedResponse(body={"resource": "guidance"}, etag=None, last_modified=None, fetched_at=0)
+    monkeypatch.setattr(http_client, "get_http_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    assert await cache.get(url, {}) == {"resource": "guidance"}
+    with pytest.raises(httpx.HTTPStatusError):
+        await ResourceCache(ttl_seconds=0, max_stale_seconds=0).get(url, {})
@@ -0,0 +1,60 @@
+import time
+
+from azure.core.credentials import AccessToken
+from mcp_foundry.mcp_foundry_model.management import CachedTokenCredential, ManagementClientPool
+
+class FakeCredential:
+    """Hands out numbered tokens expiring after the given lifetime."""
+    def __init__(self, lifetime):
+        self.lifetime = lifetime
+        self.calls = 0
+
+    def get_token(self, *scopes, **kwargs):
+        self.calls += 1
+        return AccessToken(f"token-{self.calls}", int(time.time() + self.lifetime))
+
+class FakeClient:
+    def __init__(self, credential, subscription_id):
+        self.credential = credential
+        self.subscription_id = subscription_id
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+def test_cached_token_credential_reuses_tokens():
+    inner = FakeCredential(lifetime=3600)
+    credential = CachedTokenCredential(inner, refresh_margin_seconds=300)
+
+    assert credential.get_token("https://management.azure.com/.default").token == "token-1"
+    assert credential.get_token("https://management.azure.com/.default").token == "token-1"
+    assert credential.get_token("https://cognitiveservices.azure.com/.default").token == "token-2"
+    assert inner.calls == 2
+
+def test_cached_token_credential_refreshes_before_expiry():
+    inner = FakeCredential(lifetime=120)
+    credential = CachedTokenCredential(inner, refresh_margin_seconds=300)
+
+    first = credential.get_token("https://management.azure.com/.default")
+    # Still valid, so it is served while a new token is fetched in the background
+    assert credential.get_token("https://management.azure.com/.default") is first
+
+    deadline = time.time() + 5
+    while inner.calls < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert credential.get_token("https://management.azure.com/.default").token == "token-2"
+
+def test_management_client_pool_shares_clients_and_credential():
+    credential = CachedTokenCredential(FakeCredential(lifetime=3600))
+    pool = ManagementClientPool(credential)
+
+    client = pool.get(FakeClient, "00000000-0000-0000-0000-000000000001")
+    other = pool.get(FakeClient, "00000000-0000-0000-0000-000000000002")
+
+    assert pool.get(FakeClient, "00000000-0000-0000-0000-000000000001") is client
+    assert other is not client
+    assert other.credential is client.credential is credential
+
+    pool.close()
+    assert client.closed and other.closed
+    assert pool.get(FakeClient, "00000000-0000-0000-0000-000000000001") is not client
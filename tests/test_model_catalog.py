@@ -0,0 +1,213 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from mcp_foundry.mcp_foundry_model import catalog, tools
+from mcp_foundry.mcp_foundry_model.catalog import CatalogStore, ModelCatalog, get_catalog_page, get_catalog_page_for_cursor
+from mcp_foundry.mcp_foundry_model.cursors import CursorStore
+from mcp_foundry.mcp_foundry_model.catalog_index import CatalogIndex
+from mcp_foundry.mcp_foundry_model.models import CatalogSummary, DeploymentOption, ModelsList
+
+def _raw_summary(name, publisher="Microsoft", license_name="MIT", free_playground=False, openai=False,
+             inference_tasks=("chat-completion",)):
+    return {
+        "name": name,
+        "assetId": f"azureml://registries/azureml/models/{name}/versions/1",
+        "publisher": publisher,
+        "license": license_name,
+        "inferenceTasks": list(inference_tasks),
+        "deployment_options": {
+            "openai": openai,
+            "serverless_endpoint": False,
+            "managed_compute": False,
+            "free_playground": free_playground,
+        },
+    }
+
+RAW_SUMMARIES = [
+    _raw_summary("Phi-4", free_playground=True),
+    _raw_summary("gpt-4o", publisher="OpenAI", license_name="custom", free_playground=True, openai=True),
+    _raw_summary("Llama-3.3-70B-Instruct", publisher="Meta", license_name="llama3.3"),
+    _raw_summary("Phi-4-reasoning", free_playground=True),
+    _raw_summary("text-embedding-3-large", publisher="OpenAI", license_name="custom", openai=True,
+             inference_tasks=("embeddings",)),
+]
+
+SUMMARIES = [CatalogSummary.from_summary(summary) for summary in RAW_SUMMARIES]
+
+def test_catalog_store_round_trip(tmp_path):
+    store = CatalogStore(str(tmp_path / "catalog.sqlite3"))
+    assert store.load() == (None, None)
+
+    store.save(SUMMARIES, 1234.5)
+    summaries, fetched_at = store.load()
+
+    assert summaries == SUMMARIES
+    assert fetched_at == 1234.5
+
+def test_catalog_summary_projection():
+    summary = CatalogSummary.from_summary({**RAW_SUMMARIES[1], "azureOffers": ["standard-paygo"], "modelLimits": {}})
+
+    assert summary.to_dict() == {**RAW_SUMMARIES[1], "displayName": None, "version": None, "summary": None}
+    assert summary.to_dict(["name", "deployment_options"]) == {
+        "name": "gpt-4o",
+        "deployment_options": RAW_SUMMARIES[1]["deployment_options"],
+    }
+
+def _names(summaries):
+    return [summary.name for summary in summaries]
+
+def test_catalog_index_filters():
+    index = CatalogIndex(SUMMARIES)
+
+    assert len(index.search()) == len(SUMMARIES)
+    assert _names(index.search(search_for_free_playground=True)) == ["Phi-4", "gpt-4o", "Phi-4-reasoning"]
+    assert _names(index.search(publisher_name="meta")) == ["Llama-3.3-70B-Instruct"]
+    assert _names(index.search(publisher_name=["Meta", "openai"])) == \
+        ["gpt-4o", "Llama-3.3-70B-Instruct", "text-embedding-3-large"]
+    assert _names(index.search(license_name="MIT", search_for_free_playground=True)) == ["Phi-4", "Phi-4-reasoning"]
+    assert _names(index.search(inference_task="embeddings")) == ["text-embedding-3-large"]
+    assert _names(index.search(deployment_option="openai", inference_task="chat-completion")) == ["gpt-4o"]
+    assert index.search(publisher_name="Meta", deployment_option="openai") == []
+
+def test_catalog_index_name_lookups():
+    index = CatalogIndex(SUMMARIES)
+
+    assert index.lookup_name("Phi-4").name == "Phi-4"
+    assert index.lookup_name("GPT-4O").name == "gpt-4o"
+    assert index.lookup_name("unsupported_model") is None
+    assert _names(index.search(model_name_prefix="phi-4")) == ["Phi-4", "Phi-4-reasoning"]
+    assert _names(index.search(model_name=["phi-4", "gpt-4o"])) == ["Phi-4", "gpt-4o"]
+
+@pytest.mark.asyncio
+async def test_model_catalog_serves_fresh_snapshot_without_fetching(tmp_path):
+    store = CatalogStore(str(tmp_path / "catalog.sqlite3"))
+    store.save(SUMMARIES, time.time())
+    catalog = ModelCatalog(store, ttl_seconds=3600)
+
+    catalog_index = await catalog.get_index(ctx=None)
+
+    assert catalog_index.summaries == SUMMARIES
+    assert not catalog.is_stale()
+    assert catalog._refresh_task is None
+
+def test_cursor_store_expiry_and_eviction():
+    cursors = CursorStore(ttl_seconds=60, max_cursors=2)
+    first = cursors.create({"offset": 0})
+    second = cursors.create({"offset": 1})
+
+    assert cursors.get(first) == {"offset": 0}
+
+    cursors.create({"offset": 2})
+    assert cursors.get(second) is None
+    assert cursors.get(first) == {"offset": 0}
+
+    expired = CursorStore(ttl_seconds=-1)
+    assert expired.get(expired.create({"offset": 0})) is None
+
+@pytest.mark.asyncio
+async def test_catalog_pages_walk_the_mirror_without_duplicates():
+    state = {"matches": SUMMARIES, "offset": 0, "page_size": 2, "fields": ["name"]}
+
+    first_page = await get_catalog_page(None, state)
+    second_page = await get_catalog_page_for_cursor(None, first_page.next_cursor)
+    second_page_again = await get_catalog_page_for_cursor(None, first_page.next_cursor)
+    last_page = await get_catalog_page_for_cursor(None, second_page.next_cursor)
+
+    assert first_page.summaries == [{"name": "Phi-4"}, {"name": "gpt-4o"}]
+    assert second_page.summaries == [{"name": "Llama-3.3-70B-Instruct"}, {"name": "Phi-4-reasoning"}]
+    assert second_page_again is second_page
+    assert last_page.summaries == [{"name": "text-embedding-3-large"}]
+    assert last_page.next_cursor is None
+    assert await get_catalog_page_for_cursor(None, "unknown") is None
+
+@pytest.mark.asyncio
+async def test_live_catalog_pages_apply_local_filters(monkeypatch):
+    async def fake_get_models_list(ctx, max_pages, continuation_token, **filters):
+        return ModelsList(total_models_count=len(RAW_SUMMARIES), fetched_models_count=len(RAW_SUMMARIES),
+                          summaries=RAW_SUMMARIES, continuation_token="next")
+
+    monkeypatch.setattr(catalog, "get_models_list", fake_get_models_list)
+    state = {
+        "filters": {"publisher_name": "OpenAI"},
+        "local_filters": {"inference_task": "embeddings", "deployment_option": "openai", "model_name_prefix": "text-"},
+        "fields": ["name"],
+    }
+
+    page = await get_catalog_page(None, state)
+
+    assert page.summaries == [{"name": "text-embedding-3-large"}]
+    assert page.fetched_models_count == 1
+    assert page.next_cursor is not None
+
+@pytest.mark.asyncio
+async def test_failed_live_catalog_page_can_be_retried(monkeypatch):
+    responses = [None, ModelsList(total_models_count=1, fetched_models_count=1, summaries=RAW_SUMMARIES[:1])]
+
+    async def fake_get_models_list(ctx, max_pages, continuation_token, **filters):
+        # A failed request hands back the token it was given
+        return responses.pop(0) or ModelsList(total_models_count=0, fetched_models_count=0, summaries=[],
+                                              continuation_token=continuation_token)
+
+    monkeypatch.setattr(catalog, "get_models_list", fake_get_models_list)
+    cursor = catalog.catalog_cursors.create({"filters": {}, "continuation_token": "page-2", "fields": ["name"]})
+
+    with pytest.raises(RuntimeError):
+        await get_catalog_page_for_cursor(None, cursor)
+    page = await get_catalog_page_for_cursor(None, cursor)
+
+    assert page.summaries == [{"name": "Phi-4"}]
+    assert page.next_cursor is None
+
+@pytest.fixture
+def model_details_fakes(monkeypatch, tmp_path):
+    """A cold mirror whose full catalog walk outlasts the lookup timeout, and fast per-model fetches."""
+    async def slow_catalog_walk(ctx, max_pages):
+        await asyncio.sleep(5)
+
+    async def no_labs_project(ctx, model_name):
+        return None
+
+    async def fake_registry_details(asset_id, ctx):
+        return {"assetId": asset_id, "kvTags": {"freePlayground": "true"}}
+
+    async def fake_github_sample(publisher, model_name, ctx):
+        return f"{publisher}/{model_name}"
+
+    mirror = ModelCatalog(CatalogStore(str(tmp_path / "catalog.sqlite3")), ttl_seconds=3600)
+    monkeypatch.setattr(catalog, "get_models_list", slow_catalog_walk)
+    monkeypatch.setattr(tools, "get_model_catalog", lambda: mirror)
+    monkeypatch.setattr(tools, "get_labs_registry", lambda: SimpleNamespace(get_project=no_labs_project))
+    monkeypatch.setattr(tools, "get_model_registry_details", fake_registry_details)
+    monkeypatch.setattr(tools, "get_code_sample_for_github_model", fake_github_sample)
+    monkeypatch.setattr(tools, "FETCH_TIMEOUT_SECONDS", 0.5)
+    yield mirror
+    mirror._refresh_task.cancel()
+
+@pytest.mark.asyncio
+async def test_model_details_do_not_wait_for_a_cold_mirror(monkeypatch, model_details_fakes):
+    async def filtered_models_list(ctx, model_name):
+        summaries = [summary for summary in RAW_SUMMARIES if summary["name"] == model_name]
+        return ModelsList(total_models_count=len(summaries), fetched_models_count=len(summaries), summaries=summaries)
+
+    monkeypatch.setattr(tools, "get_models_list", filtered_models_list)
+
+    found = await tools.get_model_details_and_code_samples("Phi-4", ctx=None)
+    missing = await tools.get_model_details_and_code_samples("Phi-5", ctx=None)
+
+    assert found.type == DeploymentOption.FREE_PLAYGROUND
+    assert found.details["assetId"] == RAW_SUMMARIES[0]["assetId"]
+    assert missing == "Model 'Phi-5' not found in the catalog."
+    assert not model_details_fakes._refresh_task.done()
+
+@pytest.mark.asyncio
+async def test_failed_model_lookups_are_not_reported_as_missing(monkeypatch, model_details_fakes):
+    async def failed_models_list(ctx, model_name):
+        return None
+
+    monkeypatch.setattr(tools, "get_models_list", failed_models_list)
+
+    result = await tools.get_model_details_and_code_samples("Phi-4", ctx=None)
+
+    assert result.startswith("Could not look up model 'Phi-4' in the catalog")
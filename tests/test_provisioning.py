@@ -0,0 +1,50 @@
+from azure.core.exceptions import ResourceNotFoundError
+from azure.mgmt.cognitiveservices.models import Account, AccountProperties, Identity, Sku
+from mcp_foundry.mcp_foundry_model.provisioning import _ensure, desired_account_state, diff_state
+
+def _account(**properties):
+    return Account(
+        location="eastus",
+        kind="AIServices",
+        sku=Sku(name="S0"),
+        identity=Identity(type="SystemAssigned"),
+        properties=AccountProperties(
+            custom_sub_domain_name="my-ai-services",
+            public_network_access="Enabled",
+            allow_project_management=True,
+            disable_local_auth=False,
+            **properties,
+        ),
+    )
+
+def test_diff_state_ignores_server_managed_fields():
+    current = {**_account().serialize(keep_readonly=True), "id": "/subscriptions/...", "etag": '"1"'}
+
+    assert diff_state(current, desired_account_state("my-ai-services", "East US")) == []
+    assert diff_state(current, desired_account_state("my-ai-services", "westus")) == ["location"]
+
+    current["properties"]["allowProjectManagement"] = False
+    assert diff_state(current, desired_account_state("my-ai-services", "eastus")) == ["properties.allowProjectManagement"]
+
+def test_ensure_skips_deployment_when_resource_matches():
+    deployments = []
+    account, deployed = _ensure("account", _account, desired_account_state("my-ai-services", "eastus"),
+                                lambda: deployments.append(1))
+
+    assert not deployed
+    assert deployments == []
+    assert account.properties.custom_sub_domain_name == "my-ai-services"
+
+def test_ensure_deploys_missing_resource():
+    deployments = []
+
+    def get_current():
+        if not deployments:
+            raise ResourceNotFoundError("not found")
+        return _account()
+
+    _, deployed = _ensure("account", get_current, desired_account_state("my-ai-services", "eastus"),
+                          lambda: deployments.append(1))
+
+    assert deployed
+    assert deployments == [1]
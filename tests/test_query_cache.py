@@ -0,0 +1,131 @@
+from types import SimpleNamespace
+
+import pytest
+from mcp_foundry.mcp_foundry_knowledge import tools
+from mcp_foundry.mcp_foundry_knowledge.data_access_objects import AsyncSearchClientDao, SearchDocument, SearchIndexSchema
+from mcp_foundry.mcp_foundry_knowledge.data_access_objects.models import SearchFieldSchema
+from mcp_foundry.mcp_foundry_knowledge.query_cache import QueryResultCache, normalize_query
+
+INDEX_SCHEMA = {"name": "hotels", "fields": [{"name": "id", "type": "Edm.String", "key": True, "sortable": True}]}
+
+@pytest.fixture(autouse=True)
+def search_environment(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_ENDPOINT", "https://example.search.windows.net")
+
+class FakeSearchClient:
+    """Two server pages of one document each, and successful writes."""
+
+    def __init__(self):
+        self.searches = 0
+
+    async def search(self, **kwargs):
+        self.searches += 1
+        return SimpleNamespace(by_page=lambda continuation_token=None: FakePage(continuation_token))
+
+    async def upload_documents(self, documents):
+        return [_indexing_result(document["id"]) for document in documents]
+
+    async def delete_documents(self, documents):
+        return [_indexing_result(document["id"]) for document in documents]
+
+class FakePage:
+    def __init__(self, continuation_token):
+        self.document = {"id": "2" if continuation_token else "1"}
+        self.continuation_token = None if continuation_token else "page-2"
+
+    async def __anext__(self):
+        return self._items()
+
+    async def _items(self):
+        yield self.document
+
+class FakeIndexDao:
+    async def create_index(self, index_definition):
+        return INDEX_SCHEMA
+
+    async def modify_index(self, index_name, index_definition):
+        return INDEX_SCHEMA
+
+    async def delete_index(self, index_name):
+        pass
+
+def _indexing_result(key):
+    return SimpleNamespace(serialize=lambda keep_readonly: {"key": key, "status": True, "statusCode": 200})
+
+@pytest.fixture
+def search_client():
+    return FakeSearchClient()
+
+@pytest.fixture
+def query_cache(monkeypatch, search_client):
+    cache = QueryResultCache(ttl_seconds=60)
+    search_clients = SimpleNamespace(
+        client_dao=lambda index_name: AsyncSearchClientDao(index_name, client=search_client),
+        index_dao=lambda: FakeIndexDao(),
+    )
+    schema_cache = SimpleNamespace(get_schema=lambda index_name: _return(INDEX_SCHEMA), put=lambda schema: None,
+                                   remove=lambda index_name: None)
+    monkeypatch.setattr(tools, "get_query_result_cache", lambda: cache)
+    monkeypatch.setattr(tools, "get_search_client_registry", lambda: search_clients)
+    monkeypatch.setattr(tools, "get_schema_cache", lambda: schema_cache)
+    return cache
+
+async def _return(value):
+    return value
+
+def test_equivalent_queries_share_a_key():
+    def key(search_text, **query):
+        return QueryResultCache.make_key("hotels", **normalize_query(search_text, **query))
+
+    assert key("*", select=["name", "id"]) == key(None, select=["id", "name"]) == key("  ", select=["id", "name"])
+    assert key(" luxury ") == key("luxury")
+    assert key("luxury") != key("*")
+    assert key(None, query_filter="rating gt 3") != key(None)
+
+def test_results_of_queries_overtaken_by_a_write_are_not_cached():
+    cache = QueryResultCache(ttl_seconds=60)
+    key = cache.make_key("hotels", **normalize_query("luxury"))
+
+    generation = cache.generation("hotels")
+    cache.invalidate("hotels")
+    cache.put(key, {"results": []}, generation)
+    assert cache.get(key) is None
+
+    cache.put(key, {"results": []}, cache.generation("hotels"))
+    assert cache.get(key) == {"results": []}
+
+@pytest.mark.asyncio
+async def test_query_index_serves_repeats_from_the_cache_and_accepts_equivalent_tokens(query_cache, search_client):
+    first = await tools.query_index("hotels", "*", select=["name", "id"])
+    again = await tools.query_index("hotels", None, select=["id", "name"])
+    # The token of the "*" query continues the equivalent query without search text
+    second = await tools.query_index("hotels", None, select=["id", "name"],
+                                     continuation_token=first["continuation_token"])
+
+    assert again is first
+    assert [document["id"] for document in first["results"] + second["results"]] == ["1", "2"]
+    assert search_client.searches == 2
+
+WRITES = {
+    "add_document": lambda: tools.add_document("hotels", SearchDocument(id="1")),
+    "add_documents_in_bulk": lambda: tools.add_documents_in_bulk("hotels", documents=[{"id": "1"}]),
+    "delete_document": lambda: tools.delete_document("hotels", "id", "1"),
+    "delete_documents_in_bulk": lambda: tools.delete_documents_in_bulk("hotels", document_keys=["1"]),
+    "create_index": lambda: tools.create_index(_index_definition()),
+    "modify_index": lambda: tools.modify_index("hotels", _index_definition()),
+    "delete_index": lambda: tools.delete_index("hotels"),
+}
+
+def _index_definition():
+    return SearchIndexSchema(name="hotels", fields=[SearchFieldSchema(name="id", type="Edm.String", key=True)])
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write", WRITES)
+async def test_writes_invalidate_the_cached_results_of_their_index(query_cache, write):
+    await tools.query_index("hotels", "*")
+    await tools.query_index("motels", "*")
+
+    await WRITES[write]()
+
+    assert query_cache.get(query_cache.make_key("hotels", **normalize_query("*"))) is None
+    assert query_cache.get(query_cache.make_key("motels", **normalize_query("*"))) is not None
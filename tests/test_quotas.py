@@ -0,0 +1,48 @@
+import pytest
+from mcp_foundry.mcp_foundry_model.quotas import QuotaCache, build_quota_matrix, parse_usage_name
+
+SUBSCRIPTION_ID = "00000000-0000-0000-0000-000000000000"
+
+def _usage(name, current_value, limit):
+    return {"name": {"value": name}, "current_value": current_value, "limit": limit}
+
+USAGES = {
+    "eastus": [
+        _usage("OpenAI.GlobalStandard.gpt-4o", 450, 500),
+        _usage("OpenAI.Standard.gpt-4o", 0, 100),
+        _usage("AccountCount", 3, 30),
+    ],
+    "swedencentral": [_usage("OpenAI.GlobalStandard.gpt-4o", 0, 1000)],
+}
+
+def test_parse_usage_name():
+    assert parse_usage_name(_usage("OpenAI.GlobalStandard.gpt-4o-mini", 0, 0)) == ("GlobalStandard", "gpt-4o-mini")
+    assert parse_usage_name(_usage("OpenAI.Standard.gpt-35-turbo.0125", 0, 0)) == ("Standard", "gpt-35-turbo.0125")
+    assert parse_usage_name(_usage("AccountCount", 0, 0)) is None
+
+def test_build_quota_matrix():
+    matrix = build_quota_matrix(USAGES, sku_name="globalstandard", min_available=100)
+
+    assert matrix == {
+        "gpt-4o": {"GlobalStandard": {"swedencentral": {"current_value": 0, "limit": 1000, "available": 1000}}},
+    }
+    assert set(build_quota_matrix(USAGES)["gpt-4o"]) == {"GlobalStandard", "Standard"}
+
+@pytest.mark.asyncio
+async def test_quota_cache_scans_regions_once():
+    calls = []
+    cache = QuotaCache(ttl_seconds=60, concurrency=2)
+
+    def list_usages(subscription_id, location):
+        calls.append(location)
+        if location == "westus":
+            raise RuntimeError("throttled")
+        return USAGES[location]
+
+    cache._list_usages = list_usages
+    usages, errors = await cache.scan(SUBSCRIPTION_ID, ["eastus", "swedencentral", "westus", "eastus"])
+    await cache.scan(SUBSCRIPTION_ID, ["eastus", "swedencentral"])
+
+    assert usages == USAGES
+    assert errors == {"westus": "throttled"}
+    assert sorted(calls) == ["eastus", "swedencentral", "westus"]
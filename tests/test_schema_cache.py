@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+from mcp_foundry.mcp_foundry_knowledge.schema_cache import SchemaCache
+
+class FakeIndexDao:
+    """Indexes by name, with their ETag; fetches can be held back with `gate`."""
+
+    def __init__(self, etags):
+        self.etags = dict(etags)
+        self.fetched = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def retrieve_index_etags(self):
+        return dict(self.etags)
+
+    async def retrieve_index_schema(self, index_name):
+        self.fetched.append(index_name)
+        etag = self.etags.get(index_name)
+        await self.gate.wait()
+        if etag is None:
+            raise ResourceNotFoundError(f"No index {index_name}")
+        return {"name": index_name, "@odata.etag": etag}
+
+def _schema_cache(dao, ttl_seconds=60):
+    return SchemaCache(ttl_seconds=ttl_seconds, concurrency=2, index_dao=lambda: dao)
+
+@pytest.mark.asyncio
+async def test_listing_refetches_only_new_and_changed_indexes():
+    dao = FakeIndexDao({"hotels": "1", "motels": "1"})
+    schema_cache = _schema_cache(dao, ttl_seconds=0)
+
+    await schema_cache.list_schemas()
+    dao.etags.update({"motels": "2", "inns": "1"})
+    dao.fetched.clear()
+    await schema_cache._refresh(None)
+
+    assert sorted(dao.fetched) == ["inns", "motels"]
+    assert [(schema["name"], schema["@odata.etag"]) for schema in await schema_cache.list_schemas()] == \
+        [("hotels", "1"), ("inns", "1"), ("motels", "2")]
+
+@pytest.mark.asyncio
+async def test_listing_drops_deleted_indexes():
+    dao = FakeIndexDao({"hotels": "1", "motels": "1"})
+    schema_cache = _schema_cache(dao, ttl_seconds=0)
+
+    await schema_cache.list_schemas()
+    del dao.etags["motels"]
+    await schema_cache._refresh(None)
+
+    assert [schema["name"] for schema in await schema_cache.list_schemas()] == ["hotels"]
+    with pytest.raises(ResourceNotFoundError):
+        await schema_cache.get_schema("motels")
+
+@pytest.mark.asyncio
+async def test_writes_win_over_a_refresh_in_flight():
+    dao = FakeIndexDao({"hotels": "1", "motels": "1"})
+    schema_cache = _schema_cache(dao)
+    await schema_cache.list_schemas()
+
+    dao.gate.clear()
+    dao.fetched.clear()
+    refreshes = [asyncio.create_task(schema_cache._refresh(name)) for name in ("hotels", "motels")]
+    while len(dao.fetched) < 2:
+        await asyncio.sleep(0)
+    schema_cache.put({"name": "hotels", "@odata.etag": "2"})
+    schema_cache.remove("motels")
+    dao.gate.set()
+    await asyncio.gather(*refreshes)
+
+    assert await schema_cache.get_schema("hotels") == {"name": "hotels", "@odata.etag": "2"}
+    assert [schema["name"] for schema in await schema_cache.list_schemas()] == ["hotels"]
+
+@pytest.mark.asyncio
+async def test_stale_schemas_are_returned_while_they_are_refreshed():
+    dao = FakeIndexDao({"hotels": "1"})
+    schema_cache = _schema_cache(dao, ttl_seconds=0)
+    await schema_cache.get_schema("hotels")
+
+    dao.etags["hotels"] = "2"
+    dao.gate.clear()
+    stale = await schema_cache.get_schema("hotels")
+
+    assert stale == {"name": "hotels", "@odata.etag": "1"}
+    dao.gate.set()
+    await schema_cache._pending["hotels"]
+    assert schema_cache._schemas["hotels"][1] == {"name": "hotels", "@odata.etag": "2"}
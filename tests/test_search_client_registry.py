@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+from azure.core.pipeline.transport import AioHttpTransport
+from mcp_foundry import mcp_server
+from mcp_foundry.mcp_foundry_knowledge import tools
+from mcp_foundry.mcp_foundry_knowledge.data_access_objects import registry
+from mcp_foundry.mcp_foundry_knowledge.data_access_objects.registry import SearchClientRegistry
+from mcp_foundry.mcp_server import run_shutdown_hooks
+
+@pytest.fixture(autouse=True)
+def search_environment(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_ENDPOINT", "https://example.search.windows.net")
+    monkeypatch.setenv("SEARCH_AUTHENTICATION_METHOD", "api-search-key")
+    monkeypatch.setenv("AZURE_AI_SEARCH_API_KEY", "key")
+
+def _record_close(dao, name, closed):
+    original_close = dao.client.close
+
+    async def close():
+        closed.append(name)
+        await original_close()
+
+    dao.client.close = close
+
+@pytest.mark.asyncio
+async def test_registry_evicts_and_closes_least_recently_used_clients():
+    search_clients = SearchClientRegistry(max_search_clients=2)
+    closed = []
+
+    first = search_clients.client_dao("first")
+    second = search_clients.client_dao("second")
+    _record_close(first, "first", closed)
+    _record_close(second, "second", closed)
+
+    assert search_clients.client_dao("first") is first
+    search_clients.client_dao("third")
+    await asyncio.gather(*search_clients._closing)
+
+    # "first" was used again, so "second" was the least recently used when "third" was opened
+    assert closed == ["second"]
+    assert list(search_clients._client_daos) == ["first", "third"]
+
+    await search_clients.close()
+    assert closed == ["second", "first"]
+
+@pytest.mark.asyncio
+async def test_registry_clients_share_one_session_they_do_not_own(monkeypatch):
+    transports = []
+
+    def transport(**kwargs):
+        transports.append(kwargs)
+        return AioHttpTransport(**kwargs)
+
+    monkeypatch.setattr(registry, "AioHttpTransport", transport)
+    search_clients = SearchClientRegistry()
+
+    search_clients.index_dao()
+    search_clients.indexer_dao()
+    first = search_clients.client_dao("first")
+    search_clients.client_dao("second")
+
+    assert len(transports) == 4
+    assert len({id(kwargs["session"]) for kwargs in transports}) == 1
+    assert all(kwargs["session_owner"] is False for kwargs in transports)
+
+    session = transports[0]["session"]
+    await first.client.close()
+    assert not session.closed
+
+    await search_clients.close()
+    assert session.closed
+
+@pytest.mark.asyncio
+async def test_shutdown_hook_closes_every_search_client(monkeypatch):
+    search_clients = SearchClientRegistry()
+    monkeypatch.setattr(registry, "_search_client_registry", search_clients)
+    closed = []
+
+    _record_close(search_clients.index_dao(), "index", closed)
+    _record_close(search_clients.indexer_dao(), "indexer", closed)
+    _record_close(search_clients.client_dao("documents"), "documents", closed)
+    session = search_clients._session
+
+    assert tools.close_search_clients in mcp_server._shutdown_hooks
+    await run_shutdown_hooks()
+
+    assert sorted(closed) == ["documents", "index", "indexer"]
+    assert session.closed
+    assert search_clients._session is None and search_clients._client_daos == {}
@@ -0,0 +1,103 @@
+from types import SimpleNamespace
+
+import pytest
+from mcp_foundry.mcp_foundry_knowledge.data_access_objects import AsyncSearchClientDao
+from mcp_foundry.mcp_foundry_knowledge.data_access_objects.aio import _decode_cursor, _encode_cursor, document_size
+
+@pytest.fixture(autouse=True)
+def search_environment(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_ENDPOINT", "https://example.search.windows.net")
+
+class FakePages:
+    """Server pages of a search, addressed by "page-N" continuation tokens like `AsyncSearchPageIterator`."""
+
+    def __init__(self, server_pages, start):
+        self.server_pages = server_pages
+        self.start = start
+        self.continuation_token = None
+
+    async def __anext__(self):
+        if self.start >= len(self.server_pages):
+            raise StopAsyncIteration
+        if self.start + 1 < len(self.server_pages):
+            self.continuation_token = f"page-{self.start + 1}"
+        return self._items(self.server_pages[self.start])
+
+    @staticmethod
+    async def _items(items):
+        for item in items:
+            yield item
+
+    async def get_count(self):
+        return sum(len(items) for items in self.server_pages)
+
+class FakeSearchClient:
+    def __init__(self, server_pages):
+        self.server_pages = server_pages
+        self.searches = []
+
+    async def search(self, **kwargs):
+        self.searches.append(kwargs)
+        return SimpleNamespace(by_page=lambda continuation_token=None: FakePages(
+            self.server_pages, int(continuation_token.split("-")[1]) if continuation_token else 0
+        ))
+
+SERVER_PAGES = [
+    [{"id": str(number), "text": "x" * 100} for number in range(4)],
+    [{"id": str(number), "text": "x" * 100} for number in range(4, 6)],
+]
+DOCUMENT_SIZE = document_size(SERVER_PAGES[0][0])
+
+def _ids(page):
+    return [document["id"] for document in page["results"]]
+
+def test_continuation_tokens_round_trip():
+    token = _encode_cursor("fingerprint", "page-1", 3)
+
+    assert _decode_cursor(token, "fingerprint") == ("page-1", 3)
+    with pytest.raises(ValueError, match="Invalid continuation token"):
+        _decode_cursor("not-a-token", "fingerprint")
+
+@pytest.mark.asyncio
+async def test_pages_resume_inside_a_server_page_cut_by_max_bytes():
+    dao = AsyncSearchClientDao("hotels", client=FakeSearchClient(SERVER_PAGES))
+    pages, token = [], None
+
+    while True:
+        page = await dao.query_index_page("*", continuation_token=token, max_bytes=2 * DOCUMENT_SIZE)
+        pages.append(_ids(page))
+        token = page["continuation_token"]
+        if token is None:
+            break
+
+    assert pages == [["0", "1"], ["2", "3"], ["4", "5"]]
+
+@pytest.mark.asyncio
+async def test_pages_always_return_at_least_one_result():
+    dao = AsyncSearchClientDao("hotels", client=FakeSearchClient(SERVER_PAGES))
+
+    first = await dao.query_index_page("*", max_bytes=1)
+    second = await dao.query_index_page("*", continuation_token=first["continuation_token"], max_bytes=1)
+
+    assert (_ids(first), _ids(second)) == (["0"], ["1"])
+
+@pytest.mark.asyncio
+async def test_continuation_tokens_are_rejected_for_another_query():
+    dao = AsyncSearchClientDao("hotels", client=FakeSearchClient(SERVER_PAGES))
+
+    first = await dao.query_index_page("*", max_bytes=DOCUMENT_SIZE)
+
+    with pytest.raises(ValueError, match="belongs to a different query"):
+        await dao.query_index_page("*", query_filter="rating gt 3", continuation_token=first["continuation_token"])
+
+@pytest.mark.asyncio
+async def test_total_count_is_only_returned_with_the_first_page():
+    client = FakeSearchClient(SERVER_PAGES)
+    dao = AsyncSearchClientDao("hotels", client=client)
+
+    first = await dao.query_index_page("*", include_total_count=True)
+    second = await dao.query_index_page("*", include_total_count=True, continuation_token=first["continuation_token"])
+
+    assert first["total_count"] == 6
+    assert "total_count" not in second
+    assert [search["include_total_count"] for search in client.searches] == [True, False]
@@ -19,12 +19,14 @@ def _mock_ctx():
             self.version = "1.0.0"
     return MockContext()
 
-def test_get_models_list_no_filters():
+@pytest.mark.asyncio
+async def test_get_models_list_no_filters():
     mock_ctx = _mock_ctx()
-    models = get_models_list(mock_ctx)
+    models = await get_models_list(mock_ctx)
     assert isinstance(models, ModelsList)
 
-def test_get_models_list_free_playground():
+@pytest.mark.asyncio
+async def test_get_models_list_free_playground():
     mock_ctx = _mock_ctx()
-    models = get_models_list(mock_ctx, search_for_free_playground=True)
+    models = await get_models_list(mock_ctx, search_for_free_playground=True)
     assert isinstance(models, ModelsList)
\ No newline at end of file